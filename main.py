@@ -5,25 +5,59 @@ Main entry point for the application
 """
 
 import sys
+import threading
 from PyQt6.QtWidgets import QApplication
 from src.controllers.app_controller import AppController
 from src.views.main_window import MainWindow
+from src.utils.database import Database
+from src.utils.progress_store import ProgressStore
+from src.utils.leaderboard import LeagueRanking
+from src.utils.event_log import EventLog
+from src.utils.lesson_pages import cleanup_caches
+from src.utils.prefetch import TopicPrefetcher
 from subjects_data import SUBJECTS
 
 def main():
     # Initialize PyQt6 application (required for web content)
     qt_app = QApplication(sys.argv)
     
-    # Create controller
-    controller = AppController()
+    # Drop stale cached pages and formula renders
+    cleanup_caches()
+    
+    # Create controller with persistent progress
+    database = Database()
+    progress_store = ProgressStore(database)
+    controller = AppController(
+        progress_store=progress_store,
+        ranking=LeagueRanking(database, writer=progress_store.writer),
+        events=EventLog(database, writer=progress_store.writer)
+    )
     
     # Load subject data
     controller.load_subjects(SUBJECTS)
     
+    # Make lesson bodies searchable without waiting for them to be opened
+    threading.Thread(target=controller.index_lessons, name="search-index", daemon=True).start()
+    
+    # Progress, league standing and events belong to the local profile;
+    # set before the window is built so it shows the saved progress
+    controller.set_user(database.local_profile())
+    
     # Create and show main window
     window = MainWindow(controller)
+    
+    # Warm the caches for likely next topics; registered after the window
+    # so the selected topic is handled first
+    prefetcher = TopicPrefetcher(controller)
+    controller.add_observer(prefetcher)
+    
     window.mainloop()
     
+    # Flush queued progress writes before exiting
+    prefetcher.close()
+    controller.shutdown()
+    database.close()
+    
     # Clean up PyQt6 application
     qt_app.quit()
 
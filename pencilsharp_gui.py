@@ -3,6 +3,7 @@ from src.widgets import SubjectCard, TouchScrollableFrame, NavigationBar
 from src.views.login_view import LoginView
 from src.views.signup_view import SignupView
 from src.views.main_view import MainView
+from src.utils.async_db import AsyncDatabase
 
 class App(ctk.CTk):
     def __init__(self):
@@ -23,6 +24,9 @@ class App(ctk.CTk):
         # Store current username
         self.current_user = None
         
+        # Shared off-thread database access for the auth views
+        self.db = AsyncDatabase()
+        
         # Show login view
         self.show_login()
     
@@ -38,7 +42,8 @@ class App(ctk.CTk):
         login_view = LoginView(
             self.container,
             on_login=self.handle_login,
-            on_signup=self.show_signup
+            on_signup=self.show_signup,
+            db=self.db
         )
         login_view.pack(fill="both", expand=True)
     
@@ -51,7 +56,8 @@ class App(ctk.CTk):
         signup_view = SignupView(
             self.container,
             on_signup=self.handle_signup,
-            on_login=self.show_login
+            on_login=self.show_login,
+            db=self.db
         )
         signup_view.pack(fill="both", expand=True)
     
@@ -80,4 +86,5 @@ class App(ctk.CTk):
 
 if __name__ == "__main__":
     app = App()
-    app.mainloop() 
\ No newline at end of file
+    app.mainloop()
+    app.db.shutdown() 
\ No newline at end of file
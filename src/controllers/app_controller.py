@@ -1,11 +1,30 @@
-from typing import Optional, Dict
+from typing import Optional, Dict, List, Set, Tuple
 from src.models.subject import Subject, Unit, Topic
 from src.models.user import UserProgress
 from src.utils.observer import Observable, Observer
+from src.utils.progress_store import ProgressStore
+from src.utils.leaderboard import LeagueRanking, DEFAULT_LEAGUE
+from src.utils import event_log
+from src.utils.event_log import EventLog
+from src.utils.lesson_store import LESSON_TABS, LessonStore, lesson_store
+from src.utils.search_index import SearchIndex
 
 class AppController(Observable):
-    def __init__(self):
+    def __init__(
+        self,
+        progress_store: Optional[ProgressStore] = None,
+        ranking: Optional[LeagueRanking] = None,
+        events: Optional[EventLog] = None,
+        lessons: Optional[LessonStore] = None
+    ):
         super().__init__()
+        self.progress_store = progress_store
+        self.ranking = ranking
+        self.events = events
+        self.lessons = lessons or lesson_store
+        self.search_index = SearchIndex()
+        self._indexed_lessons: Set[Tuple[str, str, str]] = set()
+        self.user_id: Optional[int] = None
         self.user_progress = UserProgress()
         self.subjects: Dict[str, Subject] = {}
         self.current_subject: Optional[str] = None
@@ -20,13 +39,19 @@ class AppController(Observable):
                 topics = [
                     Topic(
                         name=topic,
-                        content={},  # Content will be loaded on demand
+                        content={},  # Loaded on demand through get_topic_content()
                         is_locked=i > 0 or j > 0  # Lock all except first topic of first unit
                     )
                     for j, topic in enumerate(unit_data["topics"])
                 ]
                 units.append(Unit(name=unit_data["name"], topics=topics))
+                self._index_unit(subject_name, unit_data["name"], topics)
             
+            self.search_index.add(
+                ("subject", subject_name),
+                {"title": subject_name},
+                {"kind": "subject", "subject": subject_name}
+            )
             self.subjects[subject_name] = Subject(
                 name=subject_name,
                 icon=data["icon"],
@@ -34,6 +59,71 @@ class AppController(Observable):
                 units=units
             )
 
+    def _index_unit(self, subject_name: str, unit_name: str, topics):
+        """Add a unit and its topic names to the search index"""
+        self.search_index.add(
+            ("unit", subject_name, unit_name),
+            {"title": unit_name, "context": subject_name},
+            {"kind": "unit", "subject": subject_name, "unit": unit_name}
+        )
+        for topic in topics:
+            self._index_topic(subject_name, unit_name, topic.name)
+
+    def _index_topic(self, subject_name: str, unit_name: str, topic_name: str, lesson: Optional[Dict] = None):
+        """Index a topic, with its lesson bodies once they have been loaded"""
+        fields = {"title": topic_name, "context": f"{unit_name} {subject_name}"}
+        if lesson:
+            fields["body"] = " ".join(lesson.get(tab, "") for tab in ("title",) + LESSON_TABS)
+        self.search_index.add(
+            ("topic", subject_name, unit_name, topic_name),
+            fields,
+            {"kind": "topic", "subject": subject_name, "unit": unit_name, "topic": topic_name}
+        )
+
+    def index_lesson(self, subject_name: str, unit_name: str, topic_name: str, lesson: Dict):
+        """Add a loaded lesson's body to the search index
+
+        Called as lessons are loaded, so a lesson opened before
+        index_lessons() reaches it is searchable at once. Each lesson is
+        indexed once; placeholder lessons from the store's default are
+        skipped.
+        """
+        key = (subject_name, unit_name, topic_name)
+        if key not in self._indexed_lessons and self.lessons.has_lesson(*key):
+            self._indexed_lessons.add(key)
+            self._index_topic(subject_name, unit_name, topic_name, lesson)
+
+    def index_lessons(self):
+        """Index every topic's own lesson; slow, so run it off the UI thread
+
+        Lessons are read past the store's LRU, so the pass doesn't evict
+        the ones in use.
+        """
+        for subject in list(self.subjects.values()):
+            for unit in subject.units:
+                for topic in unit.topics:
+                    key = (subject.name, unit.name, topic.name)
+                    if key in self._indexed_lessons or not self.lessons.has_lesson(*key):
+                        continue
+                    self.index_lesson(*key, self.lessons.get(*key, remember=False))
+
+    def search(self, query: str, limit: int = 10) -> List[Dict]:
+        """Subjects, units and topics matching a query, best first"""
+        return self.search_index.search(query, limit)
+
+    def set_user(self, user_id: int):
+        """Switch to a logged-in user and load their saved progress"""
+        self.user_id = user_id
+        if self.progress_store:
+            self.user_progress = self.progress_store.load(user_id)
+        self._record_event(event_log.LOGIN)
+        self.notify_observers("progress_updated", self.user_progress)
+
+    def shutdown(self):
+        """Flush pending progress writes before the app exits"""
+        if self.progress_store:
+            self.progress_store.close()
+
     def select_subject(self, subject_name: str):
         """Select a subject to study"""
         if subject_name in self.subjects:
@@ -81,9 +171,52 @@ class AppController(Observable):
         self.subjects[self.current_subject].update_progress()
 
         # Update user progress
+        xp_before = self.user_progress.xp
         self.user_progress.complete_lesson(self.current_subject)
+        xp_earned = self.user_progress.xp - xp_before
+        if self.ranking and self.user_id is not None:
+            self.ranking.add_xp(self.user_id, xp_earned)
+        self._record_event(
+            event_log.LESSON_COMPLETED,
+            subject=self.current_subject,
+            topic=self.current_topic,
+            value=xp_earned
+        )
+        if self.progress_store and self.user_id is not None:
+            # Queued only; the write-behind flusher does the disk I/O
+            self.progress_store.save(self.user_id, self.user_progress)
         self.notify_observers("progress_updated", self.user_progress)
 
+    def record_quiz_answer(self, correct: bool):
+        """Log an answer to a quiz question in the current topic"""
+        self._record_event(
+            event_log.QUIZ_ANSWERED,
+            subject=self.current_subject,
+            topic=self.current_topic,
+            value=int(correct)
+        )
+
+    def _record_event(self, kind: int, **details):
+        """Append to the event log when a user is logged in"""
+        if self.events and self.user_id is not None:
+            self.events.record(self.user_id, kind, **details)
+
+    def get_league_data(self) -> Dict:
+        """League standing for the sidebar"""
+        if self.ranking and self.user_id is not None:
+            return self.ranking.get_standing(self.user_id)
+        # Nobody to rank without a user
+        return {"league": DEFAULT_LEAGUE, "rank": None, "xp": self.user_progress.xp}
+
+    def get_topic_content(self) -> Dict:
+        """Lesson content for the current topic, read from the lesson store"""
+        unit = self.get_current_unit()
+        if not (unit and self.current_topic):
+            return {}
+        lesson = self.lessons.get(self.current_subject, unit.name, self.current_topic)
+        self.index_lesson(self.current_subject, unit.name, self.current_topic, lesson)
+        return lesson
+
     def get_current_subject(self) -> Optional[Subject]:
         """Get the currently selected subject"""
         return self.subjects.get(self.current_subject) if self.current_subject else None
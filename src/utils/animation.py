@@ -0,0 +1,169 @@
+"""
+Shared frame clock for UI animations.
+
+Every running animation is a Tween registered with one AnimationClock,
+which drives them all from a single after() loop at a fixed frame rate.
+Tweens are time-based: each frame sets them to the eased fraction of
+their duration that has elapsed, so a late frame catches up instead of
+slowing the animation down, and frames the loop is too late for are
+skipped rather than queued.
+"""
+
+import time
+import tkinter as tk
+from typing import Any, Callable, List, Optional
+
+FRAME_MS = 16
+
+def linear(t: float) -> float:
+    return t
+
+def ease_in_out(t: float) -> float:
+    """Cubic easing"""
+    if t < 0.5:
+        return 4 * t * t * t
+    return 1 - pow(-2 * t + 2, 3) / 2
+
+def ease_out(t: float) -> float:
+    """Cubic ease-out"""
+    return 1 - pow(1 - t, 3)
+
+class Tween:
+    """One animation: calls update(eased_progress) each frame for duration ms"""
+
+    def __init__(
+        self,
+        widget: Any,
+        duration: int,
+        update: Callable[[float], None],
+        callback: Optional[Callable] = None,
+        ease: Callable[[float], float] = ease_in_out,
+        delay: int = 0
+    ):
+        self.widget = widget
+        self.duration = max(duration, 1) / 1000
+        self.update = update
+        self.callback = callback
+        self.ease = ease
+        self.start = time.perf_counter() + delay / 1000
+        self.done = False
+
+    @property
+    def running(self) -> bool:
+        return not self.done
+
+    def cancel(self):
+        """Stop without calling the callback"""
+        self.done = True
+
+    def step(self, now: float) -> bool:
+        """Advance to time now; True once finished"""
+        if now < self.start:
+            return False
+        progress = min(1.0, (now - self.start) / self.duration)
+        self.update(self.ease(progress))
+        return progress >= 1.0
+
+class AnimationClock:
+    """Drive all tweens from one after() loop
+
+    The loop only runs while there are tweens. stats holds frame counts
+    and timings: "frames" ticks run, "skipped" frames dropped because a
+    tick ran late, and the last and worst time spent updating tweens.
+    """
+
+    def __init__(self, frame_ms: int = FRAME_MS):
+        self.frame_ms = frame_ms
+        self._tweens: List[Tween] = []
+        self._root = None
+        self._after_id = None
+        self._next_frame = 0.0
+        self.stats = {
+            "frames": 0,
+            "skipped": 0,
+            "tweens": 0,
+            "last_frame_ms": 0.0,
+            "max_frame_ms": 0.0,
+            "total_frame_ms": 0.0,
+        }
+
+    @property
+    def active(self) -> int:
+        return len(self._tweens)
+
+    def animate(
+        self,
+        widget: Any,
+        duration: int,
+        update: Callable[[float], None],
+        callback: Optional[Callable] = None,
+        ease: Callable[[float], float] = ease_in_out,
+        delay: int = 0
+    ) -> Tween:
+        """Run update(progress) every frame for duration ms, then callback()"""
+        tween = Tween(widget, duration, update, callback, ease, delay)
+        self._tweens.append(tween)
+        self.stats["tweens"] += 1
+        if self._after_id is None:
+            # Schedule on the Tk root, which outlives the widgets animated
+            self._root = widget._root()
+            self._next_frame = time.perf_counter()
+            self._after_id = self._root.after_idle(self._tick)
+        return tween
+
+    def cancel_all(self):
+        """Stop every tween, e.g. before the window closes"""
+        for tween in self._tweens:
+            tween.cancel()
+        self._tweens.clear()
+        if self._after_id is not None:
+            self._root.after_cancel(self._after_id)
+            self._after_id = None
+
+    def _tick(self):
+        self._after_id = None
+        start = time.perf_counter()
+        frame = self.frame_ms / 1000
+
+        # Frames we are already past are dropped, not replayed
+        behind = int((start - self._next_frame) / frame)
+        if behind > 0:
+            self.stats["skipped"] += behind
+            self._next_frame += behind * frame
+
+        finished = []
+        for tween in list(self._tweens):
+            if tween.done:
+                continue
+            try:
+                if tween.step(start):
+                    tween.done = True
+                    finished.append(tween)
+            except tk.TclError:
+                tween.done = True  # Widget destroyed mid-animation
+            except Exception as e:
+                print(f"Error in animation: {e}")
+                tween.done = True
+        self._tweens = [tween for tween in self._tweens if not tween.done]
+
+        elapsed = (time.perf_counter() - start) * 1000
+        self.stats["frames"] += 1
+        self.stats["last_frame_ms"] = elapsed
+        self.stats["max_frame_ms"] = max(self.stats["max_frame_ms"], elapsed)
+        self.stats["total_frame_ms"] += elapsed
+
+        # Callbacks run after the frame, so they can start new tweens
+        for tween in finished:
+            if tween.callback:
+                try:
+                    tween.callback()
+                except Exception as e:
+                    print(f"Error in animation callback: {e}")
+
+        if self._tweens and self._after_id is None:
+            self._next_frame += frame
+            delay = max(1, int((self._next_frame - time.perf_counter()) * 1000))
+            self._after_id = self._root.after(delay, self._tick)
+
+# Global clock shared by every widget
+animation_clock = AnimationClock()
@@ -0,0 +1,71 @@
+from concurrent.futures import Future, ThreadPoolExecutor
+from typing import Any, Callable, Optional
+
+from src.utils.database import Database
+
+def deliver(
+    widget: Any,
+    future: Future,
+    callback: Callable[[Any], None],
+    error_callback: Optional[Callable[[BaseException], None]] = None,
+    poll_ms: int = 15
+):
+    """Call callback(result) on the Tk thread once future completes
+
+    Tk is not thread-safe, so results are picked up by polling from the
+    widget's event loop instead of from the worker thread.
+    """
+    def _poll():
+        if not widget.winfo_exists():
+            return  # Widget was destroyed while the call was in flight
+        if not future.done():
+            widget.after(poll_ms, _poll)
+            return
+
+        error = future.exception()
+        if error is None:
+            callback(future.result())
+        elif error_callback:
+            error_callback(error)
+        else:
+            print(f"Database error: {error}")
+
+    widget.after(poll_ms, _poll)
+
+class AsyncDatabase:
+    """Run Database calls on a dedicated executor so the UI never blocks"""
+
+    def __init__(self, database: Optional[Database] = None, max_workers: int = 2):
+        self.database = database or Database()
+        self.executor = ThreadPoolExecutor(max_workers=max_workers, thread_name_prefix="database")
+
+        # Warm the email Bloom filter off the Tk thread
+        self.executor.submit(self.database.load_email_filter)
+
+    def submit(self, func: Callable, *args, **kwargs) -> Future:
+        """Run any callable on the database executor"""
+        return self.executor.submit(func, *args, **kwargs)
+
+    def create_user(self, email: str, password: str, name: str = None) -> Future:
+        """Future resolving to Database.create_user's (success, message)"""
+        return self.submit(self.database.create_user, email, password, name)
+
+    def verify_user(self, email: str, password: str) -> Future:
+        """Future resolving to Database.verify_user's (success, message, user)"""
+        return self.submit(self.database.verify_user, email, password)
+
+    def user_exists(self, email: str) -> Future:
+        """Future resolving to Database.user_exists's bool"""
+        return self.submit(self.database.user_exists, email)
+
+    def email_status(self, email: str) -> Optional[bool]:
+        """Answer "is this email registered?" from memory, without blocking
+
+        Returns None when only a database lookup could tell.
+        """
+        return self.database.cache.exists_hint(email)
+
+    def shutdown(self, wait: bool = True):
+        """Stop the executor and close the database"""
+        self.executor.shutdown(wait=wait)
+        self.database.close()
@@ -0,0 +1,450 @@
+"""
+Micro-benchmarks for PencilSharp internals.
+
+Run with: python -m src.utils.benchmarks
+     python -m src.utils.benchmarks concurrency --workers 8 --mode both
+"""
+
+import argparse
+import json
+import os
+import random
+import sqlite3
+import tempfile
+import time
+from concurrent.futures import ProcessPoolExecutor, ThreadPoolExecutor
+from contextlib import contextmanager
+from typing import Callable, Dict, Iterator, List, Optional, Sequence
+
+from src.utils.database import ConnectionPool, Database
+from src.utils.event_log import LESSON_COMPLETED, EventLog
+from src.utils.latex_unicode import latex_to_unicode
+from src.utils.leaderboard import LeagueRanking
+from src.utils.passwords import PasswordHasher
+from src.utils.search_index import SearchIndex
+from src.utils.templates import Template
+from src.utils.user_cache import UserCache
+
+class _ConnectPerCallPool(ConnectionPool):
+    """Pool stand-in that reproduces the old open/close-per-call behaviour"""
+
+    @contextmanager
+    def connection(self) -> Iterator[sqlite3.Connection]:
+        conn = sqlite3.connect(self.db_path, timeout=self.timeout)
+        try:
+            yield conn
+            conn.commit()
+        finally:
+            conn.close()
+
+def _calls_per_second(func: Callable[[int], object], calls: int) -> float:
+    """Time `calls` invocations of func(i) and return the rate"""
+    start = time.perf_counter()
+    for i in range(calls):
+        func(i)
+    elapsed = time.perf_counter() - start
+    return calls / elapsed if elapsed else float("inf")
+
+def _uncached() -> UserCache:
+    """A UserCache that keeps nothing, so every lookup goes to SQLite"""
+    # No Bloom filter is loaded and every put is evicted at once
+    return UserCache(max_entries=0)
+
+def _run_database_methods(db: Database, calls: int, tag: str) -> Dict[str, float]:
+    """Measure the three public Database methods"""
+    return {
+        "create_user": _calls_per_second(
+            lambda i: db.create_user(f"{tag}{i}@bench.local", "secret", "Bench"),
+            calls
+        ),
+        "verify_user": _calls_per_second(
+            lambda i: db.verify_user(f"{tag}{i}@bench.local", "secret"),
+            calls
+        ),
+        "user_exists": _calls_per_second(
+            lambda i: db.user_exists(f"{tag}{i}@bench.local"),
+            calls
+        ),
+    }
+
+def benchmark_database(calls: int = 500) -> Dict[str, Dict[str, float]]:
+    """Compare connect-per-call against the pooled connection manager"""
+    results = {}
+    with tempfile.TemporaryDirectory() as tmp:
+        # Minimal KDF cost so connection handling dominates the timings
+        # Uncached, or user_exists would be answered from memory in both runs
+        db = Database(
+            os.path.join(tmp, "bench.db"),
+            hasher=PasswordHasher(n=2 ** 4),
+            cache=_uncached()
+        )
+
+        db.pool = _ConnectPerCallPool(db.db_path)
+        results["before"] = _run_database_methods(db, calls, "before")
+
+        db.pool = ConnectionPool(db.db_path)
+        results["after"] = _run_database_methods(db, calls, "after")
+        db.close()
+    return results
+
+def benchmark_password_kdf(
+    costs: Sequence[int] = (2 ** 12, 2 ** 14, 2 ** 15),
+    logins: int = 40,
+    concurrency: int = 8
+) -> Dict[int, Dict[str, float]]:
+    """Measure verify_user latency and throughput at several scrypt costs"""
+    results = {}
+    with tempfile.TemporaryDirectory() as tmp:
+        for n in costs:
+            db = Database(os.path.join(tmp, f"kdf_{n}.db"), hasher=PasswordHasher(n=n))
+            db.create_user("bench@bench.local", "secret")
+
+            # Sequential logins give per-login latency
+            start = time.perf_counter()
+            for _ in range(logins):
+                db.verify_user("bench@bench.local", "secret")
+            latency = (time.perf_counter() - start) / logins
+
+            # Concurrent logins show what the bounded pool sustains
+            start = time.perf_counter()
+            with ThreadPoolExecutor(max_workers=concurrency) as executor:
+                list(executor.map(
+                    lambda _: db.verify_user("bench@bench.local", "secret"),
+                    range(logins)
+                ))
+            throughput = logins / (time.perf_counter() - start)
+
+            results[n] = {"latency_ms": latency * 1000, "logins_per_sec": throughput}
+            db.close()
+    return results
+
+# Formulas as they appear in the quadratic-equations lessons
+LESSON_FORMULAS = (
+    r"ax^2 + bx + c = 0",
+    r"a \neq 0",
+    r"x = \frac{-b \pm \sqrt{b^2 - 4ac}}{2a}",
+    r"b^2 - 4ac > 0",
+    r"b^2 - 4ac = 0",
+    r"b^2 - 4ac < 0",
+    r"x^2 - 5x + 6 = 0",
+    r"x = \frac{5 \pm \sqrt{25 - 24}}{2} = \frac{5 \pm 1}{2}",
+    r"2x^2 - 7x + 3 = 0",
+    r"x = \frac{7 \pm \sqrt{49 - 24}}{4}",
+    r"-b \pm \sqrt{b^2 - 4ac}",
+    r"$k = \pm 4$",
+    r"x_1 + x_2 = -\frac{b}{a}",
+    r"\alpha \beta \leq \infty \rightarrow \sum x_i",
+)
+
+def _legacy_latex_to_unicode(latex: str) -> str:
+    """The replace-chain conversion LatexLabel used before the tokenizer"""
+    replacements = {
+        "\\alpha": "α", "\\beta": "β", "\\gamma": "γ",
+        "\\pm": "±", "\\times": "×", "\\div": "÷",
+        "\\leq": "≤", "\\geq": "≥", "\\neq": "≠",
+        "\\approx": "≈", "\\sqrt": "√", "\\infty": "∞",
+        "^2": "²", "^3": "³", "^n": "ⁿ",
+        "_1": "₁", "_2": "₂", "_3": "₃",
+        "\\rightarrow": "→", "\\leftarrow": "←",
+        "\\sum": "Σ", "\\prod": "∏",
+        "\\frac": "/",
+    }
+    result = latex.replace("$", "")
+    if "\\frac" in result:
+        parts = result.split("\\frac{")
+        for i in range(1, len(parts)):
+            try:
+                num_end = parts[i].find("}")
+                numerator = parts[i][:num_end]
+                denom_start = parts[i].find("{", num_end)
+                denom_end = parts[i].find("}", denom_start)
+                denominator = parts[i][denom_start+1:denom_end]
+                rest = parts[i][denom_end+1:]
+                parts[i] = f"({numerator}/{denominator}){rest}"
+            except Exception:
+                continue
+        result = "".join(parts)
+    for tex, unicode in replacements.items():
+        result = result.replace(tex, unicode)
+    return result.replace("{", "").replace("}", "")
+
+def benchmark_latex_unicode(rounds: int = 200) -> Dict[str, float]:
+    """Formulas/sec for the old and new LaTeX to Unicode conversions
+
+    Conversions are timed over distinct formulas, so no memo can answer
+    them; only the last row repeats formulas to time memo hits.
+    """
+    distinct = [f"{formula} + {i}" for i in range(rounds) for formula in LESSON_FORMULAS]
+    repeated = LESSON_FORMULAS * rounds
+
+    def rate(convert: Callable[[str], str], corpus) -> float:
+        start = time.perf_counter()
+        for formula in corpus:
+            convert(formula)
+        return len(corpus) / (time.perf_counter() - start)
+
+    # Bypass the memo to time the tokenizer itself
+    return {
+        "legacy replace chain": rate(_legacy_latex_to_unicode, distinct),
+        "tokenizer": rate(latex_to_unicode.__wrapped__, distinct),
+        "tokenizer (memo hits)": rate(latex_to_unicode, repeated),
+    }
+
+def benchmark_templates(paragraphs: int = 2000, renders: int = 200) -> Dict[str, float]:
+    """Pages/sec filling a large lesson into a page shell"""
+    style = "".join(f"    .rule{i} {{ margin: {i}px; }}\n" for i in range(200))
+    source = f"<html><head><title>{{title}}</title><style>\n{style}</style></head><body>{{body}}</body></html>"
+    body = "".join(f"<p>Paragraph {i}: solve $x^2 - {i}x + 6 = 0$.</p>\n" for i in range(paragraphs))
+
+    # str.format needs every CSS brace doubled
+    format_source = source.replace("{", "{{").replace("}", "}}")
+    format_source = format_source.replace("{{title}}", "{title}").replace("{{body}}", "{body}")
+    template = Template(source)
+    bound = template.bind(title="Quadratic Equations")
+
+    def rate(render: Callable[[], str]) -> float:
+        start = time.perf_counter()
+        for _ in range(renders):
+            render()
+        return renders / (time.perf_counter() - start)
+
+    return {
+        "str.format": rate(lambda: format_source.format(title="Quadratic Equations", body=body)),
+        "Template.render": rate(lambda: template.render(title="Quadratic Equations", body=body)),
+        "bound Template.render": rate(lambda: bound.render(body=body)),
+    }
+
+def benchmark_search(lessons: int = 20000, queries: int = 200) -> Dict[str, float]:
+    """Index build time and query latency over a synthetic lesson catalog"""
+    rng = random.Random(42)
+    vocabulary = [
+        "".join(rng.choice("abcdefghijklmnopqrstuvwxyz") for _ in range(rng.randint(4, 10)))
+        for _ in range(20000)
+    ]
+
+    index = SearchIndex()
+    start = time.perf_counter()
+    for i in range(lessons):
+        body = " ".join(rng.choice(vocabulary) for _ in range(150))
+        index.add(
+            ("topic", i),
+            {"title": f"Topic {i} {rng.choice(vocabulary)}", "context": "Unit Subject", "body": f"<p>{body}</p>"},
+            {"topic": i}
+        )
+    build = time.perf_counter() - start
+
+    def timed(make_query: Callable[[], str]) -> List[float]:
+        latencies = []
+        for _ in range(queries):
+            query = make_query()
+            start = time.perf_counter()
+            index.search(query)
+            latencies.append(time.perf_counter() - start)
+        return latencies
+
+    # A full word plus a three-letter prefix, as typed in a search box
+    typical = timed(lambda: f"{rng.choice(vocabulary)} {rng.choice(vocabulary)[:3]}")
+    # The first one or two keystrokes, which match the most terms
+    short = timed(lambda: rng.choice(vocabulary)[:rng.randint(1, 2)])
+
+    return {
+        "build_sec": build,
+        "p50_ms": _percentile(typical, 50) * 1000,
+        "p99_ms": _percentile(typical, 99) * 1000,
+        "short_p50_ms": _percentile(short, 50) * 1000,
+        "short_p99_ms": _percentile(short, 99) * 1000,
+    }
+
+CONCURRENCY_OPS = ("create_user", "verify_user", "user_exists", "record_event", "add_xp")
+
+def _percentile(samples: List[float], pct: float) -> float:
+    """Nearest-rank percentile of an unsorted sample list"""
+    if not samples:
+        return 0.0
+    ordered = sorted(samples)
+    return ordered[min(len(ordered) - 1, max(0, round(pct / 100 * len(ordered)) - 1))]
+
+def _is_locked(error: str) -> bool:
+    return "database is locked" in error or "database table is locked" in error
+
+def _concurrency_worker(
+    db_path: str,
+    worker_id: int,
+    ops: int,
+    kdf_n: int,
+    database: Optional[Database] = None,
+    cached: bool = False
+) -> Dict[str, Dict]:
+    """Drive every data-layer operation `ops` times and record the outcome
+
+    Top-level so process pools can pickle it. Threads share the database
+    passed in; each process opens its own, as separate app instances would.
+    """
+    db = database or Database(
+        db_path,
+        hasher=PasswordHasher(n=kdf_n),
+        cache=None if cached else _uncached()
+    )
+    # No write-behind queue: progress writes hit SQLite inside the timing
+    events = EventLog(db)
+    ranking = LeagueRanking(db)
+    samples = {op: {"latencies": [], "locked": 0, "errors": 0} for op in CONCURRENCY_OPS}
+
+    def timed(op: str, func: Callable[[], object]):
+        start = time.perf_counter()
+        error = None
+        try:
+            result = func()
+            # Database methods report failures in their return value
+            if isinstance(result, tuple) and not result[0]:
+                error = result[1]
+        except sqlite3.Error as e:
+            error = str(e)
+        samples[op]["latencies"].append(time.perf_counter() - start)
+        if error:
+            samples[op]["locked" if _is_locked(error) else "errors"] += 1
+
+    for i in range(ops):
+        email = f"w{worker_id}-{i}@bench.local"
+        user_id = worker_id * ops + i + 1
+        timed("create_user", lambda: db.create_user(email, "secret", "Bench"))
+        timed("verify_user", lambda: db.verify_user(email, "secret"))
+        timed("user_exists", lambda: db.user_exists(email))
+        timed("record_event", lambda: events.record(user_id, LESSON_COMPLETED, "Mathematics", "Algebra", 10))
+        timed("add_xp", lambda: ranking.add_xp(user_id, 10))
+
+    if database is None:
+        db.close()
+    return samples
+
+def benchmark_concurrency(
+    workers: int = 4,
+    mode: str = "thread",
+    ops: int = 100,
+    kdf_n: int = 2 ** 4,
+    cached: bool = False
+) -> Dict:
+    """Run the data layer from N threads or processes against a temp database
+
+    Returns JSON-ready results: overall throughput plus, per operation, the
+    p50/p99 latency in milliseconds and the rate of "database is locked"
+    failures. The KDF cost defaults to a minimum so lock contention, not
+    hashing, dominates. The user cache is off unless cached is set, since
+    it answers lookups without touching SQLite.
+    """
+    with tempfile.TemporaryDirectory() as tmp:
+        db_path = os.path.join(tmp, "concurrency.db")
+        # Create the schema once so workers don't race on migrations
+        database = Database(
+            db_path,
+            hasher=PasswordHasher(n=kdf_n),
+            cache=None if cached else _uncached()
+        )
+
+        start = time.perf_counter()
+        if mode == "thread":
+            with ThreadPoolExecutor(max_workers=workers) as executor:
+                futures = [
+                    executor.submit(_concurrency_worker, db_path, w, ops, kdf_n, database)
+                    for w in range(workers)
+                ]
+                runs = [f.result() for f in futures]
+        else:
+            with ProcessPoolExecutor(max_workers=workers) as executor:
+                futures = [
+                    executor.submit(_concurrency_worker, db_path, w, ops, kdf_n, None, cached)
+                    for w in range(workers)
+                ]
+                runs = [f.result() for f in futures]
+        elapsed = time.perf_counter() - start
+        database.close()
+
+    operations = {}
+    for op in CONCURRENCY_OPS:
+        latencies = [t for run in runs for t in run[op]["latencies"]]
+        locked = sum(run[op]["locked"] for run in runs)
+        errors = sum(run[op]["errors"] for run in runs)
+        operations[op] = {
+            "calls": len(latencies),
+            "p50_ms": _percentile(latencies, 50) * 1000,
+            "p99_ms": _percentile(latencies, 99) * 1000,
+            "locked": locked,
+            "locked_rate": locked / len(latencies) if latencies else 0.0,
+            "errors": errors,
+        }
+
+    total = sum(stats["calls"] for stats in operations.values())
+    return {
+        "mode": mode,
+        "workers": workers,
+        "ops_per_worker": ops,
+        "kdf_n": kdf_n,
+        "cached": cached,
+        "elapsed_sec": elapsed,
+        "throughput_ops_per_sec": total / elapsed if elapsed else 0.0,
+        "operations": operations,
+    }
+
+def _print_table(title: str, results: Dict[str, Dict[str, float]]):
+    """Print a before/after table of calls per second"""
+    print(title)
+    print(f"  {'method':<14}{'before':>12}{'after':>12}{'speedup':>10}")
+    for method, before in results["before"].items():
+        after = results["after"][method]
+        print(f"  {method:<14}{before:>12.0f}{after:>12.0f}{after / before:>9.1f}x")
+
+def _run_micro(args):
+    _print_table("Database calls/sec", benchmark_database())
+
+    print("Password KDF (scrypt, r=8, p=1)")
+    print(f"  {'n':<10}{'latency ms':>12}{'logins/sec':>12}")
+    for n, stats in benchmark_password_kdf().items():
+        print(f"  {n:<10}{stats['latency_ms']:>12.1f}{stats['logins_per_sec']:>12.1f}")
+
+    print("LaTeX to Unicode formulas/sec")
+    for name, rate in benchmark_latex_unicode().items():
+        print(f"  {name:<24}{rate:>12.0f}")
+
+    stats = benchmark_search()
+    print("Search over 20000 lessons")
+    print(f"  build {stats['build_sec']:.1f}s, query p50 {stats['p50_ms']:.2f} ms, p99 {stats['p99_ms']:.2f} ms")
+    print(f"  1-2 letter queries p50 {stats['short_p50_ms']:.2f} ms, p99 {stats['short_p99_ms']:.2f} ms")
+
+    print("Lesson page templates pages/sec")
+    for name, rate in benchmark_templates().items():
+        print(f"  {name:<24}{rate:>12.0f}")
+
+def _run_concurrency(args):
+    modes = ("thread", "process") if args.mode == "both" else (args.mode,)
+    results = [
+        benchmark_concurrency(args.workers, mode, args.ops, args.kdf_n, cached)
+        for mode in modes
+        for cached in ((False, True) if args.cached else (False,))
+    ]
+    report = json.dumps(results, indent=2)
+    if args.output:
+        with open(args.output, "w") as f:
+            f.write(report + "\n")
+    print(report)
+
+def main():
+    parser = argparse.ArgumentParser(description="PencilSharp benchmarks")
+    subparsers = parser.add_subparsers(dest="command")
+    subparsers.add_parser("micro", help="single-threaded micro-benchmarks (default)")
+
+    concurrency = subparsers.add_parser("concurrency", help="data layer under concurrent load, as JSON")
+    concurrency.add_argument("--workers", type=int, default=4)
+    concurrency.add_argument("--mode", choices=("thread", "process", "both"), default="both")
+    concurrency.add_argument("--ops", type=int, default=100, help="iterations per worker")
+    concurrency.add_argument("--kdf-n", type=int, default=2 ** 4, help="scrypt cost for the run")
+    concurrency.add_argument("--cached", action="store_true", help="also report runs with the user cache on")
+    concurrency.add_argument("--output", help="also write the JSON report to this file")
+
+    args = parser.parse_args()
+    if args.command == "concurrency":
+        _run_concurrency(args)
+    else:
+        _run_micro(args)
+
+if __name__ == "__main__":
+    main()
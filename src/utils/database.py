@@ -1,103 +1,348 @@
 import sqlite3
-import hashlib
 import os
-from typing import Optional, Tuple
+import csv
+import json
+import threading
+from contextlib import contextmanager
+from dataclasses import dataclass, field
+from itertools import islice
+from typing import Dict, Iterable, Iterator, List, Optional, Tuple
+
+from src.utils.migrations import migrate
+from src.utils.passwords import PasswordHasher
+from src.utils.user_cache import UserCache
+
+class ConnectionPool:
+    """Keep one long-lived SQLite connection per thread"""
+
+    # Applied to every new connection. WAL lets readers run alongside a
+    # writer, and NORMAL sync is durable enough in WAL mode.
+    PRAGMAS = (
+        "PRAGMA journal_mode=WAL",
+        "PRAGMA synchronous=NORMAL",
+        "PRAGMA cache_size=-16000",     # ~16 MB page cache
+        "PRAGMA mmap_size=268435456",   # 256 MB memory-mapped reads
+        "PRAGMA temp_store=MEMORY",
+    )
+
+    def __init__(self, db_path: str, timeout: float = 30.0):
+        self.db_path = db_path
+        self.timeout = timeout
+        self._local = threading.local()
+        self._lock = threading.Lock()
+        self._connections: List[sqlite3.Connection] = []
+
+    def _connect(self) -> sqlite3.Connection:
+        """Open and tune a new connection"""
+        conn = sqlite3.connect(
+            self.db_path,
+            timeout=self.timeout,
+            check_same_thread=False  # Allows close_all() from any thread
+        )
+        for pragma in self.PRAGMAS:
+            conn.execute(pragma)
+        with self._lock:
+            self._connections.append(conn)
+        return conn
+
+    def _get(self) -> sqlite3.Connection:
+        """Get the calling thread's connection, opening it if needed"""
+        conn = getattr(self._local, "conn", None)
+        if conn is None:
+            conn = self._connect()
+            self._local.conn = conn
+            self._local.depth = 0
+        return conn
+
+    @contextmanager
+    def connection(self) -> Iterator[sqlite3.Connection]:
+        """Yield this thread's connection as one transaction
+
+        Commits when the outermost block exits cleanly and rolls back if it
+        raises. Nested blocks on the same thread join the outer transaction.
+        """
+        conn = self._get()
+        depth = self._local.depth
+        self._local.depth = depth + 1
+        try:
+            yield conn
+            if depth == 0:
+                conn.commit()
+        except BaseException:
+            if depth == 0:
+                conn.rollback()
+            raise
+        finally:
+            self._local.depth = depth
+
+    def close_all(self):
+        """Close every connection handed out by this pool"""
+        with self._lock:
+            connections, self._connections = self._connections, []
+        for conn in connections:
+            conn.close()
+        self._local = threading.local()
+
+@dataclass
+class BulkImportResult:
+    created: int = 0
+    # (row number, email, reason) for every row that was not inserted
+    conflicts: List[Tuple[int, str, str]] = field(default_factory=list)
+
+def iter_users_csv(path: str) -> Iterator[Dict[str, str]]:
+    """Stream user rows from a CSV file with email,password[,name] columns"""
+    with open(path, newline="", encoding="utf-8") as f:
+        yield from csv.DictReader(f)
+
+def iter_users_jsonl(path: str) -> Iterator[Dict[str, str]]:
+    """Stream user rows from a JSON Lines file, one object per line"""
+    with open(path, encoding="utf-8") as f:
+        for line in f:
+            line = line.strip()
+            if line:
+                yield json.loads(line)
+
+def iter_users_file(path: str) -> Iterator[Dict[str, str]]:
+    """Stream user rows from a .csv or .jsonl file"""
+    if path.endswith((".jsonl", ".ndjson")):
+        return iter_users_jsonl(path)
+    return iter_users_csv(path)
+
+# Offline profile used when nobody has logged in. The password hash is not
+# a valid hash of anything, so the account can't be logged into
+LOCAL_PROFILE_EMAIL = "local@pencilsharp.invalid"
+LOCAL_PROFILE_HASH = "!"
 
 class Database:
-    def __init__(self):
-        self.db_path = "users.db"
+    def __init__(
+        self,
+        db_path: str = "users.db",
+        hasher: Optional[PasswordHasher] = None,
+        cache: Optional[UserCache] = None
+    ):
+        self.db_path = db_path
+        self.pool = ConnectionPool(db_path)
+        self.hasher = hasher or PasswordHasher()
+        self.cache = cache or UserCache()
         self._create_tables()
-    
+
     def _create_tables(self):
-        """Create necessary tables if they don't exist"""
-        conn = sqlite3.connect(self.db_path)
-        cursor = conn.cursor()
-        
-        # Create users table
-        cursor.execute("""
-            CREATE TABLE IF NOT EXISTS users (
-                id INTEGER PRIMARY KEY AUTOINCREMENT,
-                email TEXT UNIQUE NOT NULL,
-                password_hash TEXT NOT NULL,
-                name TEXT,
-                created_at TIMESTAMP DEFAULT CURRENT_TIMESTAMP
-            )
-        """)
-        
-        conn.commit()
-        conn.close()
-    
+        """Create or upgrade tables through the versioned migrations"""
+        with self.pool.connection() as conn:
+            migrate(conn)
+
+    def close(self):
+        """Close all pooled connections and stop the hashing pool"""
+        self.pool.close_all()
+        self.hasher.shutdown()
+
+    def load_email_filter(self):
+        """Build the cache's Bloom filter from every registered email"""
+        with self.pool.connection() as conn:
+            count = conn.execute("SELECT COUNT(*) FROM users").fetchone()[0]
+            emails = (email for (email,) in conn.execute("SELECT email FROM users"))
+            self.cache.load_emails(emails, count)
+
+    def _fetch_user(self, email: str) -> Optional[tuple]:
+        """Read-through lookup of (id, email, password_hash, name)"""
+        found, user = self.cache.get(email)
+        if not found:
+            with self.pool.connection() as conn:
+                user = conn.execute(
+                    "SELECT id, email, password_hash, name FROM users WHERE email = ?",
+                    (email,)
+                ).fetchone()
+            self.cache.put(email, user)
+        return user
+
     def _hash_password(self, password: str) -> str:
-        """Hash a password using SHA-256"""
-        return hashlib.sha256(password.encode()).hexdigest()
-    
+        """Hash a password with the salted KDF"""
+        return self.hasher.hash(password)
+
     def create_user(self, email: str, password: str, name: str = None) -> Tuple[bool, str]:
         """Create a new user"""
         try:
-            conn = sqlite3.connect(self.db_path)
-            cursor = conn.cursor()
-            
             # Hash the password
             password_hash = self._hash_password(password)
-            
+
             # Insert the user
-            cursor.execute(
-                "INSERT INTO users (email, password_hash, name) VALUES (?, ?, ?)",
-                (email, password_hash, name)
-            )
-            
-            conn.commit()
-            conn.close()
-            
+            with self.pool.connection() as conn:
+                conn.execute(
+                    "INSERT INTO users (email, password_hash, name) VALUES (?, ?, ?)",
+                    (email, password_hash, name)
+                )
+            self.cache.registered(email)
+
             return True, "User created successfully"
-            
+
         except sqlite3.IntegrityError:
+            # Created elsewhere; forget any stale negative entry
+            self.cache.invalidate(email)
             return False, "Email already exists"
         except Exception as e:
             return False, f"Error creating user: {str(e)}"
-    
+
+    def create_users_bulk(
+        self,
+        rows: Iterable[Dict[str, str]],
+        chunk_size: int = 1000,
+        hasher: Optional[PasswordHasher] = None
+    ) -> BulkImportResult:
+        """Create many users, reporting per-row conflicts instead of aborting
+
+        Rows are dicts with "email", "password" and optional "name" keys, e.g.
+        from iter_users_file(). Passwords are hashed across the hasher's worker
+        pool and each chunk is inserted in a single executemany transaction.
+
+        Import time is dominated by the KDF cost: at the default n=2**14 a
+        100k-row import takes well over an hour on one core. Passing a
+        cheaper hasher, e.g. PasswordHasher(n=2 ** 10), makes it roughly 16
+        times faster. verify_user() upgrades each of those hashes to the
+        full cost at the user's first login. Until then they are weaker
+        against offline cracking.
+        """
+        result = BulkImportResult()
+        rows = iter(rows)
+        row_number = 0
+
+        while True:
+            chunk = list(islice(rows, chunk_size))
+            if not chunk:
+                break
+
+            # Validate and drop duplicates within the chunk itself
+            pending = []
+            seen = set()
+            for row in chunk:
+                row_number += 1
+                email = (row.get("email") or "").strip()
+                if not email or not row.get("password"):
+                    result.conflicts.append((row_number, email, "Missing email or password"))
+                elif email in seen:
+                    result.conflicts.append((row_number, email, "Duplicate email in import"))
+                else:
+                    seen.add(email)
+                    pending.append((row_number, email, row))
+
+            if pending:
+                self._insert_user_chunk(pending, result, hasher or self.hasher)
+
+        result.conflicts.sort()
+        return result
+
+    def _insert_user_chunk(self, pending, result: BulkImportResult, hasher: PasswordHasher):
+        """Hash and insert one validated chunk of rows"""
+        # Skip hashing rows whose email is already taken
+        with self.pool.connection() as conn:
+            placeholders = ",".join("?" * len(pending))
+            existing = {
+                email for (email,) in conn.execute(
+                    f"SELECT email FROM users WHERE email IN ({placeholders})",
+                    [email for _, email, _ in pending]
+                )
+            }
+        for row_number, email, _ in pending:
+            if email in existing:
+                result.conflicts.append((row_number, email, "Email already exists"))
+        pending = [item for item in pending if item[1] not in existing]
+        if not pending:
+            return
+
+        hashes = hasher.hash_many(row["password"] for _, _, row in pending)
+        values = [
+            (email, password_hash, row.get("name"))
+            for (_, email, row), password_hash in zip(pending, hashes)
+        ]
+
+        with self.pool.connection() as conn:
+            changes_before = conn.total_changes
+            conn.executemany(
+                "INSERT OR IGNORE INTO users (email, password_hash, name) VALUES (?, ?, ?)",
+                values
+            )
+            inserted = conn.total_changes - changes_before
+
+            lost = set()
+            if inserted < len(values):
+                # Another writer took some emails after the pre-check;
+                # the rows whose stored hash isn't ours are the conflicts
+                placeholders = ",".join("?" * len(values))
+                stored = dict(conn.execute(
+                    f"SELECT email, password_hash FROM users WHERE email IN ({placeholders})",
+                    [email for email, _, _ in values]
+                ))
+                for (row_number, email, _), (_, password_hash, _) in zip(pending, values):
+                    if stored.get(email) != password_hash:
+                        lost.add(email)
+                        result.conflicts.append((row_number, email, "Email already exists"))
+
+        for email, _, _ in values:
+            if email in lost:
+                self.cache.invalidate(email)
+            else:
+                self.cache.registered(email)
+        result.created += inserted
+
     def verify_user(self, email: str, password: str) -> Tuple[bool, str, Optional[dict]]:
         """Verify user credentials"""
         try:
-            conn = sqlite3.connect(self.db_path)
-            cursor = conn.cursor()
-            
             # Get user by email
-            cursor.execute(
-                "SELECT id, email, password_hash, name FROM users WHERE email = ?",
-                (email,)
-            )
-            user = cursor.fetchone()
-            
+            user = self._fetch_user(email)
+
             if not user:
+                # Take as long as a wrong password, so timing doesn't tell
+                # which emails have accounts
+                self.hasher.verify_dummy(password)
                 return False, "Invalid email or password", None
-            
+
             # Verify password
-            password_hash = self._hash_password(password)
-            if password_hash != user[2]:  # Index 2 is password_hash
+            if not self.hasher.verify(password, user[2]):  # Index 2 is password_hash
                 return False, "Invalid email or password", None
-            
+
+            # Transparently upgrade legacy or outdated hashes
+            if self.hasher.needs_rehash(user[2]):
+                with self.pool.connection() as conn:
+                    conn.execute(
+                        "UPDATE users SET password_hash = ? WHERE id = ?",
+                        (self._hash_password(password), user[0])
+                    )
+                self.cache.invalidate(email)
+
             # Return user data
             user_data = {
                 "id": user[0],
                 "email": user[1],
                 "name": user[3]
             }
-            
+
             return True, "Login successful", user_data
-            
+
         except Exception as e:
             return False, f"Error verifying user: {str(e)}", None
-        finally:
-            conn.close()
-    
+
+    def local_profile(self, name: str = "Learner") -> int:
+        """Id of the local profile, created the first time it is needed"""
+        with self.pool.connection() as conn:
+            conn.execute(
+                "INSERT OR IGNORE INTO users (email, password_hash, name) VALUES (?, ?, ?)",
+                (LOCAL_PROFILE_EMAIL, LOCAL_PROFILE_HASH, name)
+            )
+            user_id = conn.execute(
+                "SELECT id FROM users WHERE email = ?", (LOCAL_PROFILE_EMAIL,)
+            ).fetchone()[0]
+        self.cache.registered(LOCAL_PROFILE_EMAIL)
+        return user_id
+
     def user_exists(self, email: str) -> bool:
-        """Check if a user exists"""
-        conn = sqlite3.connect(self.db_path)
-        cursor = conn.cursor()
-        
-        cursor.execute("SELECT 1 FROM users WHERE email = ?", (email,))
-        exists = cursor.fetchone() is not None
-        
-        conn.close()
-        return exists 
\ No newline at end of file
+        """Check if a user exists
+
+        Answered from the cache when possible. An account registered by
+        another process since the Bloom filter was built can read as free;
+        create_user still rejects it through the UNIQUE constraint.
+        """
+        if self.cache.needs_reload:
+            self.load_email_filter()
+        hint = self.cache.exists_hint(email)
+        if hint is not None:
+            return hint
+        return self._fetch_user(email) is not None
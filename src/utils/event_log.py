@@ -0,0 +1,76 @@
+import time
+from datetime import date
+from typing import Dict, List, Optional
+
+from src.utils.database import Database
+from src.utils.progress_store import WriteBehindQueue
+
+# Event kinds, stored as small integers to keep rows compact
+LESSON_COMPLETED = 1
+QUIZ_ANSWERED = 2
+LOGIN = 3
+
+ROLLUP_COLUMNS = ("lessons", "quiz_answers", "quiz_correct", "xp", "logins")
+
+class EventLog:
+    """Append-only log of learning events with per-day rollups
+
+    Every insert into learning_events also updates daily_rollups through a
+    trigger (see migration 5), so dashboards read one small row per user,
+    day and subject instead of aggregating raw events.
+    """
+
+    def __init__(self, database: Database, writer: Optional[WriteBehindQueue] = None):
+        self.pool = database.pool
+        self.writer = writer
+
+    def record(
+        self,
+        user_id: int,
+        kind: int,
+        subject: Optional[str] = None,
+        topic: Optional[str] = None,
+        value: int = 0
+    ):
+        """Append one event; value is XP for lessons, 1/0 for quiz answers"""
+        sql = """INSERT INTO learning_events (user_id, kind, subject, topic, value, day, created_at)
+                 VALUES (?, ?, ?, ?, ?, ?, ?)"""
+        params = (user_id, kind, subject, topic, value, date.today().isoformat(), int(time.time()))
+        if self.writer:
+            self.writer.submit(sql, params)
+        else:
+            with self.pool.connection() as conn:
+                conn.execute(sql, params)
+
+    def daily_summary(self, user_id: int, start: date, end: date) -> List[Dict]:
+        """Rolled-up totals per day and subject between two dates inclusive"""
+        if self.writer:
+            self.writer.flush()
+        with self.pool.connection() as conn:
+            rows = conn.execute(
+                f"""SELECT day, subject, {', '.join(ROLLUP_COLUMNS)} FROM daily_rollups
+                    WHERE user_id = ? AND day BETWEEN ? AND ? ORDER BY day, subject""",
+                (user_id, start.isoformat(), end.isoformat())
+            ).fetchall()
+        return [
+            dict(zip(("day", "subject") + ROLLUP_COLUMNS, row))
+            for row in rows
+        ]
+
+    def rebuild_rollups(self):
+        """Recompute every rollup from the raw events"""
+        if self.writer:
+            self.writer.flush()
+        with self.pool.connection() as conn:
+            conn.execute("DELETE FROM daily_rollups")
+            conn.execute(f"""
+                INSERT INTO daily_rollups (user_id, day, subject, {', '.join(ROLLUP_COLUMNS)})
+                SELECT user_id, day, COALESCE(subject, ''),
+                       SUM(kind = {LESSON_COMPLETED}),
+                       SUM(kind = {QUIZ_ANSWERED}),
+                       SUM(kind = {QUIZ_ANSWERED} AND value > 0),
+                       SUM(CASE WHEN kind = {LESSON_COMPLETED} THEN value ELSE 0 END),
+                       SUM(kind = {LOGIN})
+                FROM learning_events
+                GROUP BY user_id, day, COALESCE(subject, '')
+            """)
@@ -0,0 +1,203 @@
+"""
+LaTeX to Unicode conversion for plain-text math labels.
+
+One tokenizing pass feeds a small recursive parser, so nested groups such
+as \\frac{\\sqrt{b^2 - 4ac}}{2a} come out right. The tokenizer already
+splits off the single characters that ^, _ and commands take as
+arguments, so the parser never edits its token list. Results are
+memoized, since the same formulas are shown over and over.
+"""
+
+import re
+from functools import lru_cache
+from typing import List
+
+TOKEN_PATTERN = re.compile(r"\\[A-Za-z]+|\\.|[{}^_$]|\[[^\]\\{}^_$]*\]|[^\\{}^_$\[]+|\[")
+
+# Commands that read more than one argument
+ARGUMENT_COUNTS = {"frac": 2, "dfrac": 2, "tfrac": 2}
+
+SYMBOLS = {
+    # Greek
+    "alpha": "α", "beta": "β", "gamma": "γ", "delta": "δ", "epsilon": "ε",
+    "varepsilon": "ε", "zeta": "ζ", "eta": "η", "theta": "θ", "iota": "ι",
+    "kappa": "κ", "lambda": "λ", "mu": "μ", "nu": "ν", "xi": "ξ", "pi": "π",
+    "rho": "ρ", "sigma": "σ", "tau": "τ", "phi": "φ", "varphi": "φ",
+    "chi": "χ", "psi": "ψ", "omega": "ω",
+    "Gamma": "Γ", "Delta": "Δ", "Theta": "Θ", "Lambda": "Λ", "Pi": "Π",
+    "Sigma": "Σ", "Phi": "Φ", "Psi": "Ψ", "Omega": "Ω",
+    # Operators and relations
+    "pm": "±", "mp": "∓", "times": "×", "div": "÷", "cdot": "·",
+    "leq": "≤", "le": "≤", "geq": "≥", "ge": "≥", "neq": "≠", "ne": "≠",
+    "approx": "≈", "equiv": "≡", "sim": "∼", "propto": "∝",
+    "infty": "∞", "partial": "∂", "nabla": "∇", "degree": "°", "circ": "∘",
+    "sum": "Σ", "prod": "∏", "int": "∫", "oint": "∮",
+    "in": "∈", "notin": "∉", "subset": "⊂", "subseteq": "⊆", "cup": "∪",
+    "cap": "∩", "emptyset": "∅", "forall": "∀", "exists": "∃",
+    "neg": "¬", "land": "∧", "lor": "∨", "angle": "∠", "perp": "⊥",
+    "parallel": "∥", "ldots": "…", "cdots": "⋯", "dots": "…",
+    # Arrows
+    "rightarrow": "→", "to": "→", "leftarrow": "←", "leftrightarrow": "↔",
+    "Rightarrow": "⇒", "Leftarrow": "⇐", "Leftrightarrow": "⇔",
+    "rightleftharpoons": "⇌", "uparrow": "↑", "downarrow": "↓",
+    # Spacing and sizing
+    ",": " ", ";": " ", ":": " ", "!": "", " ": " ", "quad": "  ", "qquad": "    ",
+    "\\": " ", "left": "", "right": "", "big": "", "Big": "",
+    "{": "{", "}": "}", "$": "$", "%": "%", "&": "&", "#": "#", "_": "_",
+    # Functions, set upright
+    "sin": "sin", "cos": "cos", "tan": "tan", "log": "log", "ln": "ln",
+    "exp": "exp", "lim": "lim", "max": "max", "min": "min",
+}
+
+# Commands whose single argument is shown as plain text
+TEXT_COMMANDS = {"text", "mathrm", "mathbf", "mathit", "textbf", "textit", "operatorname", "mathbb"}
+
+SUPERSCRIPTS = str.maketrans(
+    "0123456789+-=()nix",
+    "⁰¹²³⁴⁵⁶⁷⁸⁹⁺⁻⁼⁽⁾ⁿⁱˣ"
+)
+SUBSCRIPTS = str.maketrans(
+    "0123456789+-=()aeioxn",
+    "₀₁₂₃₄₅₆₇₈₉₊₋₌₍₎ₐₑᵢₒₓₙ"
+)
+_SUPERSCRIPT_CHARS = set("0123456789+-=()nix")
+_SUBSCRIPT_CHARS = set("0123456789+-=()aeioxn")
+
+class _Parser:
+    """Recursive-descent conversion over one list of tokens"""
+
+    def __init__(self, tokens: List[str]):
+        self.tokens = tokens
+        self.pos = 0
+
+    def parse(self) -> str:
+        return self._sequence(closing=False)
+
+    def _sequence(self, closing: bool) -> str:
+        parts = []
+        while self.pos < len(self.tokens):
+            token = self.tokens[self.pos]
+            if token == "}":
+                self.pos += 1
+                if closing:
+                    break
+                continue  # Stray brace
+            parts.append(self._atom())
+        return "".join(parts)
+
+    def _argument(self) -> str:
+        """The next group or single token, as used by ^, _ and commands"""
+        # Skip spaces between a command and its argument
+        while self.pos < len(self.tokens) and self.tokens[self.pos].isspace():
+            self.pos += 1
+        if self.pos >= len(self.tokens):
+            return ""
+        token = self.tokens[self.pos]
+        if token == "{":
+            self.pos += 1
+            return self._sequence(closing=True)
+        if token.startswith("\\"):
+            return self._atom()
+        # Plain text; tokenize() left a single character here
+        self.pos += 1
+        return token
+
+    def _optional_argument(self) -> str:
+        """Contents of [...] right after a command, or "\""""
+        if self.pos < len(self.tokens):
+            token = self.tokens[self.pos]
+            if len(token) > 1 and token[0] == "[" and token[-1] == "]":
+                self.pos += 1
+                return token[1:-1]
+        return ""
+
+    def _atom(self) -> str:
+        token = self.tokens[self.pos]
+        self.pos += 1
+
+        if token == "{":
+            return self._sequence(closing=True)
+        if token == "$":
+            return ""
+        if token == "^":
+            return _script(self._argument(), SUPERSCRIPTS, _SUPERSCRIPT_CHARS, "^")
+        if token == "_":
+            return _script(self._argument(), SUBSCRIPTS, _SUBSCRIPT_CHARS, "_")
+        if not token.startswith("\\"):
+            return token
+
+        name = token[1:]
+        if name == "frac" or name == "dfrac" or name == "tfrac":
+            numerator, denominator = self._argument(), self._argument()
+            return f"{_wrap(numerator)}/{_wrap(denominator)}"
+        if name == "sqrt":
+            index = self._optional_argument()
+            radicand = self._argument()
+            root = {"": "√", "3": "∛", "4": "∜"}.get(index)
+            if root is None:
+                root = index.translate(SUPERSCRIPTS) + "√"
+            return root + _wrap(radicand)
+        if name in TEXT_COMMANDS:
+            return self._argument()
+        if name in SYMBOLS:
+            return SYMBOLS[name]
+        # Unknown command: keep it, and a group right after it, as written
+        if self.pos < len(self.tokens) and self.tokens[self.pos] == "{":
+            self.pos += 1
+            return f"{token}{{{self._sequence(closing=True)}}}"
+        return token
+
+def _wrap(text: str) -> str:
+    """Parenthesize anything longer than a single symbol or number"""
+    text = text.strip()
+    if len(text) <= 1 or text.isalnum():
+        return text
+    return f"({text})"
+
+def _script(text: str, table: dict, allowed: set, marker: str) -> str:
+    """Unicode super/subscript when every character has one"""
+    text = text.strip()
+    if text and set(text) <= allowed:
+        return text.translate(table)
+    return f"{marker}({text})" if len(text) > 1 else f"{marker}{text}"
+
+def tokenize(latex: str) -> List[str]:
+    """Split a formula into tokens for _Parser
+
+    Plain text where an argument may start (after ^, _, a command, a
+    closing brace or [...]) has its first character split off, skipping
+    spaces, since such an argument is a single character as in TeX;
+    \\frac12 gets two.
+    """
+    tokens = []
+    pending = 0  # Characters of the next plain text read as arguments
+    for token in TOKEN_PATTERN.findall(latex):
+        first = token[0]
+        if first == "\\":
+            pending = ARGUMENT_COUNTS.get(token[1:], 1)
+        elif first in "^_}[":
+            pending = 1
+        elif first in "{$":
+            pending = 0
+        else:
+            while pending and token:
+                text = token.lstrip()
+                if len(text) < len(token):
+                    tokens.append(token[:len(token) - len(text)])
+                    token = text
+                    if not token:
+                        break
+                tokens.append(token[0])
+                token = token[1:]
+                pending -= 1
+            if token:
+                tokens.append(token)
+                pending = 0
+            continue
+        tokens.append(token)
+    return tokens
+
+@lru_cache(maxsize=1024)
+def latex_to_unicode(latex: str) -> str:
+    """Convert a TeX formula (with or without $ delimiters) to Unicode text"""
+    return " ".join(_Parser(tokenize(latex)).parse().split())
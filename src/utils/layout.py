@@ -0,0 +1,50 @@
+from typing import Any, Callable, Optional
+
+# One frame at 60 Hz
+FRAME_MS = 16
+
+class LayoutScheduler:
+    """Coalesce layout requests into at most one callback per frame
+
+    A drag-resize sends a <Configure> for every pixel, and a binding on a
+    toplevel also sees the events of all its children. request() only arms
+    a timer when none is pending, so a burst of events inside one frame
+    produces a single layout pass.
+    """
+
+    def __init__(self, widget: Any, callback: Callable[[], None], delay_ms: int = FRAME_MS):
+        self.widget = widget
+        self.callback = callback
+        self.delay_ms = delay_ms
+        self._pending: Optional[str] = None
+        self.stats = {"requests": 0, "runs": 0}
+
+    @property
+    def pending(self) -> bool:
+        return self._pending is not None
+
+    def request(self, event=None):
+        """Schedule a layout pass; usable directly as an event handler"""
+        self.stats["requests"] += 1
+        if self._pending is None:
+            self._pending = self.widget.after(self.delay_ms, self._run)
+
+    def flush(self):
+        """Run a pending layout pass now"""
+        if self._pending is not None:
+            self.widget.after_cancel(self._pending)
+            self._run()
+
+    def cancel(self):
+        """Drop a pending layout pass, e.g. before the widget is destroyed"""
+        if self._pending is not None:
+            self.widget.after_cancel(self._pending)
+            self._pending = None
+
+    def _run(self):
+        self._pending = None
+        self.stats["runs"] += 1
+        try:
+            self.callback()
+        except Exception as e:
+            print(f"Error running layout: {e}")
@@ -0,0 +1,111 @@
+import threading
+from bisect import bisect_left, bisect_right, insort
+from datetime import date
+from typing import Dict, List, Optional, Tuple
+
+from src.utils.database import Database
+from src.utils.progress_store import WriteBehindQueue
+
+DEFAULT_LEAGUE = "Bronze"
+
+def current_week(today: Optional[date] = None) -> str:
+    """ISO year-week key such as "2026-W42\""""
+    year, week, _ = (today or date.today()).isocalendar()
+    return f"{year}-W{week:02d}"
+
+class _LeagueBoard:
+    """Order-statistic view of one league's weekly XP
+
+    Keeps every member's XP in a sorted list, so a rank is one binary
+    search and an XP change is one removal plus one insertion, instead of
+    re-sorting the whole league.
+    """
+
+    def __init__(self, members: List[Tuple[int, int]]):
+        self.xp_by_user: Dict[int, int] = dict(members)
+        self.sorted_xp: List[int] = sorted(self.xp_by_user.values())
+
+    def set_xp(self, user_id: int, xp: int):
+        old = self.xp_by_user.get(user_id)
+        if old is not None:
+            del self.sorted_xp[bisect_left(self.sorted_xp, old)]
+        self.xp_by_user[user_id] = xp
+        insort(self.sorted_xp, xp)
+
+    def rank(self, user_id: int) -> int:
+        """1-based rank; users tied on XP share a rank"""
+        xp = self.xp_by_user.get(user_id, 0)
+        return len(self.sorted_xp) - bisect_right(self.sorted_xp, xp) + 1
+
+class LeagueRanking:
+    """Weekly-XP ranks of users within their league
+
+    Each (week, league) board is loaded from league_members once and then
+    maintained incrementally as XP is earned. Writes go through the
+    write-behind queue when one is given.
+    """
+
+    def __init__(self, database: Database, writer: Optional[WriteBehindQueue] = None):
+        self.pool = database.pool
+        self.writer = writer
+        self._boards: Dict[Tuple[str, str], _LeagueBoard] = {}
+        self._leagues: Dict[int, str] = {}
+        self._lock = threading.Lock()
+
+    def league_of(self, user_id: int) -> str:
+        """The user's league, carried over from their latest week"""
+        league = self._leagues.get(user_id)
+        if league is None:
+            with self.pool.connection() as conn:
+                row = conn.execute(
+                    "SELECT league FROM league_members WHERE user_id = ? ORDER BY week DESC LIMIT 1",
+                    (user_id,)
+                ).fetchone()
+            league = row[0] if row else DEFAULT_LEAGUE
+            self._leagues[user_id] = league
+        return league
+
+    def _board(self, week: str, league: str) -> _LeagueBoard:
+        """Get a league board, loading it on first use"""
+        key = (week, league)
+        board = self._boards.get(key)
+        if board is None:
+            with self.pool.connection() as conn:
+                members = conn.execute(
+                    "SELECT user_id, weekly_xp FROM league_members WHERE week = ? AND league = ?",
+                    key
+                ).fetchall()
+            board = _LeagueBoard(members)
+            # Boards from past weeks are no longer ranked against
+            self._boards = {k: b for k, b in self._boards.items() if k[0] == week}
+            self._boards[key] = board
+        return board
+
+    def add_xp(self, user_id: int, amount: int):
+        """Record XP earned this week and update the user's rank"""
+        week = current_week()
+        league = self.league_of(user_id)
+        with self._lock:
+            board = self._board(week, league)
+            weekly_xp = board.xp_by_user.get(user_id, 0) + amount
+            board.set_xp(user_id, weekly_xp)
+
+        sql = """INSERT INTO league_members (user_id, week, league, weekly_xp) VALUES (?, ?, ?, ?)
+                 ON CONFLICT(user_id, week) DO UPDATE SET weekly_xp = excluded.weekly_xp"""
+        params = (user_id, week, league, weekly_xp)
+        if self.writer:
+            self.writer.submit(sql, params, key=("league_members", user_id, week))
+        else:
+            with self.pool.connection() as conn:
+                conn.execute(sql, params)
+
+    def get_standing(self, user_id: int) -> Dict:
+        """League, rank and weekly XP in the shape SidebarWidget expects"""
+        league = self.league_of(user_id)
+        with self._lock:
+            board = self._board(current_week(), league)
+            return {
+                "league": league,
+                "rank": board.rank(user_id),
+                "xp": board.xp_by_user.get(user_id, 0)
+            }
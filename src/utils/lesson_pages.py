@@ -0,0 +1,80 @@
+"""
+Standalone HTML pages for lesson tabs.
+
+Pages are built from a lesson's tab bodies with formulas pre-rendered to
+SVG, then written once to a content-addressed cache directory so the same
+page is reused across views and sessions.
+"""
+
+import os
+from functools import lru_cache
+from typing import Dict, Tuple
+
+from src.utils.math_render import math_cache, render_math
+from src.utils.render_cache import RenderCache
+from src.utils.templates import Template
+
+PAGES_DIR = os.path.join("cache", "pages")
+
+# Page shell shared by every tab; {body} is the lesson's HTML for the tab
+PAGE_TEMPLATE = Template(r"""
+<!DOCTYPE html>
+<html>
+<head>
+    <meta charset="UTF-8">
+    <title>{title}</title>
+    <style>
+        body {
+            background-color: #2b2b2b;
+            color: #ffffff;
+            font-family: Arial, sans-serif;
+            padding: 20px;
+        }
+        .content {
+            max-width: 800px;
+            margin: 0 auto;
+        }
+        h1 { color: #58cc02; }
+        .equation { margin: 20px 0; }
+        .options {
+            margin: 20px 0;
+            padding: 20px;
+            background-color: #3b3b3b;
+            border-radius: 10px;
+        }
+    </style>
+</head>
+<body>
+    <div class="content">
+        {body}
+    </div>
+</body>
+</html>
+""")
+
+# Pages are only opened from disk, so no in-memory tier
+page_cache = RenderCache(PAGES_DIR, max_bytes=32 * 1024 * 1024, memory_entries=0, suffix=".html")
+
+@lru_cache(maxsize=64)
+def _page_shell(title: str) -> Template:
+    """PAGE_TEMPLATE with a lesson's head bound, shared by its tabs"""
+    return PAGE_TEMPLATE.bind(title=title)
+
+def build_page(content: Dict, tab_name: str, topic: str = "") -> str:
+    """Full HTML page for one tab of a lesson"""
+    return _page_shell(content.get("title", topic)).render(
+        body=render_math(content.get(tab_name, "<p>No content yet.</p>"), fmt="svg")
+    )
+
+def page_file(content: Dict, tab_name: str, topic: str = "") -> str:
+    """Path of a cached HTML file for one tab of a lesson"""
+    return page_cache.store(build_page(content, tab_name, topic).encode("utf-8"))
+
+def write_page_file(content: Dict, tab_name: str, topic: str = "") -> Tuple[str, int]:
+    """page_file(), also returning the bytes written (0 if already cached)"""
+    return page_cache.write(build_page(content, tab_name, topic).encode("utf-8"))
+
+def cleanup_caches():
+    """Drop stale pages and formula renders; call once at startup"""
+    page_cache.cleanup()
+    math_cache.cleanup()
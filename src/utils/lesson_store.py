@@ -0,0 +1,136 @@
+"""
+On-disk lesson content, one JSON file per topic.
+
+A lesson file holds the HTML bodies of a topic's tabs:
+
+    {"subject": ..., "unit": ..., "topic": ..., "title": ...,
+     "learn": "<h1>...", "practice": "...", "quiz": "..."}
+
+index.json maps "subject/unit/topic" to a file path relative to the
+lessons directory, plus a "default" lesson for topics that have none yet.
+Regenerate it with: python -m src.utils.lesson_store
+"""
+
+import json
+import os
+import threading
+from collections import OrderedDict
+from typing import Dict, Optional
+
+LESSONS_DIR = os.path.join("src", "assets", "lessons")
+INDEX_FILE = "index.json"
+LESSON_TABS = ("learn", "practice", "quiz")
+
+def lesson_key(subject: str, unit: str, topic: str) -> str:
+    return f"{subject}/{unit}/{topic}"
+
+class LessonStore:
+    """Lazily loaded lessons with an LRU of parsed files
+
+    Only the index (topic key to file path) is held for the whole catalog;
+    lesson bodies are read on first use and at most max_lessons of them
+    stay in memory.
+    """
+
+    def __init__(self, root: str = LESSONS_DIR, max_lessons: int = 32):
+        self.root = root
+        self.max_lessons = max_lessons
+        self._index: Optional[Dict[str, str]] = None
+        self._default: Optional[str] = None
+        self._lessons: "OrderedDict[str, Dict]" = OrderedDict()
+        self._lock = threading.Lock()
+
+    def _ensure_index(self):
+        # Caller holds self._lock
+        if self._index is not None:
+            return
+        try:
+            with open(os.path.join(self.root, INDEX_FILE), "r", encoding="utf-8") as f:
+                index = json.load(f)
+        except (OSError, ValueError) as e:
+            print(f"Error loading lesson index: {e}")
+            index = {}
+        self._index = index.get("lessons", {})
+        self._default = index.get("default")
+
+    def has_lesson(self, subject: str, unit: str, topic: str) -> bool:
+        """True if the topic has its own lesson file"""
+        with self._lock:
+            self._ensure_index()
+            return lesson_key(subject, unit, topic) in self._index
+
+    def get(self, subject: str, unit: str, topic: str, remember: bool = True) -> Dict:
+        """Parsed lesson for a topic, or the default lesson
+
+        remember=False leaves the LRU as it is, so a pass over the whole
+        catalog doesn't push out the lessons in use.
+        """
+        with self._lock:
+            self._ensure_index()
+            path = self._index.get(lesson_key(subject, unit, topic), self._default)
+        return self._load(path, remember)
+
+    def default(self) -> Dict:
+        """The lesson shown for topics without their own file"""
+        with self._lock:
+            self._ensure_index()
+            path = self._default
+        return self._load(path)
+
+    def _load(self, path: Optional[str], remember: bool = True) -> Dict:
+        """Parse a lesson file through the LRU"""
+        if path is None:
+            return {}
+
+        with self._lock:
+            lesson = self._lessons.get(path)
+            if lesson is not None:
+                self._lessons.move_to_end(path)
+                return lesson
+
+        try:
+            with open(os.path.join(self.root, path), "r", encoding="utf-8") as f:
+                lesson = json.load(f)
+        except (OSError, ValueError) as e:
+            print(f"Error loading lesson {path}: {e}")
+            return {}
+
+        if not remember:
+            return lesson
+        with self._lock:
+            self._lessons[path] = lesson
+            while len(self._lessons) > self.max_lessons:
+                self._lessons.popitem(last=False)
+        return lesson
+
+def build_index(root: str = LESSONS_DIR, default: Optional[str] = None) -> Dict:
+    """Scan the lesson files and write index.json"""
+    old_default = None
+    index_path = os.path.join(root, INDEX_FILE)
+    if os.path.exists(index_path):
+        with open(index_path, "r", encoding="utf-8") as f:
+            old_default = json.load(f).get("default")
+
+    lessons = {}
+    for dirpath, _, filenames in os.walk(root):
+        for filename in sorted(filenames):
+            if not filename.endswith(".json") or filename == INDEX_FILE:
+                continue
+            path = os.path.join(dirpath, filename)
+            with open(path, "r", encoding="utf-8") as f:
+                lesson = json.load(f)
+            key = lesson_key(lesson["subject"], lesson["unit"], lesson["topic"])
+            lessons[key] = os.path.relpath(path, root).replace(os.sep, "/")
+
+    index = {"default": default or old_default, "lessons": dict(sorted(lessons.items()))}
+    with open(index_path, "w", encoding="utf-8") as f:
+        json.dump(index, f, indent=2, ensure_ascii=False)
+        f.write("\n")
+    return index
+
+# Global lesson store instance
+lesson_store = LessonStore()
+
+if __name__ == "__main__":
+    index = build_index()
+    print(f"Indexed {len(index['lessons'])} lessons")
@@ -0,0 +1,145 @@
+"""
+Offline LaTeX rendering for lesson HTML.
+
+Finds $...$, $$...$$, \\(...\\) and \\[...\\] in a page and replaces each
+formula with a pre-rendered image drawn by matplotlib's mathtext, so pages
+show math instantly with no network and no JavaScript. Rendered fragments
+are kept in a RenderCache keyed by formula and render settings.
+"""
+
+import base64
+import html
+import io
+import os
+import re
+import threading
+from typing import Optional
+
+from src.utils.latex_unicode import latex_to_unicode
+from src.utils.render_cache import RenderCache
+
+try:
+    from matplotlib import rc_context
+    from matplotlib.font_manager import FontProperties
+    from matplotlib.mathtext import math_to_image
+except ImportError:  # Formulas fall back to plain text
+    math_to_image = None
+
+CACHE_DIR = os.path.join("cache", "math")
+
+# Part of every cache key; bump it when the output of _draw changes so
+# stale renders on disk are never served
+RENDER_VERSION = 2
+
+# Display math first so $$...$$ isn't read as two empty inline formulas.
+# Inline $...$ must not start or end with whitespace, nor be followed by
+# a digit, so prices such as "$5 and $10" stay plain text
+MATH_PATTERN = re.compile(
+    r"\$\$(?P<dd>.+?)\$\$"
+    r"|\\\[(?P<bd>.+?)\\\]"
+    r"|\\\((?P<bi>.+?)\\\)"
+    r"|(?<![\\$])\$(?P<di>[^\s$](?:[^$]*?[^\s$\\])?)\$(?!\d)",
+    re.DOTALL
+)
+
+# Shared by every renderer; the key covers format, size, color and DPI
+math_cache = RenderCache(CACHE_DIR)
+
+# mathtext keeps global parser state, so renders are serialized
+_render_lock = threading.Lock()
+
+class MathRenderer:
+    """Replace TeX formulas in HTML with cached, pre-rendered images
+
+    fmt="png" embeds a data-URI <img>, which tkinterweb's HtmlFrame can
+    display; fmt="svg" inlines vector markup for pages opened in a browser.
+    """
+
+    def __init__(
+        self,
+        cache: Optional[RenderCache] = None,
+        fmt: str = "png",
+        font_size: float = 16,
+        color: str = "#ffffff",
+        dpi: int = 96
+    ):
+        self.cache = cache or math_cache
+        self.fmt = fmt
+        self.font_size = font_size
+        self.color = color
+        self.dpi = dpi
+
+    def render_html(self, page: str) -> str:
+        """Return the page with every formula replaced by its rendering"""
+        return MATH_PATTERN.sub(self._replace, page)
+
+    def _replace(self, match: re.Match) -> str:
+        display = match.lastgroup in ("dd", "bd")
+        return self.render_formula(match.group(match.lastgroup).strip(), display)
+
+    def render_formula(self, tex: str, display: bool = False) -> str:
+        """HTML fragment for one formula, rendered at most once"""
+        key = RenderCache.key(
+            RENDER_VERSION, self.fmt, self.font_size, self.color, self.dpi, display, tex
+        )
+        fragment = self.cache.get_or_create(key, lambda: self._draw(tex, display))
+        if fragment is None:
+            # Not cached: matplotlib may be installed later
+            return self._fallback(tex, display)
+        return fragment.decode("utf-8")
+
+    def _draw(self, tex: str, display: bool) -> Optional[bytes]:
+        """Render with mathtext; None if unavailable or the TeX is unsupported"""
+        if math_to_image is None:
+            return None
+
+        buffer = io.BytesIO()
+        size = self.font_size * (1.2 if display else 1.0)
+        try:
+            # Transparent background, so the light glyphs show on dark pages
+            with _render_lock, rc_context({"savefig.transparent": True}):
+                depth = math_to_image(
+                    f"${tex}$",
+                    buffer,
+                    prop=FontProperties(size=size),
+                    dpi=self.dpi,
+                    format=self.fmt,
+                    color=self.color
+                )
+        except ValueError as e:
+            print(f"Error rendering formula {tex!r}: {e}")
+            return None
+
+        # Depth is in points below the baseline; align the image's baseline
+        # with the surrounding text
+        offset = depth * self.dpi / 72
+        style = f"vertical-align: -{offset:.1f}px"
+        alt = html.escape(tex, quote=True)
+
+        if self.fmt == "svg":
+            svg = buffer.getvalue().decode("utf-8")
+            svg = svg[svg.index("<svg"):]
+            image = f'<span class="math" style="display: inline-block; {style}" title="{alt}">{svg}</span>'
+        else:
+            data = base64.b64encode(buffer.getvalue()).decode("ascii")
+            image = f'<img class="math" style="{style}" alt="{alt}" src="data:image/png;base64,{data}">'
+
+        if display:
+            image = f'<div class="math-display" style="text-align: center; margin: 1em 0">{image}</div>'
+        return image.encode("utf-8")
+
+    def _fallback(self, tex: str, display: bool) -> str:
+        """Unicode approximation when the formula can't be drawn"""
+        text = html.escape(latex_to_unicode(tex))
+        if display:
+            return f'<div class="math-display" style="text-align: center">{text}</div>'
+        return f'<span class="math">{text}</span>'
+
+# Shared renderers for the app's dark pages
+math_renderer = MathRenderer()
+svg_math_renderer = MathRenderer(fmt="svg")
+
+def render_math(page: str, fmt: str = "png") -> str:
+    """Pre-render every formula in an HTML page"""
+    renderer = svg_math_renderer if fmt == "svg" else math_renderer
+    return renderer.render_html(page)
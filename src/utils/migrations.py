@@ -0,0 +1,186 @@
+"""
+Versioned schema migrations for users.db.
+
+The schema version lives in PRAGMA user_version. Each migration runs in
+its own transaction and bumps the version, so a database can be upgraded
+from any earlier release. Append new migrations; never edit shipped ones.
+"""
+
+import sqlite3
+from typing import List, Sequence, Tuple
+
+MIGRATIONS: List[Tuple[int, Tuple[str, ...]]] = [
+    (1, (
+        """CREATE TABLE IF NOT EXISTS users (
+            id INTEGER PRIMARY KEY AUTOINCREMENT,
+            email TEXT UNIQUE NOT NULL,
+            password_hash TEXT NOT NULL,
+            name TEXT,
+            created_at TIMESTAMP DEFAULT CURRENT_TIMESTAMP
+        )""",
+    )),
+    (2, (
+        """CREATE TABLE IF NOT EXISTS user_progress (
+            user_id INTEGER PRIMARY KEY REFERENCES users(id),
+            xp INTEGER NOT NULL DEFAULT 0,
+            points INTEGER NOT NULL DEFAULT 0,
+            streak INTEGER NOT NULL DEFAULT 0,
+            daily_goal INTEGER NOT NULL DEFAULT 5,
+            lessons_completed_today INTEGER NOT NULL DEFAULT 0,
+            last_activity_date TEXT NOT NULL
+        )""",
+        """CREATE TABLE IF NOT EXISTS subject_progress (
+            user_id INTEGER NOT NULL REFERENCES users(id),
+            subject TEXT NOT NULL,
+            progress REAL NOT NULL DEFAULT 0,
+            PRIMARY KEY (user_id, subject)
+        )""",
+        """CREATE TABLE IF NOT EXISTS achievements (
+            user_id INTEGER NOT NULL REFERENCES users(id),
+            name TEXT NOT NULL,
+            description TEXT,
+            icon TEXT,
+            earned_date TEXT NOT NULL,
+            PRIMARY KEY (user_id, name, earned_date)
+        )""",
+    )),
+    (3, (
+        # Email lookups are already served by the UNIQUE constraint's index.
+        # Achievements are listed per user in date order
+        "CREATE INDEX IF NOT EXISTS idx_achievements_user_date ON achievements (user_id, earned_date)",
+        # Per-subject progress across all users
+        "CREATE INDEX IF NOT EXISTS idx_subject_progress_subject ON subject_progress (subject, progress)",
+    )),
+    (4, (
+        """CREATE TABLE IF NOT EXISTS league_members (
+            user_id INTEGER NOT NULL REFERENCES users(id),
+            week TEXT NOT NULL,
+            league TEXT NOT NULL,
+            weekly_xp INTEGER NOT NULL DEFAULT 0,
+            PRIMARY KEY (user_id, week)
+        )""",
+        # Loading or counting one league's standings for a week
+        "CREATE INDEX IF NOT EXISTS idx_league_members_board ON league_members (week, league, weekly_xp)",
+    )),
+    (5, (
+        # kind: 1 = lesson completed, 2 = quiz answered, 3 = login
+        """CREATE TABLE IF NOT EXISTS learning_events (
+            id INTEGER PRIMARY KEY,
+            user_id INTEGER NOT NULL,
+            kind INTEGER NOT NULL,
+            subject TEXT,
+            topic TEXT,
+            value INTEGER NOT NULL DEFAULT 0,
+            day TEXT NOT NULL,
+            created_at INTEGER NOT NULL
+        )""",
+        "CREATE INDEX IF NOT EXISTS idx_learning_events_user_day ON learning_events (user_id, day)",
+        """CREATE TABLE IF NOT EXISTS daily_rollups (
+            user_id INTEGER NOT NULL,
+            day TEXT NOT NULL,
+            subject TEXT NOT NULL,
+            lessons INTEGER NOT NULL DEFAULT 0,
+            quiz_answers INTEGER NOT NULL DEFAULT 0,
+            quiz_correct INTEGER NOT NULL DEFAULT 0,
+            xp INTEGER NOT NULL DEFAULT 0,
+            logins INTEGER NOT NULL DEFAULT 0,
+            PRIMARY KEY (user_id, day, subject)
+        ) WITHOUT ROWID""",
+        # Keep the rollups current in the same transaction as each event
+        """CREATE TRIGGER IF NOT EXISTS trg_learning_events_rollup
+        AFTER INSERT ON learning_events
+        BEGIN
+            INSERT INTO daily_rollups (user_id, day, subject, lessons, quiz_answers, quiz_correct, xp, logins)
+            VALUES (
+                NEW.user_id,
+                NEW.day,
+                COALESCE(NEW.subject, ''),
+                NEW.kind = 1,
+                NEW.kind = 2,
+                NEW.kind = 2 AND NEW.value > 0,
+                CASE WHEN NEW.kind = 1 THEN NEW.value ELSE 0 END,
+                NEW.kind = 3
+            )
+            ON CONFLICT (user_id, day, subject) DO UPDATE SET
+                lessons = lessons + excluded.lessons,
+                quiz_answers = quiz_answers + excluded.quiz_answers,
+                quiz_correct = quiz_correct + excluded.quiz_correct,
+                xp = xp + excluded.xp,
+                logins = logins + excluded.logins;
+        END""",
+    )),
+]
+
+# Queries on the login and progress paths, with sample parameters.
+# assert_no_full_scans() should pass for every one of them.
+HOT_QUERIES: List[Tuple[str, tuple]] = [
+    ("SELECT id, email, password_hash, name FROM users WHERE email = ?", ("a@b.c",)),
+    ("SELECT 1 FROM users WHERE email = ?", ("a@b.c",)),
+    (
+        """SELECT xp, points, streak, daily_goal, lessons_completed_today, last_activity_date
+           FROM user_progress WHERE user_id = ?""",
+        (1,)
+    ),
+    ("SELECT subject, progress FROM subject_progress WHERE user_id = ?", (1,)),
+    (
+        """SELECT name, description, icon, earned_date FROM achievements
+           WHERE user_id = ? ORDER BY earned_date""",
+        (1,)
+    ),
+    ("SELECT user_id, progress FROM subject_progress WHERE subject = ?", ("Mathematics",)),
+    (
+        "SELECT league FROM league_members WHERE user_id = ? ORDER BY week DESC LIMIT 1",
+        (1,)
+    ),
+    (
+        "SELECT user_id, weekly_xp FROM league_members WHERE week = ? AND league = ?",
+        ("2026-W01", "Bronze")
+    ),
+    (
+        """SELECT day, subject, lessons, quiz_answers, quiz_correct, xp, logins FROM daily_rollups
+           WHERE user_id = ? AND day BETWEEN ? AND ? ORDER BY day, subject""",
+        (1, "2026-01-01", "2026-01-31")
+    ),
+]
+
+def schema_version(conn: sqlite3.Connection) -> int:
+    """Return the schema version stored in the database"""
+    return conn.execute("PRAGMA user_version").fetchone()[0]
+
+def migrate(conn: sqlite3.Connection) -> int:
+    """Apply all pending migrations and return the new schema version"""
+    for version, statements in MIGRATIONS:
+        if version <= schema_version(conn):
+            continue
+
+        # IMMEDIATE takes the write lock up front, so two processes
+        # starting together can't both apply the same migration
+        conn.execute("BEGIN IMMEDIATE")
+        try:
+            if version <= schema_version(conn):
+                conn.rollback()
+                continue
+            for statement in statements:
+                conn.execute(statement)
+            conn.execute(f"PRAGMA user_version = {version}")
+            conn.commit()
+        except Exception:
+            conn.rollback()
+            raise
+
+    return schema_version(conn)
+
+def query_plan(conn: sqlite3.Connection, sql: str, params: Sequence = ()) -> List[str]:
+    """Return the EXPLAIN QUERY PLAN detail lines for a query"""
+    return [row[-1] for row in conn.execute(f"EXPLAIN QUERY PLAN {sql}", params)]
+
+def assert_no_full_scans(conn: sqlite3.Connection, sql: str, params: Sequence = ()):
+    """Fail if the query plan scans a whole table or index"""
+    for detail in query_plan(conn, sql, params):
+        if detail.startswith("SCAN ") and "CONSTANT ROW" not in detail:
+            raise AssertionError(f"Full scan in query plan: {detail}\n{sql}")
+
+def check_hot_queries(conn: sqlite3.Connection):
+    """Run assert_no_full_scans() over every query in HOT_QUERIES"""
+    for sql, params in HOT_QUERIES:
+        assert_no_full_scans(conn, sql, params)
@@ -0,0 +1,122 @@
+import base64
+import hashlib
+import hmac
+import os
+from concurrent.futures import ThreadPoolExecutor
+from typing import Iterable, List, Optional
+
+class PasswordHasher:
+    """Salted scrypt password hashing on a bounded worker pool
+
+    Hashes are stored as "scrypt$n$r$p$salt$hash" so the cost parameters
+    travel with each hash and can be raised later. Bare hex SHA-256 hashes
+    from older databases still verify and are reported by needs_rehash().
+
+    hashlib.scrypt releases the GIL, so a thread pool runs hashes in
+    parallel; the pool size caps how many expensive (n * r * 128 bytes of
+    memory each) derivations run at once no matter how many logins arrive.
+
+    A bulk import can hash with a cheaper instance (smaller n). Those
+    hashes still verify, and needs_rehash() reports them, so they are
+    upgraded to this cost at each user's first login. Until then they
+    are easier to crack if the database leaks.
+    """
+
+    ALGORITHM = "scrypt"
+
+    def __init__(
+        self,
+        n: int = 2 ** 14,
+        r: int = 8,
+        p: int = 1,
+        salt_bytes: int = 16,
+        key_bytes: int = 32,
+        max_workers: Optional[int] = None
+    ):
+        self.n = n
+        self.r = r
+        self.p = p
+        self.salt_bytes = salt_bytes
+        self.key_bytes = key_bytes
+        self.executor = ThreadPoolExecutor(
+            max_workers=max_workers or min(4, os.cpu_count() or 1),
+            thread_name_prefix="kdf"
+        )
+        # Random salt and key with this hasher's cost; no password matches
+        self._dummy_hash = self._encode(os.urandom(salt_bytes), os.urandom(key_bytes))
+
+    def _derive(self, password: str, salt: bytes, n: int, r: int, p: int, key_bytes: int) -> bytes:
+        """Run scrypt with enough memory headroom for the given cost"""
+        return hashlib.scrypt(
+            password.encode(),
+            salt=salt,
+            n=n,
+            r=r,
+            p=p,
+            maxmem=128 * r * (n + p + 2) + 1024 * 1024,
+            dklen=key_bytes
+        )
+
+    def _hash(self, password: str) -> str:
+        salt = os.urandom(self.salt_bytes)
+        return self._encode(salt, self._derive(password, salt, self.n, self.r, self.p, self.key_bytes))
+
+    def _encode(self, salt: bytes, key: bytes) -> str:
+        return "$".join((
+            self.ALGORITHM,
+            str(self.n),
+            str(self.r),
+            str(self.p),
+            base64.b64encode(salt).decode(),
+            base64.b64encode(key).decode()
+        ))
+
+    def _verify(self, password: str, encoded: str) -> bool:
+        if "$" not in encoded:
+            # Legacy unsalted SHA-256 hex digest
+            legacy = hashlib.sha256(password.encode()).hexdigest()
+            return hmac.compare_digest(legacy, encoded)
+
+        try:
+            algorithm, n, r, p, salt, key = encoded.split("$")
+            if algorithm != self.ALGORITHM:
+                return False
+            expected = base64.b64decode(key)
+            actual = self._derive(
+                password, base64.b64decode(salt), int(n), int(r), int(p), len(expected)
+            )
+        except ValueError:
+            return False
+        return hmac.compare_digest(actual, expected)
+
+    def hash(self, password: str) -> str:
+        """Hash a password on the worker pool, blocking until done"""
+        return self.executor.submit(self._hash, password).result()
+
+    def verify(self, password: str, encoded: str) -> bool:
+        """Check a password against a stored hash on the worker pool"""
+        return self.executor.submit(self._verify, password, encoded).result()
+
+    def verify_dummy(self, password: str) -> bool:
+        """Spend the time of a real verify on a hash nobody has
+
+        Called when there is no user to check against, so an unknown
+        email takes as long to reject as a wrong password. Always False.
+        """
+        self.verify(password, self._dummy_hash)
+        return False
+
+    def hash_many(self, passwords: Iterable[str]) -> List[str]:
+        """Hash a batch of passwords across the whole pool"""
+        return list(self.executor.map(self._hash, passwords))
+
+    def needs_rehash(self, encoded: str) -> bool:
+        """True for legacy hashes or hashes made with other cost settings"""
+        parts = encoded.split("$")
+        if len(parts) != 6 or parts[0] != self.ALGORITHM:
+            return True
+        return (int(parts[1]), int(parts[2]), int(parts[3])) != (self.n, self.r, self.p)
+
+    def shutdown(self):
+        """Stop the worker pool"""
+        self.executor.shutdown(wait=True)
@@ -0,0 +1,127 @@
+import threading
+from collections import deque
+from typing import Any, Deque, List, Optional, Tuple
+
+from src.utils.lesson_pages import write_page_file
+from src.utils.lesson_store import LESSON_TABS, LessonStore, lesson_store
+from src.utils.observer import Observer
+
+class TopicPrefetcher(Observer):
+    """Warm the lesson caches for the topics a learner is likely to open next
+
+    On "topic_changed" the unlocked topics of the current unit are loaded
+    and rendered on a worker thread, so their lesson file, formula images
+    and HTML pages are already cached when clicked. Loaded lessons are
+    also added to the search index. Each navigation starts a new
+    generation; work queued for an older one is dropped. Prefetching for
+    one navigation stops once write_budget bytes of new page files have
+    been written; pages already in the cache cost nothing.
+    """
+
+    def __init__(
+        self,
+        controller,
+        lessons: Optional[LessonStore] = None,
+        max_topics: int = 3,
+        write_budget: int = 4 * 1024 * 1024,
+        delay: float = 0.25
+    ):
+        self.controller = controller
+        self.lessons = lessons or lesson_store
+        self.max_topics = max_topics
+        self.write_budget = write_budget
+        self.delay = delay
+        self.generation = 0
+        # Updated from both threads under _cond
+        self.stats = {"prefetched": 0, "cancelled": 0, "over_budget": 0}
+        self._queue: Deque[Tuple[int, str, str, str]] = deque()
+        self._cond = threading.Condition()
+        self._stopped = False
+        self._thread = threading.Thread(target=self._run, name="topic-prefetch", daemon=True)
+        self._thread.start()
+
+    def update(self, event_type: str, data: Any):
+        if event_type == "topic_changed":
+            self.prefetch(self.predict())
+        elif event_type in ("subject_changed", "unit_changed"):
+            self.cancel()
+
+    def predict(self) -> List[str]:
+        """Unlocked topics worth warming: the ones after the current, then before"""
+        unit = self.controller.get_current_unit()
+        current = self.controller.current_topic
+        if not unit or not current:
+            return []
+
+        names = [topic.name for topic in unit.topics]
+        start = names.index(current) + 1 if current in names else 0
+        ahead = unit.topics[start:]
+        behind = [t for t in unit.topics[:start] if t.name != current]
+
+        # Locked topics can't be opened next, so aren't worth warming
+        ordered = [t for t in ahead + behind if not t.is_locked]
+        return [topic.name for topic in ordered[:self.max_topics]]
+
+    def prefetch(self, topics: List[str]):
+        """Replace any pending work with these topics of the current unit"""
+        subject = self.controller.current_subject
+        unit = self.controller.get_current_unit()
+        with self._cond:
+            self.generation += 1
+            if self._queue:
+                self.stats["cancelled"] += len(self._queue)
+                self._queue.clear()
+            if subject and unit:
+                for topic in topics:
+                    self._queue.append((self.generation, subject, unit.name, topic))
+            self._cond.notify()
+
+    def cancel(self):
+        """Drop pending prefetches after navigating away"""
+        self.prefetch([])
+
+    def close(self):
+        """Stop the worker thread"""
+        with self._cond:
+            self._stopped = True
+            self._queue.clear()
+            self._cond.notify()
+        self._thread.join()
+
+    def _is_current(self, generation: int) -> bool:
+        return generation == self.generation and not self._stopped
+
+    def _run(self):
+        spent = 0
+        spent_generation = 0
+        while True:
+            with self._cond:
+                while not self._queue and not self._stopped:
+                    self._cond.wait()
+                if self._stopped:
+                    return
+                generation = self._queue[0][0]
+                if generation != spent_generation:
+                    # Let the page the learner just opened render first
+                    self._cond.wait(self.delay)
+                    spent, spent_generation = 0, generation
+                    continue  # Navigation may have moved on meanwhile
+                _, subject, unit, topic = self._queue.popleft()
+
+            if spent >= self.write_budget:
+                with self._cond:
+                    self.stats["over_budget"] += 1
+                continue
+
+            try:
+                content = self.lessons.get(subject, unit, topic)
+                self.controller.index_lesson(subject, unit, topic, content)
+                for tab_name in LESSON_TABS:
+                    if not self._is_current(generation):
+                        break
+                    spent += write_page_file(content, tab_name, topic)[1]
+                else:
+                    with self._cond:
+                        self.stats["prefetched"] += 1
+            except Exception as e:
+                print(f"Error prefetching {topic}: {e}")
@@ -0,0 +1,203 @@
+import itertools
+import threading
+from datetime import date, datetime
+from typing import Any, Dict, Tuple
+
+from src.models.user import Achievement, UserProgress
+from src.utils.database import ConnectionPool, Database
+
+class WriteBehindQueue:
+    """Buffer SQL writes and commit them in batches on a background thread
+
+    Writes submitted with a key replace any pending write with the same key,
+    so repeated snapshots of the same row collapse into one statement. A
+    batch is committed every `flush_interval` seconds, or as soon as
+    `max_batch` writes are pending. If a batch fails, its statements are
+    retried one at a time so a bad one can't hold back the rest; a
+    statement that fails `max_retries` times is dropped and logged.
+    """
+
+    def __init__(
+        self,
+        pool: ConnectionPool,
+        flush_interval: float = 2.0,
+        max_batch: int = 100,
+        max_retries: int = 3
+    ):
+        self.pool = pool
+        self.flush_interval = flush_interval
+        self.max_batch = max_batch
+        self.max_retries = max_retries
+        self.dropped = 0
+        self._pending: Dict[Any, Tuple[str, tuple]] = {}
+        self._failures: Dict[Any, int] = {}  # Failed attempts per pending key
+        self._sequence = itertools.count()
+        self._cond = threading.Condition()
+        self._write_lock = threading.Lock()  # Keeps batches in submit order
+        self._closed = False
+        self._thread = threading.Thread(target=self._run, name="write-behind", daemon=True)
+        self._thread.start()
+
+    def submit(self, sql: str, params: tuple = (), key: Any = None):
+        """Queue a write; keyed writes coalesce with earlier ones"""
+        with self._cond:
+            if self._closed:
+                raise RuntimeError("Write-behind queue is closed")
+            if key is None:
+                key = ("append", next(self._sequence))
+            self._pending[key] = (sql, params)
+            self._failures.pop(key, None)  # A newer write starts afresh
+            if len(self._pending) >= self.max_batch:
+                self._cond.notify()
+
+    def flush(self):
+        """Commit everything queued so far on the calling thread"""
+        with self._write_lock:
+            with self._cond:
+                batch, self._pending = self._pending, {}
+            self._write(batch)
+
+    def close(self):
+        """Stop the flusher thread after committing pending writes"""
+        with self._cond:
+            if self._closed:
+                return
+            self._closed = True
+            self._cond.notify()
+        self._thread.join()
+        # Give writes that are being retried their remaining attempts
+        for _ in range(self.max_retries):
+            self.flush()
+            if not self._pending:
+                break
+
+    def _run(self):
+        """Flusher thread main loop"""
+        while True:
+            with self._cond:
+                self._cond.wait_for(
+                    lambda: self._closed or len(self._pending) >= self.max_batch,
+                    timeout=self.flush_interval
+                )
+                closed = self._closed
+            self.flush()
+            if closed:
+                return
+
+    def _write(self, batch: Dict[Any, Tuple[str, tuple]]):
+        """Commit one batch in a single transaction"""
+        if not batch:
+            return
+        try:
+            with self.pool.connection() as conn:
+                for sql, params in batch.values():
+                    conn.execute(sql, params)
+        except Exception as e:
+            print(f"Error flushing writes, retrying one by one: {e}")
+            self._write_each(batch)
+            return
+        with self._cond:
+            for key in batch:
+                self._failures.pop(key, None)
+
+    def _write_each(self, batch: Dict[Any, Tuple[str, tuple]]):
+        """Commit each write on its own, requeueing or dropping failures"""
+        for key, (sql, params) in batch.items():
+            try:
+                with self.pool.connection() as conn:
+                    conn.execute(sql, params)
+            except Exception as e:
+                with self._cond:
+                    failures = self._failures.get(key, 0) + 1
+                    if failures >= self.max_retries:
+                        self._failures.pop(key, None)
+                        self.dropped += 1
+                        print(f"Dropping write after {failures} failed attempts: {e} ({sql.split()[0]} {params})")
+                    elif key not in self._pending:
+                        # Put it back without clobbering anything newer
+                        self._failures[key] = failures
+                        self._pending[key] = (sql, params)
+                continue
+            with self._cond:
+                self._failures.pop(key, None)
+
+class ProgressStore:
+    """Load and persist UserProgress through a write-behind queue"""
+
+    def __init__(self, database: Database, flush_interval: float = 2.0, max_batch: int = 100):
+        self.pool = database.pool
+        self.writer = WriteBehindQueue(self.pool, flush_interval, max_batch)
+
+    def load(self, user_id: int) -> UserProgress:
+        """Load a user's progress, or a fresh UserProgress if none is stored"""
+        # Make sure queued writes are visible before reading back
+        self.writer.flush()
+
+        with self.pool.connection() as conn:
+            row = conn.execute(
+                """SELECT xp, points, streak, daily_goal, lessons_completed_today, last_activity_date
+                   FROM user_progress WHERE user_id = ?""",
+                (user_id,)
+            ).fetchone()
+            subjects = conn.execute(
+                "SELECT subject, progress FROM subject_progress WHERE user_id = ?",
+                (user_id,)
+            ).fetchall()
+            achievements = conn.execute(
+                """SELECT name, description, icon, earned_date FROM achievements
+                   WHERE user_id = ? ORDER BY earned_date""",
+                (user_id,)
+            ).fetchall()
+
+        progress = UserProgress()
+        if row:
+            progress.xp, progress.points, progress.streak = row[0], row[1], row[2]
+            progress.daily_goal, progress.lessons_completed_today = row[3], row[4]
+            progress.last_activity_date = date.fromisoformat(row[5])
+        progress.subject_progress = dict(subjects)
+        progress.achievements = [
+            Achievement(name, description, icon, datetime.fromisoformat(earned_date))
+            for name, description, icon, earned_date in achievements
+        ]
+        return progress
+
+    def save(self, user_id: int, progress: UserProgress):
+        """Queue a snapshot of a user's progress for writing"""
+        self.writer.submit(
+            """INSERT INTO user_progress
+                   (user_id, xp, points, streak, daily_goal, lessons_completed_today, last_activity_date)
+               VALUES (?, ?, ?, ?, ?, ?, ?)
+               ON CONFLICT(user_id) DO UPDATE SET
+                   xp = excluded.xp,
+                   points = excluded.points,
+                   streak = excluded.streak,
+                   daily_goal = excluded.daily_goal,
+                   lessons_completed_today = excluded.lessons_completed_today,
+                   last_activity_date = excluded.last_activity_date""",
+            (
+                user_id, progress.xp, progress.points, progress.streak, progress.daily_goal,
+                progress.lessons_completed_today, progress.last_activity_date.isoformat()
+            ),
+            key=("user_progress", user_id)
+        )
+
+        for subject, value in progress.subject_progress.items():
+            self.writer.submit(
+                """INSERT INTO subject_progress (user_id, subject, progress) VALUES (?, ?, ?)
+                   ON CONFLICT(user_id, subject) DO UPDATE SET progress = excluded.progress""",
+                (user_id, subject, value),
+                key=("subject_progress", user_id, subject)
+            )
+
+        for achievement in progress.achievements:
+            earned_date = achievement.earned_date.isoformat()
+            self.writer.submit(
+                """INSERT OR IGNORE INTO achievements (user_id, name, description, icon, earned_date)
+                   VALUES (?, ?, ?, ?, ?)""",
+                (user_id, achievement.name, achievement.description, achievement.icon, earned_date),
+                key=("achievements", user_id, achievement.name, earned_date)
+            )
+
+    def close(self):
+        """Flush pending progress and stop the background writer"""
+        self.writer.close()
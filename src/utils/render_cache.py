@@ -0,0 +1,207 @@
+import hashlib
+import os
+import threading
+import time
+from collections import OrderedDict
+from typing import Callable, Dict, Optional, Tuple
+
+class RenderCache:
+    """Content-addressed cache of rendered output, in memory and on disk
+
+    Entries are keyed by a hash of everything that affects the render.
+    A small in-memory LRU sits in front of a directory of files; the
+    directory is capped in bytes and evicts least recently used files,
+    using each file's mtime as its last use. Files are written to a
+    temporary name and renamed into place, so concurrent writers (threads
+    or other app instances) never expose a partial entry.
+    """
+
+    def __init__(
+        self,
+        cache_dir: str,
+        max_bytes: int = 64 * 1024 * 1024,
+        memory_entries: int = 256,
+        suffix: str = ""
+    ):
+        self.cache_dir = cache_dir
+        self.max_bytes = max_bytes
+        self.memory_entries = memory_entries
+        self.suffix = suffix
+        self._memory: "OrderedDict[str, bytes]" = OrderedDict()
+        self._disk_bytes: Optional[int] = None
+        self._lock = threading.Lock()
+        self._key_locks: Dict[str, threading.Lock] = {}
+        self.stats = {"memory_hits": 0, "disk_hits": 0, "misses": 0, "evictions": 0}
+
+    @staticmethod
+    def key(*parts) -> str:
+        """Hash the render inputs into a cache key"""
+        return hashlib.sha256("\x1f".join(map(str, parts)).encode("utf-8")).hexdigest()
+
+    def _path(self, key: str) -> str:
+        return os.path.join(self.cache_dir, key + self.suffix)
+
+    def _remember(self, key: str, data: bytes):
+        # Caller holds self._lock
+        self._memory[key] = data
+        self._memory.move_to_end(key)
+        while len(self._memory) > self.memory_entries:
+            self._memory.popitem(last=False)
+
+    def get(self, key: str) -> Optional[bytes]:
+        """Cached bytes for a key, or None"""
+        with self._lock:
+            data = self._memory.get(key)
+            if data is not None:
+                self._memory.move_to_end(key)
+                self.stats["memory_hits"] += 1
+                return data
+
+        path = self._path(key)
+        try:
+            with open(path, "rb") as f:
+                data = f.read()
+            os.utime(path)  # Mark as recently used
+        except OSError:
+            with self._lock:
+                self.stats["misses"] += 1
+            return None
+
+        with self._lock:
+            self.stats["disk_hits"] += 1
+            self._remember(key, data)
+        return data
+
+    def put(self, key: str, data: bytes):
+        """Store bytes under a key in both tiers"""
+        with self._lock:
+            self._remember(key, data)
+
+        path = self._path(key)
+        tmp_path = f"{path}.{os.getpid()}.{threading.get_ident()}.tmp"
+        try:
+            os.makedirs(self.cache_dir, exist_ok=True)
+            with open(tmp_path, "wb") as f:
+                f.write(data)
+            try:
+                old_size = os.path.getsize(path)  # Overwritten, not added
+            except OSError:
+                old_size = 0
+            os.replace(tmp_path, path)
+        except OSError as e:
+            print(f"Error writing render cache: {e}")
+            return
+
+        with self._lock:
+            if self._disk_bytes is not None:
+                self._disk_bytes += len(data) - old_size
+            over = self._disk_bytes is None or self._disk_bytes > self.max_bytes
+        if over:
+            self._evict()
+
+    def get_or_create(self, key: str, create: Callable[[], Optional[bytes]]) -> Optional[bytes]:
+        """Cached bytes, rendering them with create() at most once per key
+
+        Concurrent callers for the same key wait for the first render
+        instead of repeating it. A None result is returned but not cached.
+        """
+        data = self.get(key)
+        if data is not None:
+            return data
+
+        with self._lock:
+            key_lock = self._key_locks.setdefault(key, threading.Lock())
+        with key_lock:
+            data = self.get(key)
+            if data is None:
+                data = create()
+                if data is not None:
+                    self.put(key, data)
+        with self._lock:
+            self._key_locks.pop(key, None)
+        return data
+
+    def store(self, data: bytes) -> str:
+        """Write bytes under their own hash and return the file's path
+
+        For consumers that need a real file, such as a page opened in a
+        browser. Identical content maps to the same file, which is written
+        once and reused across views and sessions.
+        """
+        return self.write(data)[0]
+
+    def write(self, data: bytes) -> Tuple[str, int]:
+        """Like store(), also returning how many bytes had to be written
+
+        The count is 0 when the file was already cached.
+        """
+        key = hashlib.sha256(data).hexdigest()
+        path = self._path(key)
+        try:
+            os.utime(path)  # Already cached; mark as recently used
+            with self._lock:
+                self.stats["disk_hits"] += 1
+            written = 0
+        except OSError:
+            with self._lock:
+                self.stats["misses"] += 1
+            self.put(key, data)
+            written = len(data)
+        return os.path.abspath(path), written
+
+    def cleanup(self, max_age: float = 30 * 24 * 3600):
+        """Remove abandoned temp files and entries unused for max_age seconds
+
+        Meant to run once at startup; also enforces the size cap.
+        """
+        now = time.time()
+        try:
+            entries = list(os.scandir(self.cache_dir))
+        except OSError:
+            return  # Nothing cached yet
+        for entry in entries:
+            try:
+                if not entry.is_file():
+                    continue
+                age = now - entry.stat().st_mtime
+                # Temp files younger than an hour may belong to another
+                # instance that is still writing them
+                if age > max_age or (entry.name.endswith(".tmp") and age > 3600):
+                    os.unlink(entry.path)
+            except OSError:
+                continue
+        self._evict()
+
+    def _evict(self):
+        """Delete least recently used files until the directory fits"""
+        try:
+            entries = []
+            for entry in os.scandir(self.cache_dir):
+                if entry.is_file() and not entry.name.endswith(".tmp"):
+                    stat = entry.stat()
+                    entries.append((stat.st_mtime, stat.st_size, entry.path))
+        except OSError as e:
+            print(f"Error scanning render cache: {e}")
+            return
+
+        total = sum(size for _, size, _ in entries)
+        entries.sort()
+        evicted = 0
+        for _, size, path in entries:
+            if total <= self.max_bytes:
+                break
+            try:
+                os.unlink(path)
+            except OSError:
+                continue  # Already removed by another process
+            total -= size
+            evicted += 1
+
+        with self._lock:
+            self._disk_bytes = total
+            self.stats["evictions"] += evicted
+
+    def clear_memory(self):
+        """Drop the in-memory tier; disk entries are kept"""
+        with self._lock:
+            self._memory.clear()
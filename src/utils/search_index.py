@@ -0,0 +1,142 @@
+"""
+In-process full-text search over the catalog and lesson bodies.
+
+An inverted index maps each term to the documents containing it, with
+per-field weighted term counts. Query terms match as prefixes through a
+sorted term list, and results are ranked by tf-idf with a bonus for
+exact matches. Very short words only match exactly, and a prefix expands
+to at most MAX_EXPANSIONS terms, so a query's cost doesn't grow with the
+vocabulary. Documents can be added or replaced at any time; new terms
+are inserted into the sorted list in place, so lesson bodies can be
+indexed in the background while searches run.
+"""
+
+import heapq
+import math
+import re
+import threading
+from bisect import bisect_left, insort
+from typing import Dict, Hashable, List, Optional, Tuple
+
+WORD_PATTERN = re.compile(r"[^\W_]+")
+MARKUP_PATTERN = re.compile(r"<[^>]*>|\\[A-Za-z]+|&\w+;")
+
+# Field weights: a hit in a title counts more than one in the body
+FIELD_WEIGHTS = {"title": 3.0, "context": 1.5, "body": 1.0}
+
+# Shorter query words are not expanded as prefixes
+MIN_PREFIX = 2
+# Most terms one prefix may expand to; the most widely used are kept
+MAX_EXPANSIONS = 50
+
+def tokenize(text: str) -> List[str]:
+    """Lower-cased words with HTML tags and TeX commands removed"""
+    return WORD_PATTERN.findall(MARKUP_PATTERN.sub(" ", text).lower())
+
+class SearchIndex:
+    """Inverted index with prefix matching and tf-idf ranking"""
+
+    def __init__(self):
+        self._postings: Dict[str, Dict[Hashable, float]] = {}
+        self._doc_terms: Dict[Hashable, Tuple[str, ...]] = {}
+        self._meta: Dict[Hashable, Dict] = {}
+        self._sorted_terms: List[str] = []  # Kept sorted for prefix lookups
+        self._lock = threading.Lock()
+
+    def __len__(self) -> int:
+        return len(self._meta)
+
+    def add(self, doc_id: Hashable, fields: Dict[str, str], meta: Optional[Dict] = None):
+        """Index a document, replacing any earlier version with the same id"""
+        weights: Dict[str, float] = {}
+        for field, text in fields.items():
+            weight = FIELD_WEIGHTS.get(field, 1.0)
+            for term in tokenize(text):
+                weights[term] = weights.get(term, 0.0) + weight
+
+        with self._lock:
+            self._remove(doc_id)
+            for term, weight in weights.items():
+                postings = self._postings.get(term)
+                if postings is None:
+                    postings = self._postings[term] = {}
+                    insort(self._sorted_terms, term)
+                postings[doc_id] = weight
+            self._doc_terms[doc_id] = tuple(weights)
+            self._meta[doc_id] = meta or {}
+
+    def remove(self, doc_id: Hashable):
+        """Drop a document from the index"""
+        with self._lock:
+            self._remove(doc_id)
+
+    def _remove(self, doc_id: Hashable):
+        # Caller holds self._lock
+        for term in self._doc_terms.pop(doc_id, ()):
+            postings = self._postings[term]
+            del postings[doc_id]
+            if not postings:
+                del self._postings[term]
+                del self._sorted_terms[bisect_left(self._sorted_terms, term)]
+        self._meta.pop(doc_id, None)
+
+    def _expand(self, prefix: str) -> List[str]:
+        """Indexed terms starting with prefix, capped at MAX_EXPANSIONS"""
+        if len(prefix) < MIN_PREFIX:
+            return [prefix] if prefix in self._postings else []
+
+        # Caller holds self._lock
+        terms = self._sorted_terms
+        matches = []
+        i = bisect_left(terms, prefix)
+        while i < len(terms) and terms[i].startswith(prefix):
+            matches.append(terms[i])
+            i += 1
+        if len(matches) > MAX_EXPANSIONS:
+            # Keep the exact word and the terms found in the most documents
+            postings = self._postings
+            matches = heapq.nlargest(
+                MAX_EXPANSIONS,
+                matches,
+                key=lambda term: (term == prefix, len(postings[term]))
+            )
+        return matches
+
+    def search(self, query: str, limit: int = 10) -> List[Dict]:
+        """Documents matching every query word (as a prefix), best first"""
+        words = tokenize(query)
+        if not words:
+            return []
+
+        with self._lock:
+            total = len(self._meta)
+            scores: Optional[Dict[Hashable, float]] = None
+            for word in dict.fromkeys(words):
+                word_scores: Dict[Hashable, float] = {}
+                for term in self._expand(word):
+                    postings = self._postings[term]
+                    idf = math.log(1 + total / len(postings))
+                    # Completions score a little below the exact word
+                    factor = idf * (1.0 if term == word else 0.8)
+                    if not word_scores:
+                        # First term: nothing to compare against yet
+                        word_scores = {doc_id: weight * factor for doc_id, weight in postings.items()}
+                        continue
+                    for doc_id, weight in postings.items():
+                        score = weight * factor
+                        if score > word_scores.get(doc_id, 0.0):
+                            word_scores[doc_id] = score
+
+                if scores is None:
+                    scores = word_scores
+                else:
+                    scores = {
+                        doc_id: score + word_scores[doc_id]
+                        for doc_id, score in scores.items()
+                        if doc_id in word_scores
+                    }
+                if not scores:
+                    return []
+
+            ranked = heapq.nlargest(limit, scores, key=scores.__getitem__)
+            return [dict(self._meta[doc_id], score=scores[doc_id]) for doc_id in ranked]
@@ -0,0 +1,69 @@
+"""
+Precompiled HTML templates.
+
+A template is parsed once into static chunks and {name} slots. Only
+{word} with no spaces is a slot, so CSS rules like "body { color: red }"
+need no brace escaping. Values can be bound ahead of time, which merges
+them into the static chunks and leaves less to do on every render.
+"""
+
+import io
+import re
+from typing import List, TextIO, Tuple, Union
+
+SLOT_PATTERN = re.compile(r"\{(\w+)\}")
+
+class Slot(str):
+    """Marks a chunk as a slot name rather than static text"""
+
+class Template:
+    """Static chunks and slots, rendered by streaming into a buffer"""
+
+    def __init__(self, source: str = "", chunks: List[Union[str, Slot]] = None):
+        if chunks is None:
+            chunks = []
+            pos = 0
+            for match in SLOT_PATTERN.finditer(source):
+                chunks.append(source[pos:match.start()])
+                chunks.append(Slot(match.group(1)))
+                pos = match.end()
+            chunks.append(source[pos:])
+        self.chunks = _merge_static(chunks)
+        self.slots: Tuple[str, ...] = tuple(
+            dict.fromkeys(chunk for chunk in self.chunks if isinstance(chunk, Slot))
+        )
+
+    def bind(self, **values) -> "Template":
+        """New template with some slots filled in and folded into static text"""
+        return Template(chunks=[
+            str(values[chunk]) if isinstance(chunk, Slot) and chunk in values else chunk
+            for chunk in self.chunks
+        ])
+
+    def render_to(self, out: TextIO, **values):
+        """Write the rendered template to a file-like object"""
+        write = out.write
+        for chunk in self.chunks:
+            if isinstance(chunk, Slot):
+                write(str(values[chunk]))
+            else:
+                write(chunk)
+
+    def render(self, **values) -> str:
+        """Render the template to a string"""
+        out = io.StringIO()
+        self.render_to(out, **values)
+        return out.getvalue()
+
+def _merge_static(chunks: List[Union[str, Slot]]) -> List[Union[str, Slot]]:
+    """Join neighbouring static chunks and drop empty ones"""
+    merged: List[Union[str, Slot]] = []
+    for chunk in chunks:
+        if isinstance(chunk, Slot):
+            merged.append(chunk)
+        elif chunk:
+            if merged and not isinstance(merged[-1], Slot):
+                merged[-1] = merged[-1] + chunk
+            else:
+                merged.append(chunk)
+    return merged
@@ -0,0 +1,141 @@
+import hashlib
+import math
+import threading
+import time
+from collections import OrderedDict
+from typing import Dict, Iterable, Optional, Tuple
+
+class BloomFilter:
+    """Fixed-size Bloom filter over strings"""
+
+    def __init__(self, capacity: int = 100_000, error_rate: float = 0.01):
+        self.capacity = capacity
+        self.size = max(8, int(-capacity * math.log(error_rate) / math.log(2) ** 2))
+        self.hashes = max(1, round(self.size / capacity * math.log(2)))
+        self.bits = bytearray((self.size + 7) // 8)
+        self.count = 0
+
+    def _positions(self, item: str):
+        # Double hashing: k positions from two 64-bit halves of one digest
+        digest = hashlib.blake2b(item.encode(), digest_size=16).digest()
+        h1 = int.from_bytes(digest[:8], "little")
+        h2 = int.from_bytes(digest[8:], "little") | 1
+        for i in range(self.hashes):
+            yield (h1 + i * h2) % self.size
+
+    def add(self, item: str):
+        for pos in self._positions(item):
+            self.bits[pos >> 3] |= 1 << (pos & 7)
+        self.count += 1
+
+    def __contains__(self, item: str) -> bool:
+        return all(self.bits[pos >> 3] & (1 << (pos & 7)) for pos in self._positions(item))
+
+    @property
+    def saturated(self) -> bool:
+        """True once more items were added than the filter was sized for"""
+        return self.count > self.capacity
+
+class UserCache:
+    """Read-through cache of user rows keyed by email
+
+    Rows live in an LRU with a TTL; emails with no account are cached as
+    negative entries with a shorter TTL. A Bloom filter over all registered
+    emails answers most "is this email free?" questions without a query.
+
+    The Bloom filter only ever speeds up the signup check: another process
+    may register an email this one hasn't seen, and that case is still
+    caught by the UNIQUE constraint when the account is created.
+    """
+
+    def __init__(self, max_entries: int = 10_000, ttl: float = 300.0, negative_ttl: float = 30.0):
+        self.max_entries = max_entries
+        self.ttl = ttl
+        self.negative_ttl = negative_ttl
+        self._entries: "OrderedDict[str, Tuple[float, Optional[tuple]]]" = OrderedDict()
+        self._bloom: Optional[BloomFilter] = None
+        self._lock = threading.Lock()
+        self.stats = {
+            "hits": 0,
+            "negative_hits": 0,
+            "misses": 0,
+            "evictions": 0,
+            "bloom_rejects": 0,
+        }
+
+    def load_emails(self, emails: Iterable[str], count: int):
+        """(Re)build the Bloom filter from every registered email"""
+        bloom = BloomFilter(capacity=max(100_000, count * 2))
+        for email in emails:
+            bloom.add(email)
+        with self._lock:
+            self._bloom = bloom
+
+    @property
+    def bloom_ready(self) -> bool:
+        return self._bloom is not None
+
+    def get(self, email: str) -> Tuple[bool, Optional[tuple]]:
+        """Return (found, row); row is None for a cached negative entry"""
+        with self._lock:
+            entry = self._entries.get(email)
+            if entry is None or entry[0] < time.monotonic():
+                if entry is not None:
+                    del self._entries[email]
+                self.stats["misses"] += 1
+                return False, None
+            self._entries.move_to_end(email)
+            self.stats["hits" if entry[1] is not None else "negative_hits"] += 1
+            return True, entry[1]
+
+    def put(self, email: str, row: Optional[tuple]):
+        """Cache a row, or None to remember that the email has no account"""
+        ttl = self.ttl if row is not None else self.negative_ttl
+        with self._lock:
+            self._entries[email] = (time.monotonic() + ttl, row)
+            self._entries.move_to_end(email)
+            while len(self._entries) > self.max_entries:
+                self._entries.popitem(last=False)
+                self.stats["evictions"] += 1
+
+    def invalidate(self, email: str):
+        """Drop any cached entry for an email after it was written"""
+        with self._lock:
+            self._entries.pop(email, None)
+
+    def registered(self, email: str):
+        """Note a newly created account"""
+        with self._lock:
+            self._entries.pop(email, None)
+            if self._bloom is not None:
+                self._bloom.add(email)
+
+    def exists_hint(self, email: str) -> Optional[bool]:
+        """Answer "does this email have an account?" from memory if possible
+
+        False when the Bloom filter rules the email out, True for a fresh
+        cached row, None when only the database can tell.
+        """
+        with self._lock:
+            if self._bloom is not None and email not in self._bloom:
+                self.stats["bloom_rejects"] += 1
+                return False
+            entry = self._entries.get(email)
+            if entry is not None and entry[0] >= time.monotonic() and entry[1] is not None:
+                self.stats["hits"] += 1
+                return True
+            return None
+
+    @property
+    def needs_reload(self) -> bool:
+        """True when the Bloom filter has outgrown its size"""
+        return self._bloom is not None and self._bloom.saturated
+
+    def metrics(self) -> Dict[str, float]:
+        """Counters plus current size and hit rate"""
+        with self._lock:
+            metrics = dict(self.stats)
+            metrics["size"] = len(self._entries)
+        lookups = metrics["hits"] + metrics["negative_hits"] + metrics["misses"]
+        metrics["hit_rate"] = (metrics["hits"] + metrics["negative_hits"]) / lookups if lookups else 0.0
+        return metrics
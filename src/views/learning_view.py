@@ -1,12 +1,19 @@
+import time
 import customtkinter as ctk
-from tkinterweb import HtmlFrame
+from src.views.widgets.latex_viewer import LaTeXViewer
+
+# Practice solutions, revealed one at a time without reloading the page
+PRACTICE_SOLUTIONS = {
+    "solution1": "Solution: $x = -2$ or $x = -3$",
+    "solution2": "Solution: $x = 3$ or $x = \\frac{1}{2}$",
+}
 
 class LearningView(ctk.CTkFrame):
     def __init__(self, master, **kwargs):
         super().__init__(master, fg_color="transparent", **kwargs)
         
         # Create tabs for different learning modes
-        self.tab_view = ctk.CTkTabview(self)
+        self.tab_view = ctk.CTkTabview(self, command=self._on_tab_changed)
         self.tab_view.pack(fill="both", expand=True)
         
         # Add tabs
@@ -14,66 +21,51 @@ class LearningView(ctk.CTkFrame):
         self.tab_view.add("Practice")
         self.tab_view.add("Quiz")
         
-        # Learn tab content
-        learn_frame = ctk.CTkFrame(self.tab_view.tab("Learn"), fg_color="transparent")
-        learn_frame.pack(fill="both", expand=True, padx=20, pady=20)
-        
-        learn_label = ctk.CTkLabel(
-            learn_frame,
-            text="Learning content will appear here",
-            font=("Helvetica", 16)
-        )
-        learn_label.pack(pady=20)
-        
-        # Practice tab content
-        practice_frame = ctk.CTkFrame(self.tab_view.tab("Practice"), fg_color="transparent")
-        practice_frame.pack(fill="both", expand=True, padx=20, pady=20)
-        
-        practice_label = ctk.CTkLabel(
-            practice_frame,
-            text="Practice problems will appear here",
-            font=("Helvetica", 16)
-        )
-        practice_label.pack(pady=20)
-        
-        # Quiz tab content
-        quiz_frame = ctk.CTkFrame(self.tab_view.tab("Quiz"), fg_color="transparent")
-        quiz_frame.pack(fill="both", expand=True, padx=20, pady=20)
-        
-        quiz_label = ctk.CTkLabel(
-            quiz_frame,
-            text="Quiz questions will appear here",
-            font=("Helvetica", 16)
-        )
-        quiz_label.pack(pady=20)
+        # Tabs are built on first activation
+        self.build_times = {}  # Tab name -> build time in ms
+        self._tab_builders = {
+            "Learn": ("Learning content will appear here", self.show_sample_content),
+            "Practice": ("Practice problems will appear here", self.show_practice_content),
+            "Quiz": ("Quiz questions will appear here", self.show_quiz_content),
+        }
+        self._tab_controls = {"Practice": self._build_solution_buttons}
+        self._shown_tab = None  # Tab whose content is in the viewer
+        self.revealed = set()  # Practice solutions the learner has opened
         
         # Content viewer with LaTeX support
         self.content_frame = ctk.CTkFrame(self, fg_color="#2a2b30")
         self.content_frame.pack(fill="both", expand=True)
         
-        self.html_viewer = HtmlFrame(self.content_frame)
-        self.html_viewer.pack(fill="both", expand=True, padx=20, pady=20)
-        
-        # Load MathJax for LaTeX rendering
-        self.load_mathjax()
+        self.viewer = LaTeXViewer(self.content_frame)
+        self.viewer.pack(fill="both", expand=True)
         
         # Show initial content
-        self.show_sample_content()
+        self._on_tab_changed()
     
-    def load_mathjax(self):
-        """Load MathJax configuration for LaTeX rendering"""
-        mathjax_config = """
-        <script>
-        MathJax = {
-            tex: {
-                inlineMath: [['$', '$'], ['\\\\(', '\\\\)']],
-                displayMath: [['$$', '$$'], ['\\\\[', '\\\\]']]
-            }
-        };
-        </script>
-        <script src="https://cdn.jsdelivr.net/npm/mathjax@3/es5/tex-mml-chtml.js"></script>
-        """
-        self.html_viewer.add_html(mathjax_config)
+    def _on_tab_changed(self):
+        """Build the selected tab on first use and show its content"""
+        tab_name = self.tab_view.get()
+        if tab_name == self._shown_tab:
+            return  # Already in the viewer, with any solutions revealed
+        self._shown_tab = tab_name
+        placeholder, show_content = self._tab_builders[tab_name]
+        if tab_name not in self.build_times:
+            start = time.perf_counter()
+            
+            frame = ctk.CTkFrame(self.tab_view.tab(tab_name), fg_color="transparent")
+            frame.pack(fill="both", expand=True, padx=20, pady=20)
+            
+            label = ctk.CTkLabel(frame, text=placeholder, font=("Helvetica", 16))
+            label.pack(pady=20)
+            
+            build_controls = self._tab_controls.get(tab_name)
+            if build_controls:
+                build_controls(frame)
+            
+            show_content()
+            self.build_times[tab_name] = (time.perf_counter() - start) * 1000
+        else:
+            show_content()
     
     def show_sample_content(self):
         """Show sample learning content with LaTeX"""
@@ -104,42 +96,45 @@ class LearningView(ctk.CTkFrame):
             <p>The term under the square root ($b^2 - 4ac$) is called the discriminant.</p>
         </div>
         """
-        self.html_viewer.load_html(content)
+        self.viewer.load_content(content)
     
     def show_practice_content(self):
         """Show practice problems with LaTeX"""
-        content = """
-        <div style="font-family: Arial, sans-serif; color: #ffffff; line-height: 1.6;">
-            <h1>Practice Problems</h1>
-            
-            <p>Solve the following quadratic equations:</p>
-            
-            <ol>
-                <li>
-                    $$x^2 + 5x + 6 = 0$$
-                    <button onclick="showSolution(1)">Show Solution</button>
-                    <div id="solution1" style="display: none;">
-                        Solution: $x = -2$ or $x = -3$
-                    </div>
-                </li>
-                
-                <li>
-                    $$2x^2 - 7x + 3 = 0$$
-                    <button onclick="showSolution(2)">Show Solution</button>
-                    <div id="solution2" style="display: none;">
-                        Solution: $x = 3$ or $x = \\frac{1}{2}$
-                    </div>
-                </li>
-            </ol>
-        </div>
-        
-        <script>
-        function showSolution(n) {
-            document.getElementById('solution' + n).style.display = 'block';
-        }
-        </script>
+        header = """
+        <h1>Practice Problems</h1>
+        <p>Solve the following quadratic equations:</p>
         """
-        self.html_viewer.load_html(content)
+        self.viewer.load_sections({
+            "header": header,
+            "problem1": "<p>1. $$x^2 + 5x + 6 = 0$$</p>",
+            "solution1": self._solution_html("solution1"),
+            "problem2": "<p>2. $$2x^2 - 7x + 3 = 0$$</p>",
+            "solution2": self._solution_html("solution2"),
+        })
+    
+    def _build_solution_buttons(self, frame):
+        """Add a Show Solution button for each practice problem"""
+        buttons = ctk.CTkFrame(frame, fg_color="transparent")
+        buttons.pack(pady=(0, 10))
+        for number, name in enumerate(PRACTICE_SOLUTIONS, 1):
+            button = ctk.CTkButton(
+                buttons,
+                text=f"Show Solution {number}",
+                command=lambda name=name: self.show_solution(name)
+            )
+            button.pack(side="left", padx=5)
+    
+    def _solution_html(self, name):
+        """A solution's section: shown once revealed, empty until then"""
+        if name not in self.revealed:
+            return ""
+        return f'<div class="note">{PRACTICE_SOLUTIONS[name]}</div>'
+    
+    def show_solution(self, name):
+        """Reveal one practice solution, patching only its section"""
+        self.revealed.add(name)
+        if self._shown_tab == "Practice":
+            self.viewer.update_section(name, self._solution_html(name))
     
     def show_quiz_content(self):
         """Show quiz questions with LaTeX"""
@@ -168,4 +163,4 @@ class LearningView(ctk.CTkFrame):
         }
         </script>
         """
-        self.html_viewer.load_html(content)
\ No newline at end of file
+        self.viewer.load_content(content)
\ No newline at end of file
@@ -1,16 +1,16 @@
 import customtkinter as ctk
-from src.utils.database import Database
+from src.utils.async_db import AsyncDatabase, deliver
 
 class LoginView(ctk.CTkFrame):
-    def __init__(self, master, on_login=None, on_signup=None, **kwargs):
+    def __init__(self, master, on_login=None, on_signup=None, db=None, **kwargs):
         super().__init__(master, fg_color="transparent", **kwargs)
         
         # Store callbacks
         self.on_login = on_login
         self.on_signup = on_signup
         
-        # Initialize database
-        self.db = Database()
+        # Database calls run off the Tk thread
+        self.db = db or AsyncDatabase()
         
         # Configure grid
         self.grid_columnconfigure(0, weight=1)
@@ -76,7 +76,7 @@ class LoginView(ctk.CTkFrame):
         self.password_entry.pack(padx=20, pady=(0, 30))
         
         # Login button
-        login_button = ctk.CTkButton(
+        self.login_button = ctk.CTkButton(
             login_frame,
             text="Login",
             font=("Helvetica", 15, "bold"),
@@ -84,7 +84,7 @@ class LoginView(ctk.CTkFrame):
             height=45,
             command=self._handle_login
         )
-        login_button.pack(padx=20, pady=(0, 20))
+        self.login_button.pack(padx=20, pady=(0, 20))
         
         # Signup link
         signup_frame = ctk.CTkFrame(login_frame, fg_color="transparent")
@@ -122,9 +122,27 @@ class LoginView(ctk.CTkFrame):
                 self.error_label.configure(text="Please enter a password")
                 return
             
-            # For now, accept any non-empty username/password
-            # TODO: Add proper authentication
+            # Show pending state while credentials are checked off-thread
+            self.error_label.configure(text="")
+            self.login_button.configure(state="disabled", text="Logging in...")
+            deliver(
+                self,
+                self.db.verify_user(username, password),
+                lambda result: self._on_login_result(username, result),
+                self._on_login_error
+            )
+    
+    def _on_login_result(self, username, result):
+        self.login_button.configure(state="normal", text="Login")
+        success, message, _ = result
+        if success:
             self.on_login(username)
+        else:
+            self.error_label.configure(text=message)
+    
+    def _on_login_error(self, error):
+        self.login_button.configure(state="normal", text="Login")
+        self.error_label.configure(text=f"Error verifying user: {error}")
     
     def _handle_signup(self):
         if self.on_signup:
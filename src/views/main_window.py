@@ -2,7 +2,7 @@ import customtkinter as ctk
 from typing import Dict, Any
 from src.utils.observer import Observer
 from src.controllers.app_controller import AppController
-from src.views.widgets import (
+from widgets import (
     HeaderBar,
     SubjectCard,
     NavigationBar,
@@ -12,6 +12,9 @@ from src.views.widgets import (
     TransitionManager,
     TouchScrollableFrame
 )
+from src.views.widgets.virtual_grid import VirtualGrid
+from src.views.widgets.virtual_list import VirtualList
+from src.views.view_cache import ViewCache
 
 class MainWindow(ctk.CTk, Observer):
     def __init__(self, controller: AppController):
@@ -52,14 +55,17 @@ class MainWindow(ctk.CTk, Observer):
         self.content_area = ctk.CTkFrame(self.main_container)
         self.content_area.grid(row=1, column=0, sticky="nsew")
         
+        # Built pages are kept hidden and re-shown instead of rebuilt
+        self.views = ViewCache(
+            self.content_area,
+            widget_budget=3000,
+            fill="both", expand=True, padx=20, pady=20
+        )
+        
         # Create sidebar
         self.sidebar = SidebarWidget(
             self.main_container,
-            league_data={
-                "league": "Diamond",
-                "rank": 42,
-                "xp": self.controller.user_progress.xp
-            },
+            league_data=self.controller.get_league_data(),
             progress_data={
                 "progress": self.controller.user_progress.lessons_completed_today,
                 "goal": self.controller.user_progress.daily_goal
@@ -82,20 +88,27 @@ class MainWindow(ctk.CTk, Observer):
         if event_type in handlers:
             handlers[event_type](data)
 
-    def clear_main_frame(self):
-        """Clear the main frame for new content"""
-        if hasattr(self, 'main_frame'):
-            self.main_frame.destroy()
-        self.main_frame = ctk.CTkFrame(self.content_area, fg_color="transparent")
-        self.main_frame.pack(fill="both", expand=True, padx=20, pady=20)
+    def show_view(self, key, version, build):
+        """Show a cached page, building it into a fresh frame if needed"""
+        self.main_frame = self.views.show(key, version, build)
+
+    def _subjects_version(self):
+        """State shown on the subjects page"""
+        return tuple((s.name, s.progress) for s in self.controller.subjects.values())
+
+    def _subject_version(self, subject):
+        """Progress and lock state shown on a subject's unit page"""
+        return tuple(
+            (topic.is_locked, topic.progress)
+            for unit in subject.units
+            for topic in unit.topics
+        )
 
     def show_subjects_page(self):
         """Show the subject selection screen with transition"""
-        def create_content():
-            self.clear_main_frame()
-
+        def build(frame):
             # Create main container with padding
-            main_container = ctk.CTkFrame(self.main_frame, fg_color="transparent")
+            main_container = ctk.CTkFrame(frame, fg_color="transparent")
             main_container.pack(fill="both", expand=True)
             
             # Subject selection header
@@ -106,68 +119,42 @@ class MainWindow(ctk.CTk, Observer):
             )
             header_label.pack(pady=(0, 20))  # Reduced padding
 
-            # Create scrollable frame for the grid
-            scroll_container = TouchScrollableFrame(
-                main_container,
-                fg_color="transparent"
-            )
-            scroll_container.pack(fill="both", expand=True)
-
-            # Create grid frame for subject cards
-            grid_frame = ctk.CTkFrame(scroll_container, fg_color="transparent")
-            grid_frame.pack(fill="both", expand=True, padx=10)  # Reduced padding
-
-            # Calculate number of columns based on window width
-            window_width = self.winfo_width()
-            card_width = 280  # Match the new card width
-            spacing = 20     # Reduced spacing between cards
-            num_columns = max(2, min(4, (window_width - 100) // (card_width + spacing)))
-
-            # Configure grid columns
-            for i in range(num_columns):
-                grid_frame.grid_columnconfigure(i, weight=1, uniform="column")
+            def card_data(subject_name):
+                subject = self.controller.subjects[subject_name]
+                return {
+                    "icon": subject.icon,
+                    "color": subject.color,
+                    "units": subject.units,
+                    "progress": subject.progress
+                }
 
-            # Create subject cards in a grid
-            for i, (subject_name, subject) in enumerate(self.controller.subjects.items()):
-                row = i // num_columns
-                col = i % num_columns
-                
-                card = SubjectCard(
-                    grid_frame,
-                    subject=subject_name,
-                    data={
-                        "icon": subject.icon,
-                        "color": subject.color,
-                        "units": subject.units,
-                        "progress": subject.progress
-                    },
+            def bind_card(card, subject_name):
+                card.set_data(
+                    subject_name,
+                    card_data(subject_name),
                     command=lambda s=subject_name: self.controller.select_subject(s)
                 )
-                card.grid(
-                    row=row,
-                    column=col,
-                    padx=spacing//2,
-                    pady=spacing//2,
-                    sticky="nsew"
-                )
-                
-                # Configure row weight for equal spacing
-                grid_frame.grid_rowconfigure(row, weight=1, pad=spacing//2)
-            
-            # Add bottom padding for last row
-            grid_frame.grid_rowconfigure(row + 1, weight=1, pad=spacing//2)
-            
-            # Bind window resize event to update layout
-            def on_resize(event):
-                # Recalculate number of columns
-                new_width = event.width
-                new_num_columns = max(2, min(4, (new_width - 100) // (card_width + spacing)))
-                
-                # Only update if number of columns changed
-                if new_num_columns != num_columns:
-                    self.after(100, self.show_subjects_page)  # Debounced refresh
-            
-            self.bind("<Configure>", on_resize)
+
+            # Virtualized grid: cards exist only for visible rows and are
+            # reused on scroll, and a resize re-flows them in place
+            subject_names = list(self.controller.subjects)
+            grid = VirtualGrid(
+                main_container,
+                create_card=lambda parent: SubjectCard(
+                    parent,
+                    subject=subject_names[0],
+                    data=card_data(subject_names[0]),
+                    command=None
+                ),
+                bind_card=bind_card,
+                card_width=280,  # Match the new card width
+                spacing=20       # Reduced spacing between cards
+            )
+            grid.pack(fill="both", expand=True, padx=10)
+            grid.set_items(subject_names)
+
+        def create_content():
+            self.show_view(("subjects",), self._subjects_version(), build)
             
             # Start fade-in transition
             self.transition_manager.fade_in()
@@ -179,12 +166,10 @@ class MainWindow(ctk.CTk, Observer):
         """Handle subject selection"""
         subject = self.controller.get_current_subject()
         if subject:
-            def create_content():
-                self.clear_main_frame()
-
+            def build(frame):
                 # Navigation bar
                 nav = NavigationBar(
-                    self.main_frame,
+                    frame,
                     back_text="Back to Subjects",
                     back_command=self.show_subjects_page,
                     title_text=f"{subject.icon} {subject.name}",
@@ -192,7 +177,7 @@ class MainWindow(ctk.CTk, Observer):
                 )
 
                 # Create main content container
-                content_container = ctk.CTkFrame(self.main_frame, fg_color="transparent")
+                content_container = ctk.CTkFrame(frame, fg_color="transparent")
                 content_container.pack(fill="both", expand=True, padx=30, pady=20)
                 
                 # Create left sidebar for unit navigation
@@ -202,19 +187,49 @@ class MainWindow(ctk.CTk, Observer):
                 main_content = ctk.CTkFrame(content_container)
                 main_content.pack(side="left", fill="both", expand=True)
 
-                # Create scrollable frame for units
-                scroll_frame = TouchScrollableFrame(main_content, fg_color="transparent")
-                scroll_frame.pack(fill="both", expand=True, padx=5, pady=5)
+                def unit_data(index):
+                    unit = subject.units[index]
+                    return {
+                        "name": unit.name,
+                        "topics": [t.name for t in unit.topics],
+                        "locked": [t.is_locked for t in unit.topics],
+                        "progress": unit.progress
+                    }
 
-                # Create units
-                for i, unit in enumerate(subject.units):
-                    UnitSection(
-                        scroll_frame,
-                        unit={"name": unit.name, "topics": [t.name for t in unit.topics]},
-                        index=i,
+                def open_topic(index, topic_name):
+                    # Topics are looked up in the current unit
+                    self.controller.select_unit(index)
+                    self.controller.select_topic(topic_name)
+
+                def bind_section(section, index):
+                    section.set_unit(
+                        unit_data(index),
+                        index=index,
                         color=subject.color,
-                        topic_callback=self.controller.select_topic
+                        topic_callback=lambda t, i=index: open_topic(i, t)
                     )
+
+                # Virtualized unit list: only sections in view exist, the
+                # rest are placeholders sized from their topic count
+                unit_list = VirtualList(
+                    main_content,
+                    create_row=lambda parent: UnitSection(
+                        parent,
+                        unit=unit_data(0),
+                        index=0,
+                        color=subject.color,
+                        topic_callback=lambda t: open_topic(0, t)
+                    ),
+                    bind_row=bind_section,
+                    estimate_height=lambda index: UnitSection.estimate_height(
+                        len(subject.units[index].topics)
+                    )
+                )
+                unit_list.pack(fill="both", expand=True, padx=5, pady=5)
+                unit_list.set_items(range(len(subject.units)))
+
+            def create_content():
+                self.show_view(("subject", subject.name), self._subject_version(subject), build)
                 
                 # Start fade-in transition
                 self.transition_manager.fade_in()
@@ -237,24 +252,30 @@ class MainWindow(ctk.CTk, Observer):
         )
         unit_nav_header.pack(pady=(20, 10), padx=15)
         
-        # Create scrollable frame for unit buttons
-        unit_scroll = TouchScrollableFrame(unit_nav, fg_color="transparent")
-        unit_scroll.pack(fill="both", expand=True, padx=10, pady=10)
+        def bind_unit_button(button, index):
+            button.configure(
+                text=f"Unit {index + 1}: {subject.units[index].name}",
+                command=lambda: self.controller.select_unit(index)
+            )
         
-        # Create unit buttons
-        for i, unit in enumerate(subject.units):
-            unit_button = ctk.CTkButton(
-                unit_scroll,
-                text=f"Unit {i + 1}: {unit.name}",
+        # Create unit buttons, only for the ones in view
+        unit_scroll = VirtualList(
+            unit_nav,
+            create_row=lambda parent: ctk.CTkButton(
+                parent,
                 font=("Helvetica", 14),
                 fg_color="#2d2d2d",
                 hover_color="#3d3d3d",
                 anchor="w",
                 height=40,
-                corner_radius=8,
-                command=lambda idx=i: self.controller.select_unit(idx)
-            )
-            unit_button.pack(fill="x", pady=5)
+                corner_radius=8
+            ),
+            bind_row=bind_unit_button,
+            estimate_height=lambda index: 40,
+            padx=0
+        )
+        unit_scroll.pack(fill="both", expand=True, padx=10, pady=10)
+        unit_scroll.set_items(range(len(subject.units)))
         
         return unit_nav
 
@@ -266,12 +287,10 @@ class MainWindow(ctk.CTk, Observer):
         """Handle topic selection"""
         subject = self.controller.get_current_subject()
         if subject:
-            def create_content():
-                self.clear_main_frame()
-
+            def build(frame):
                 # Navigation bar
                 nav = NavigationBar(
-                    self.main_frame,
+                    frame,
                     back_text=f"Back to {subject.name}",
                     back_command=lambda: self.controller.select_subject(subject.name),
                     title_text=f"Learning: {topic_name}"
@@ -279,12 +298,24 @@ class MainWindow(ctk.CTk, Observer):
                 nav.pack(fill="x", padx=5, pady=5)
 
                 # Create scrollable lesson content
-                content_scroll = TouchScrollableFrame(self.main_frame)
+                content_scroll = TouchScrollableFrame(frame)
                 content_scroll.pack(fill="both", expand=True, padx=5, pady=5)
 
                 # Create lesson content
-                lesson = LessonContent(content_scroll, topic=topic_name)
+                lesson = LessonContent(
+                    content_scroll,
+                    topic=topic_name,
+                    content=self.controller.get_topic_content()
+                )
                 lesson.pack(fill="both", expand=True)
+
+            def create_content():
+                topic = self.controller.get_current_topic()
+                self.show_view(
+                    ("topic", subject.name, self.controller.current_unit, topic_name),
+                    (topic.is_locked, topic.progress) if topic else None,
+                    build
+                )
                 
                 # Start fade-in transition
                 self.transition_manager.fade_in()
@@ -303,11 +334,7 @@ class MainWindow(ctk.CTk, Observer):
         
         # Update sidebar progress
         self.sidebar.update_progress(
-            league_data={
-                "league": "Diamond",
-                "rank": 42,
-                "xp": user_progress.xp
-            },
+            league_data=self.controller.get_league_data(),
             progress_data={
                 "progress": user_progress.lessons_completed_today,
                 "goal": user_progress.daily_goal
@@ -1,15 +1,18 @@
 import customtkinter as ctk
 import re
-from src.utils.database import Database
+from src.utils.async_db import AsyncDatabase, deliver
 
 class SignupView(ctk.CTkFrame):
-    def __init__(self, master, on_signup=None, on_login=None, **kwargs):
+    def __init__(self, master, on_signup=None, on_login=None, db=None, **kwargs):
         super().__init__(master, **kwargs)
         
         # Store callbacks
         self.on_signup = on_signup
         self.on_login = on_login
         
+        # Database calls run off the Tk thread
+        self.db = db or AsyncDatabase()
+        
         # Configure grid
         self.grid_columnconfigure(0, weight=1)
         self.grid_rowconfigure(0, weight=1)
@@ -31,6 +34,15 @@ class SignupView(ctk.CTkFrame):
         signup_frame = ctk.CTkFrame(center_frame)
         signup_frame.pack(padx=40, pady=40)
         
+        # Error message
+        self.error_label = ctk.CTkLabel(
+            signup_frame,
+            text="",
+            font=("Helvetica", 12),
+            text_color="#FF4444"
+        )
+        self.error_label.pack(padx=20, pady=(20, 0))
+        
         # Username
         username_label = ctk.CTkLabel(
             signup_frame,
@@ -82,7 +94,7 @@ class SignupView(ctk.CTkFrame):
         self.confirm_entry.pack(padx=20, pady=(0, 30))
         
         # Signup button
-        signup_button = ctk.CTkButton(
+        self.signup_button = ctk.CTkButton(
             signup_frame,
             text="Sign Up",
             font=("Helvetica", 15, "bold"),
@@ -90,7 +102,7 @@ class SignupView(ctk.CTkFrame):
             height=45,
             command=self._handle_signup
         )
-        signup_button.pack(padx=20, pady=(0, 20))
+        self.signup_button.pack(padx=20, pady=(0, 20))
         
         # Login link
         login_frame = ctk.CTkFrame(signup_frame, fg_color="transparent")
@@ -114,16 +126,6 @@ class SignupView(ctk.CTkFrame):
         )
         login_button.pack(side="left", padx=(5, 0))
     
-    def _handle_signup(self):
-        if self.on_signup:
-            username = self.username_entry.get()
-            password = self.password_entry.get()
-            confirm = self.confirm_entry.get()
-            
-            # Basic validation
-            if username and password and password == confirm:
-                self.on_signup(username)
-    
     def _handle_login(self):
         if self.on_login:
             self.on_login()
@@ -144,9 +146,9 @@ class SignupView(ctk.CTkFrame):
         if not re.match(email_pattern, email):
             return False, "Invalid email format"
         
-        # Check if email already exists
-        db = Database()
-        if db.user_exists(email):
+        # Check if email already exists; answered from the user cache's
+        # Bloom filter, and create_user catches anything it can't rule out
+        if self.db.email_status(email):
             return False, "Email already exists"
         
         # Validate password length
@@ -170,15 +172,30 @@ class SignupView(ctk.CTkFrame):
             self.error_label.configure(text=error)
             return
         
-        # Create user
-        success, message = self.db.create_user(
-            email=self.username_entry.get().strip(),
-            password=self.password_entry.get(),
-            name=self.username_entry.get().strip()
+        # Create user off the Tk thread; the UNIQUE constraint on email
+        # reports an existing account, so no separate lookup is needed
+        email = self.username_entry.get().strip()
+        self.signup_button.configure(state="disabled", text="Creating account...")
+        deliver(
+            self,
+            self.db.create_user(
+                email=email,
+                password=self.password_entry.get(),
+                name=email
+            ),
+            lambda result: self._on_signup_result(email, result),
+            self._on_signup_error
         )
-        
+    
+    def _on_signup_result(self, email, result):
+        self.signup_button.configure(state="normal", text="Sign Up")
+        success, message = result
         if success:
             if self.on_signup:
-                self.on_signup(self.username_entry.get())
+                self.on_signup(email)
         else:
-            self.error_label.configure(text=message) 
\ No newline at end of file
+            self.error_label.configure(text=message)
+    
+    def _on_signup_error(self, error):
+        self.signup_button.configure(state="normal", text="Sign Up")
+        self.error_label.configure(text=f"Error creating user: {error}") 
\ No newline at end of file
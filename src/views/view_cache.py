@@ -0,0 +1,115 @@
+import customtkinter as ctk
+from collections import OrderedDict
+from typing import Any, Callable, Hashable, Optional
+
+# Version that never matches, forcing a rebuild
+_STALE = object()
+
+def transparent_frame(parent: Any) -> ctk.CTkFrame:
+    """Default container for a cached view"""
+    return ctk.CTkFrame(parent, fg_color="transparent")
+
+def count_widgets(widget) -> int:
+    """Number of Tk widgets in a tree, including the root"""
+    return 1 + sum(count_widgets(child) for child in widget.winfo_children())
+
+class ViewCache:
+    """LRU cache of built page frames
+
+    Each view is a frame under parent, built once by its builder and then
+    hidden with pack_forget when another view is shown. Showing it again
+    re-packs the frame instead of rebuilding it. A view is rebuilt when the
+    version passed to show() differs from the one it was built with, so
+    callers stamp views with whatever state they display (progress, lock
+    state). Least recently used views are destroyed once the cached frames
+    hold more than widget_budget widgets. make_frame(parent) creates the
+    container each view is built into.
+    """
+
+    def __init__(
+        self,
+        parent: Any,
+        widget_budget: int = 3000,
+        make_frame: Callable[[Any], Any] = transparent_frame,
+        **pack_options
+    ):
+        self.parent = parent
+        self.widget_budget = widget_budget
+        self.make_frame = make_frame
+        self.pack_options = pack_options or {"fill": "both", "expand": True}
+        # key -> [frame, version, widget count]
+        self._views: "OrderedDict[Hashable, list]" = OrderedDict()
+        self.current: Optional[Hashable] = None
+        self.stats = {"hits": 0, "builds": 0, "invalidated": 0, "evicted": 0}
+
+    @property
+    def widget_count(self) -> int:
+        return sum(entry[2] for entry in self._views.values())
+
+    def show(self, key: Hashable, version: Any, build: Callable[[Any], None]):
+        """Show the view for key, building it if missing or out of date"""
+        self._hide_current()
+
+        entry = self._views.get(key)
+        if entry is not None and entry[1] != version:
+            self._discard(key)
+            self.stats["invalidated"] += 1
+            entry = None
+
+        if entry is None:
+            frame = self.make_frame(self.parent)
+            frame.pack(**self.pack_options)
+            try:
+                build(frame)
+            except Exception:
+                frame.destroy()
+                raise
+            entry = self._views[key] = [frame, version, count_widgets(frame)]
+            self.stats["builds"] += 1
+        else:
+            self._views.move_to_end(key)
+            entry[0].pack(**self.pack_options)
+            self.stats["hits"] += 1
+
+        self.current = key
+        self._evict()
+        return entry[0]
+
+    def invalidate(self, match: Optional[Callable[[Hashable], bool]] = None):
+        """Destroy hidden views whose key matches (all when match is None)
+
+        The shown view is only marked stale, so it is rebuilt the next time
+        it is shown rather than vanishing from under the user.
+        """
+        for key in [k for k in self._views if match is None or match(k)]:
+            if key == self.current:
+                self._views[key][1] = _STALE
+            else:
+                self._discard(key)
+            self.stats["invalidated"] += 1
+
+    def clear(self):
+        """Destroy every cached view"""
+        for key in list(self._views):
+            self._discard(key)
+        self.current = None
+
+    def _hide_current(self):
+        entry = self._views.get(self.current)
+        if entry is not None:
+            entry[0].pack_forget()
+            # Views like lazy tabs grow after they are built
+            entry[2] = count_widgets(entry[0])
+        self.current = None
+
+    def _evict(self):
+        while self.widget_count > self.widget_budget and len(self._views) > 1:
+            key = next(iter(self._views))
+            if key == self.current:
+                break  # Only the shown view is left over budget
+            self._discard(key)
+            self.stats["evicted"] += 1
+
+    def _discard(self, key: Hashable):
+        frame = self._views.pop(key)[0]
+        frame.destroy()
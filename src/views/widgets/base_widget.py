@@ -1,5 +1,6 @@
 import customtkinter as ctk
 from typing import Optional, Callable, Any, Dict
+from src.utils.animation import animation_clock
 from src.utils.theme import theme
 
 class BaseWidget(ctk.CTkFrame):
@@ -31,11 +32,9 @@ class BaseWidget(ctk.CTkFrame):
             **kwargs
         )
         
-        # Initialize animation variables
-        self._animation_running = False
-        self._animation_id = None
-        self._hover_animation_running = False
-        self._hover_animation_id = None
+        # Running tweens on the shared animation clock
+        self._animation = None
+        self._hover_animation = None
         
         # Bind hover events
         self.bind("<Enter>", self._on_enter)
@@ -49,25 +48,16 @@ class BaseWidget(ctk.CTkFrame):
         callback: Optional[Callable] = None
     ):
         """Animate the widget's opacity"""
-        if self._animation_running:
-            self.after_cancel(self._animation_id)
+        if self._animation:
+            self._animation.cancel()
         
-        steps = 20
-        step_time = duration // steps
+        def _update(progress: float):
+            opacity = start + (end - start) * progress
+            self.configure(fg_color=self._adjust_opacity(theme.colors.surface, opacity))
         
-        def _animate(step: int = 0):
-            if step <= steps:
-                progress = step / steps
-                opacity = start + (end - start) * self._ease_in_out(progress)
-                self.configure(fg_color=self._adjust_opacity(theme.colors.surface, opacity))
-                self._animation_id = self.after(step_time, lambda: _animate(step + 1))
-                self._animation_running = True
-            else:
-                self._animation_running = False
-                if callback:
-                    callback()
-        
-        _animate()
+        self._animation = animation_clock.animate(
+            self, duration, _update, callback, ease=self._ease_in_out
+        )
 
     def animate_hover(
         self,
@@ -75,32 +65,18 @@ class BaseWidget(ctk.CTkFrame):
         duration: int = 150
     ):
         """Animate hover effect"""
-        if self._hover_animation_running:
-            self.after_cancel(self._hover_animation_id)
+        if self._hover_animation:
+            self._hover_animation.cancel()
         
         start_color = theme.colors.surface
         end_color = theme.colors.surface_variant if hover_in else theme.colors.surface
-        steps = 10
-        step_time = duration // steps
         
-        def _animate(step: int = 0):
-            if step <= steps:
-                progress = step / steps
-                color = self._interpolate_color(
-                    start_color,
-                    end_color,
-                    self._ease_in_out(progress)
-                )
-                self.configure(fg_color=color)
-                self._hover_animation_id = self.after(
-                    step_time,
-                    lambda: _animate(step + 1)
-                )
-                self._hover_animation_running = True
-            else:
-                self._hover_animation_running = False
+        def _update(progress: float):
+            self.configure(fg_color=self._interpolate_color(start_color, end_color, progress))
         
-        _animate()
+        self._hover_animation = animation_clock.animate(
+            self, duration, _update, ease=self._ease_in_out
+        )
 
     def _on_enter(self, event):
         """Handle mouse enter event"""
@@ -155,8 +131,7 @@ class BaseButton(ctk.CTkButton):
             **button_style
         )
         
-        self._hover_animation_running = False
-        self._hover_animation_id = None
+        self._hover_animation = None
         self._original_color = button_style["fg_color"]
         self._hover_color = button_style["hover_color"]
 
@@ -166,32 +141,18 @@ class BaseButton(ctk.CTkButton):
         duration: int = 150
     ):
         """Animate hover effect"""
-        if self._hover_animation_running:
-            self.after_cancel(self._hover_animation_id)
+        if self._hover_animation:
+            self._hover_animation.cancel()
         
         start_color = self._hover_color if hover_in else self._original_color
         end_color = self._original_color if hover_in else self._hover_color
-        steps = 10
-        step_time = duration // steps
         
-        def _animate(step: int = 0):
-            if step <= steps:
-                progress = step / steps
-                color = self._interpolate_color(
-                    start_color,
-                    end_color,
-                    self._ease_in_out(progress)
-                )
-                self.configure(fg_color=color)
-                self._hover_animation_id = self.after(
-                    step_time,
-                    lambda: _animate(step + 1)
-                )
-                self._hover_animation_running = True
-            else:
-                self._hover_animation_running = False
+        def _update(progress: float):
+            self.configure(fg_color=self._interpolate_color(start_color, end_color, progress))
         
-        _animate()
+        self._hover_animation = animation_clock.animate(
+            self, duration, _update, ease=self._ease_in_out
+        )
 
     @staticmethod
     def _ease_in_out(t: float) -> float:
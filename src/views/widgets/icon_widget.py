@@ -1,5 +1,6 @@
 import customtkinter as ctk
 import math
+from src.utils.animation import animation_clock, ease_out
 
 class IconWidget(ctk.CTkCanvas):
     def __init__(
@@ -24,7 +25,7 @@ class IconWidget(ctk.CTkCanvas):
         self.color = color
         self.hover_color = hover_color or color
         self.icon_type = icon_type
-        self.animation_id = None
+        self.animation = None  # Scale tween on the shared clock
         self.current_scale = 1.0
         self.target_scale = 1.0
         
@@ -347,10 +348,16 @@ class IconWidget(ctk.CTkCanvas):
             )
 
     def _animate(self):
-        """Animate the icon scale"""
-        if abs(self.current_scale - self.target_scale) > 0.01:
+        """Animate the icon scale towards target_scale"""
+        if self.animation:
+            self.animation.cancel()
+        
+        start = self.current_scale
+        target = self.target_scale
+        
+        def _update(progress):
             # Calculate new scale
-            self.current_scale += (self.target_scale - self.current_scale) * 0.2
+            self.current_scale = start + (target - start) * progress
             
             # Apply scale transformation
             self.scale("all", self.size/2, self.size/2, 
@@ -358,24 +365,19 @@ class IconWidget(ctk.CTkCanvas):
                       self.current_scale/self._last_scale)
             
             self._last_scale = self.current_scale
-            
-            # Continue animation
-            self.animation_id = self.after(16, self._animate)
-        else:
-            self.animation_id = None
+        
+        self.animation = animation_clock.animate(self, 200, _update, ease=ease_out)
 
     def _on_enter(self, event):
         """Handle mouse enter"""
         self.target_scale = 1.1
         self._last_scale = self.current_scale
-        if not self.animation_id:
-            self._animate()
+        self._animate()
         self.itemconfig("all", fill=self.hover_color)
 
     def _on_leave(self, event):
         """Handle mouse leave"""
         self.target_scale = 1.0
         self._last_scale = self.current_scale
-        if not self.animation_id:
-            self._animate()
+        self._animate()
         self.itemconfig("all", fill=self.color) 
\ No newline at end of file
@@ -1,7 +1,83 @@
 import customtkinter as ctk
 import tkinterweb
+from src.utils.math_render import render_math
+from src.utils.templates import Template
 from src.utils.theme import theme
 import os
+import re
+import time
+
+PAGE_TEMPLATE = Template("""
+<!DOCTYPE html>
+<html>
+<head>
+    <meta charset="UTF-8">
+    <style>
+        body {
+            background-color: {background};
+            color: {text};
+            font-family: system-ui, -apple-system, sans-serif;
+            line-height: 1.6;
+            padding: 20px;
+            font-size: 16px;
+        }
+        .math-display {
+            text-align: center;
+            margin: 1em 0;
+        }
+        .content {
+            max-width: 800px;
+            margin: 0 auto;
+        }
+        h1, h2, h3 {
+            color: {text_secondary};
+            margin-top: 1.5em;
+            margin-bottom: 0.5em;
+        }
+        .example {
+            background-color: #2a2b2e;
+            border-radius: 8px;
+            padding: 15px;
+            margin: 15px 0;
+        }
+        .theorem {
+            border-left: 4px solid #6366f1;
+            padding-left: 15px;
+            margin: 15px 0;
+        }
+        .note {
+            background-color: #2d3748;
+            border-radius: 8px;
+            padding: 15px;
+            margin: 15px 0;
+        }
+        p {
+            margin: 1em 0;
+        }
+        ul, ol {
+            margin: 1em 0;
+            padding-left: 2em;
+        }
+        li {
+            margin: 0.5em 0;
+        }
+    </style>
+</head>
+<body>
+    <div class="content">
+        {content}
+    </div>
+</body>
+</html>
+""").bind(
+    # The style section is filled from the theme once, at import
+    background=theme["background"],
+    text=theme["text"],
+    text_secondary=theme["text_secondary"]
+)
+
+# Section names become element ids
+SECTION_NAME = re.compile(r"[A-Za-z][\w-]*")
 
 class LaTeXViewer(ctk.CTkFrame):
     def __init__(self, master, **kwargs):
@@ -11,104 +87,80 @@ class LaTeXViewer(ctk.CTkFrame):
         self.html_viewer = tkinterweb.HtmlFrame(self, messages_enabled=False)
         self.html_viewer.pack(expand=True, fill="both", padx=20, pady=20)
         
-        # Load MathJax configuration
-        self.mathjax_config = """
-        <script type="text/javascript" async src="https://cdnjs.cloudflare.com/ajax/libs/mathjax/2.7.7/MathJax.js?config=TeX-MML-AM_CHTML">
-        </script>
-        <script type="text/x-mathjax-config">
-        MathJax.Hub.Config({
-            tex2jax: {
-                inlineMath: [['$','$'], ['\\\\(','\\\\)']],
-                displayMath: [['$$','$$'], ['\\\\[','\\\\]']],
-                processEscapes: true
-            },
-            "HTML-CSS": { 
-                availableFonts: ["TeX"],
-                scale: 130
-            }
-        });
-        </script>
-        """
+        # Base HTML template, compiled once for all viewers
+        self.html_template = PAGE_TEMPLATE
         
-        # Base HTML template
-        self.html_template = """
-        <!DOCTYPE html>
-        <html>
-        <head>
-            <meta charset="UTF-8">
-            {mathjax}
-            <style>
-                body {{
-                    background-color: #1a1b1e;
-                    color: #ffffff;
-                    font-family: system-ui, -apple-system, sans-serif;
-                    line-height: 1.6;
-                    padding: 20px;
-                    font-size: 16px;
-                }}
-                .MathJax {{
-                    color: #ffffff !important;
-                }}
-                .content {{
-                    max-width: 800px;
-                    margin: 0 auto;
-                }}
-                h1, h2, h3 {{
-                    color: #8a8d93;
-                    margin-top: 1.5em;
-                    margin-bottom: 0.5em;
-                }}
-                .example {{
-                    background-color: #2a2b2e;
-                    border-radius: 8px;
-                    padding: 15px;
-                    margin: 15px 0;
-                }}
-                .theorem {{
-                    border-left: 4px solid #6366f1;
-                    padding-left: 15px;
-                    margin: 15px 0;
-                }}
-                .note {{
-                    background-color: #2d3748;
-                    border-radius: 8px;
-                    padding: 15px;
-                    margin: 15px 0;
-                }}
-                p {{
-                    margin: 1em 0;
-                }}
-                ul, ol {{
-                    margin: 1em 0;
-                    padding-left: 2em;
-                }}
-                li {{
-                    margin: 0.5em 0;
-                }}
-            </style>
-        </head>
-        <body>
-            <div class="content">
-                {content}
-            </div>
-        </body>
-        </html>
-        """
+        # Rendered HTML of each section currently in the document
+        self.sections = {}
+        self.last_render_ms = 0.0
         
     def load_content(self, content):
         """Load LaTeX content into the viewer"""
+        self.load_sections({"content": content})
+        
+    def load_sections(self, sections):
+        """Load a page made of named sections that can be updated one by one"""
+        for name in sections:
+            if not SECTION_NAME.fullmatch(name):
+                raise ValueError(f"Invalid section name: {name!r}")
+        
+        start = time.perf_counter()
         try:
-            # Format the content with the template
-            html_content = self.html_template.format(
-                mathjax=self.mathjax_config,
-                content=content
-            )
-            
-            # Load the content into the viewer
-            self.html_viewer.load_html(html_content)
+            # Formulas are pre-rendered so nothing has to load from the network
+            rendered = {name: render_math(content) for name, content in sections.items()}
+            if rendered != self.sections:  # Same page skips the reparse
+                self._load_document(rendered)
         except Exception as e:
             print(f"Error loading content: {e}")
+            self.sections = {}
             self.html_viewer.load_html(f"<p>Error loading content: {str(e)}</p>")
+        self.last_render_ms = (time.perf_counter() - start) * 1000
+        
+    def update_section(self, name, content):
+        """Replace one section, e.g. to reveal a solution"""
+        self.update_sections({name: content})
+        
+    def update_sections(self, sections):
+        """Patch only the sections whose content changed
+        
+        Changed sections are swapped into the live document through
+        tkinterweb's DOM API, so the cost follows the size of the change
+        rather than the page. Falls back to a full load if the DOM can't
+        be patched.
+        """
+        start = time.perf_counter()
+        changed = {}
+        for name, content in sections.items():
+            html = render_math(content)
+            if self.sections.get(name) != html:
+                changed[name] = html
+        if not changed:
+            self.last_render_ms = (time.perf_counter() - start) * 1000
+            return
+        
+        if changed.keys() <= self.sections.keys():
+            try:
+                document = self.html_viewer.document
+                for name, html in changed.items():
+                    document.getElementById(f"section-{name}").innerHTML = html
+                    self.sections[name] = html
+                self.last_render_ms = (time.perf_counter() - start) * 1000
+                return
+            except Exception as e:
+                print(f"Error patching content, reloading: {e}")
+        
+        # New sections, or an HtmlFrame without DOM support
+        self._load_document(dict(self.sections, **changed))
+        self.last_render_ms = (time.perf_counter() - start) * 1000
+        
+    def _load_document(self, rendered):
+        """Load the full page with each section in its own element"""
+        body = "".join(
+            f'<div id="section-{name}">{html}</div>'
+            for name, html in rendered.items()
+        )
+        self.html_viewer.load_html(self.html_template.render(content=body))
+        self.sections = dict(rendered)
             
     def load_file(self, file_path):
         """Load content from a file"""
@@ -1,6 +1,7 @@
 from typing import Optional, Callable, Any
 import customtkinter as ctk
 from src.views.widgets.base_widget import BaseWidget, BaseButton
+from src.utils.animation import animation_clock
 from src.utils.theme import theme
 
 class NavigationBar(BaseWidget):
@@ -71,9 +72,8 @@ class NavigationBar(BaseWidget):
         self.back_button.bind("<Enter>", self._on_back_hover_enter)
         self.back_button.bind("<Leave>", self._on_back_hover_leave)
         
-        # Initialize animation variables
-        self._title_animation_running = False
-        self._title_animation_id = None
+        # Running entrance tweens
+        self._entrance_animations = []
         
         # Add entrance animation
         self.animate_entrance()
@@ -84,57 +84,41 @@ class NavigationBar(BaseWidget):
         self.configure(fg_color="transparent")
         
         # Animate background color
-        def animate_bg():
-            steps = 20
-            duration = 300
-            step_time = duration // steps
-            
-            def _animate_bg(step=0):
-                if step <= steps:
-                    progress = step / steps
-                    opacity = self._ease_in_out(progress)
-                    self.configure(
-                        fg_color=self._adjust_opacity(
-                            theme.colors.background,
-                            opacity
-                        )
-                    )
-                    self.after(step_time, lambda: _animate_bg(step + 1))
-            
-            _animate_bg()
+        def _update_bg(progress):
+            self.configure(
+                fg_color=self._adjust_opacity(
+                    theme.colors.background,
+                    progress
+                )
+            )
         
         # Animate title entrance
-        def animate_title():
-            original_x = self.title_label.winfo_x()
-            self.title_label.place(x=original_x - 20)
-            
-            steps = 20
-            duration = 300
-            step_time = duration // steps
-            
-            def _animate_title(step=0):
-                if step <= steps:
-                    progress = step / steps
-                    ease = self._ease_in_out(progress)
-                    x = original_x - (20 * (1 - ease))
-                    opacity = ease
-                    self.title_label.place(x=x)
-                    self.title_label.configure(
-                        text_color=self._adjust_opacity(
-                            theme.colors.text,
-                            opacity
-                        )
-                    )
-                    if step < steps:
-                        self.after(step_time, lambda: _animate_title(step + 1))
-                    else:
-                        self.title_label.grid(row=0, column=1, sticky="w")
-            
-            _animate_title()
+        title_start = {}
+        
+        def _update_title(progress):
+            if not title_start:
+                title_start["x"] = self.title_label.winfo_x()
+            x = title_start["x"] - (20 * (1 - progress))
+            self.title_label.place(x=x)
+            self.title_label.configure(
+                text_color=self._adjust_opacity(
+                    theme.colors.text,
+                    progress
+                )
+            )
+        
+        def _title_done():
+            self.title_label.grid(row=0, column=1, sticky="w")
         
         # Start animations
-        self.after(100, animate_bg)
-        self.after(200, animate_title)
+        for animation in self._entrance_animations:
+            animation.cancel()
+        self._entrance_animations = [
+            animation_clock.animate(self, 300, _update_bg, ease=self._ease_in_out, delay=100),
+            animation_clock.animate(
+                self, 300, _update_title, _title_done, ease=self._ease_in_out, delay=200
+            ),
+        ]
 
     def _on_back_hover_enter(self, event):
         """Handle back button hover enter"""
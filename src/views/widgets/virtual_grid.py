@@ -0,0 +1,73 @@
+import math
+from typing import Any, Callable
+
+from src.views.widgets.virtual_scroll import VirtualScroller
+
+class VirtualGrid(VirtualScroller):
+    """Scrollable grid of equal-sized cards, created only for visible rows
+
+    A resize re-flows the columns in place; no card is destroyed.
+    create_card(parent) builds an empty card; bind_card(card, item) shows
+    an item on it.
+    """
+
+    def __init__(
+        self,
+        master: Any,
+        create_card: Callable[[Any], Any],
+        bind_card: Callable[[Any, Any], None],
+        card_width: int = 280,
+        card_height: int = 360,
+        spacing: int = 20,
+        min_columns: int = 2,
+        max_columns: int = 4,
+        overscan_rows: int = 1,
+        **kwargs
+    ):
+        super().__init__(
+            master,
+            create_item=create_card,
+            bind_item=bind_card,
+            scroll_step=(card_height + spacing) // 4,
+            **kwargs
+        )
+        self.card_width = card_width
+        self.card_height = card_height
+        self.spacing = spacing
+        self.min_columns = min_columns
+        self.max_columns = max_columns
+        self.overscan_rows = overscan_rows
+        self.columns = min_columns
+
+    def _row_height(self) -> int:
+        return self.card_height + self.spacing
+
+    def _content_height(self) -> int:
+        rows = math.ceil(len(self.items) / self.columns) if self.items else 0
+        return rows * self._row_height() + self.spacing
+
+    def _reflow(self, width: int):
+        self.columns = max(
+            self.min_columns,
+            min(self.max_columns, (width - self.spacing) // (self.card_width + self.spacing))
+        )
+
+    def _place_visible(self, width: int, height: int):
+        row_height = self._row_height()
+        first_row = max(0, self.offset // row_height - self.overscan_rows)
+        last_row = (self.offset + height) // row_height + self.overscan_rows
+        first = first_row * self.columns
+        last = min(len(self.items), (last_row + 1) * self.columns)
+        self._release_outside(first, last)
+
+        # Share spare width between the columns
+        column_width = (width - self.spacing) / self.columns - self.spacing
+        for index in range(first, last):
+            row, column = divmod(index, self.columns)
+            self._place(
+                self._acquire(index),
+                x=self.spacing + column * (column_width + self.spacing),
+                y=self.spacing + row * row_height - self.offset,
+                width=column_width,
+                height=self.card_height
+            )
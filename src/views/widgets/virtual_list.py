@@ -0,0 +1,83 @@
+from bisect import bisect_left, bisect_right
+from typing import Any, Callable, List, Sequence
+
+from src.views.widgets.virtual_scroll import VirtualScroller
+
+class VirtualList(VirtualScroller):
+    """Scrollable list of variable-height rows, created only when visible
+
+    Rows never shown yet are placeholders sized by estimate_height(item).
+    Once a row is shown its real height is measured and replaces the
+    estimate. Row positions are prefix sums of the heights, so finding the
+    rows in view is a binary search, and memory stays bounded by the
+    viewport rather than the length of the list.
+    """
+
+    def __init__(
+        self,
+        master: Any,
+        create_row: Callable[[Any], Any],
+        bind_row: Callable[[Any, Any], None],
+        estimate_height: Callable[[Any], int],
+        spacing: int = 10,
+        padx: int = 20,
+        overscan: int = 200,
+        **kwargs
+    ):
+        super().__init__(master, create_item=create_row, bind_item=bind_row, **kwargs)
+        self.estimate_height = estimate_height
+        self.spacing = spacing
+        self.padx = padx
+        self.overscan = overscan  # Pixels materialized beyond each edge
+        self.heights: List[int] = []
+        self._tops: List[int] = [spacing]  # Top of each row, then the end
+        self._measure_pending = False
+        self.stats["measured"] = 0
+
+    def set_items(self, items: Sequence[Any]):
+        """Show a new list of rows, starting from estimated heights"""
+        self.heights = [self.estimate_height(item) for item in items]
+        self._update_tops()
+        super().set_items(items)
+
+    def _update_tops(self):
+        tops = [self.spacing]
+        for height in self.heights:
+            tops.append(tops[-1] + height + self.spacing)
+        self._tops = tops
+
+    def _content_height(self) -> int:
+        return self._tops[-1]
+
+    def _place_visible(self, width: int, height: int):
+        count = len(self.items)
+        first = max(0, bisect_right(self._tops, self.offset - self.overscan, 0, count) - 1)
+        last = bisect_left(self._tops, self.offset + height + self.overscan, 0, count)
+        self._release_outside(first, last)
+
+        for index in range(first, last):
+            self._place(
+                self._acquire(index),
+                x=self.padx,
+                y=self._tops[index] - self.offset,
+                width=width - 2 * self.padx,
+                height=self.heights[index]
+            )
+
+        if not self._measure_pending:
+            self._measure_pending = True
+            self.after_idle(self._measure)
+
+    def _measure(self):
+        """Replace estimated heights with the real ones of the shown rows"""
+        self._measure_pending = False
+        changed = False
+        for index, row in self._visible.items():
+            height = row.winfo_reqheight()
+            if height > 1 and height != self.heights[index]:
+                self.heights[index] = height
+                self.stats["measured"] += 1
+                changed = True
+        if changed:
+            self._update_tops()
+            self.layout.request()
@@ -0,0 +1,175 @@
+import tkinter as tk
+import customtkinter as ctk
+from typing import Any, Callable, Dict, List, Sequence
+
+from src.utils.layout import LayoutScheduler
+
+WHEEL_EVENTS = ("<MouseWheel>", "<Button-4>", "<Button-5>")
+
+class VirtualScroller(ctk.CTkFrame):
+    """Scrollable frame that only creates widgets for the visible items
+
+    Widgets are positioned with place() inside a clipping viewport.
+    Scrolling moves them, and widgets that leave the view go back to a
+    pool to be rebound to whichever items scroll in. Resize events are
+    coalesced into one layout pass per frame, done in place.
+
+    create_item(parent) builds an empty widget; bind_item(widget, item)
+    shows an item on it, and is also how pooled widgets are reused.
+    Subclasses decide where items go through _content_height and
+    _place_visible.
+    """
+
+    def __init__(
+        self,
+        master: Any,
+        create_item: Callable[[Any], Any],
+        bind_item: Callable[[Any, Any], None],
+        scroll_step: int = 90,
+        **kwargs
+    ):
+        super().__init__(master, fg_color="transparent", **kwargs)
+        self.create_item = create_item
+        self.bind_item = bind_item
+        self.scroll_step = scroll_step
+
+        self.items: List[Any] = []
+        self.offset = 0  # Scroll position in pixels
+        self._visible: Dict[int, Any] = {}  # Item index -> widget showing it
+        self._pool: List[Any] = []
+        self.stats = {"created": 0, "recycled": 0, "layouts": 0}
+
+        # Viewport clips the placed widgets; the scrollbar is driven by hand
+        self.viewport = ctk.CTkFrame(self, fg_color="transparent")
+        self.viewport.pack(side="left", fill="both", expand=True)
+        self.scrollbar = ctk.CTkScrollbar(self, command=self._on_scrollbar)
+        self.scrollbar.pack(side="right", fill="y")
+
+        # Bound once on the viewport itself, so leaving and revisiting a
+        # page never stacks handlers on the window
+        self.layout = LayoutScheduler(self, self.relayout)
+        self.viewport.bind("<Configure>", self.layout.request)
+        
+        # Wheel events are bound to a tag of this scroller's own widgets,
+        # leaving the app-wide bindings of other scrollable frames alone
+        self._wheel_tag = f"VirtualScroller{id(self)}"
+        for sequence in WHEEL_EVENTS:
+            self.bind_class(self._wheel_tag, sequence, self._on_wheel)
+        self._tag_wheel(self.viewport)
+        self._tag_wheel(self.scrollbar)
+
+    def set_items(self, items: Sequence[Any]):
+        """Show a new list of items, rebinding the widgets already on screen"""
+        self.items = list(items)
+        for index in list(self._visible):
+            self._release(index)
+        self.offset = 0
+        self.relayout()
+
+    def refresh(self):
+        """Rebind the visible widgets after their items changed"""
+        for index, widget in self._visible.items():
+            self.bind_item(widget, self.items[index])
+
+    def relayout(self):
+        """Lay out the visible items for the current viewport size"""
+        width = self.viewport.winfo_width()
+        height = self.viewport.winfo_height()
+        if width <= 1:
+            return  # Not mapped yet; <Configure> will call again
+
+        self.stats["layouts"] += 1
+        self._reflow(width)
+        self.offset = max(0, min(self.offset, self._content_height() - height))
+        self._update(width, height)
+
+    def scroll_to(self, offset: int):
+        """Scroll to a pixel offset from the top"""
+        height = self.viewport.winfo_height()
+        offset = max(0, min(int(offset), self._content_height() - height))
+        if offset != self.offset:
+            self.offset = offset
+            self._update(self.viewport.winfo_width(), height)
+
+    def _reflow(self, width: int):
+        """Recompute width-dependent layout before placing"""
+
+    def _content_height(self) -> int:
+        raise NotImplementedError
+
+    def _place_visible(self, width: int, height: int):
+        raise NotImplementedError
+
+    def _update(self, width: int, height: int):
+        self._place_visible(width, height)
+
+        # Scrollbar shows the visible fraction of the content
+        total = max(self._content_height(), 1)
+        self.scrollbar.set(self.offset / total, min(1.0, (self.offset + height) / total))
+
+    def _acquire(self, index: int):
+        """Widget showing items[index], taken from the pool when possible"""
+        widget = self._visible.get(index)
+        if widget is None:
+            if self._pool:
+                widget = self._pool.pop()
+                self.stats["recycled"] += 1
+            else:
+                widget = self.create_item(self.viewport)
+                self.stats["created"] += 1
+            self.bind_item(widget, self.items[index])
+            # Binding may have added children, e.g. more topic buttons
+            self._tag_wheel(widget)
+            self._visible[index] = widget
+        return widget
+
+    def _place(self, widget, x: float, y: float, width: float, height: float):
+        """Place widget at a size given in real pixels
+
+        CTk widgets refuse a size in place(), since theirs is scaled, but
+        the scroller measures the viewport in real pixels, so Tk's own
+        place() is used.
+        """
+        tk.Place.place_configure(widget, x=x, y=y, width=width, height=height)
+
+    def _release(self, index: int):
+        widget = self._visible.pop(index)
+        widget.place_forget()
+        self._pool.append(widget)
+
+    def _release_outside(self, first: int, last: int):
+        """Recycle widgets whose items scrolled out of [first, last)"""
+        for index in [i for i in self._visible if not first <= i < last]:
+            self._release(index)
+
+    def _on_scrollbar(self, action: str, amount: str, unit: str = None):
+        """Handle scrollbar commands, which follow Tk's yview protocol"""
+        if action == "moveto":
+            self.scroll_to(float(amount) * self._content_height())
+        elif action == "scroll":
+            step = self.viewport.winfo_height() if unit == "pages" else self.scroll_step
+            self.scroll_to(self.offset + int(amount) * step)
+
+    def _tag_wheel(self, widget):
+        """Route wheel events over widget and its children to this scroller"""
+        tags = widget.bindtags()
+        if self._wheel_tag not in tags:
+            widget.bindtags((self._wheel_tag,) + tags)
+        for child in widget.winfo_children():
+            self._tag_wheel(child)
+
+    def _on_wheel(self, event):
+        if getattr(event, "num", None) == 4:
+            delta = -1
+        elif getattr(event, "num", None) == 5:
+            delta = 1
+        else:
+            delta = -1 if event.delta > 0 else 1
+        self.scroll_to(self.offset + delta * self.scroll_step)
+        return "break"  # Don't also scroll an enclosing frame
+
+    def destroy(self):
+        self.layout.cancel()
+        for sequence in WHEEL_EVENTS:
+            self.unbind_class(self._wheel_tag, sequence)
+        super().destroy()
@@ -1,6 +1,7 @@
 import customtkinter as ctk
 from PIL import Image
 import os
+from src.utils.animation import animation_clock, linear
 
 class TransitionManager:
     def __init__(self, master):
@@ -8,7 +9,8 @@ class TransitionManager:
         self.overlay = None
         self.callback = None
         self.fade_step = 0.1
-        self.fade_delay = 10  # milliseconds
+        self.fade_delay = 10  # milliseconds per fade_step
+        self._fade = None
     
     def fade_out(self, callback=None):
         """Start fade out transition"""
@@ -27,47 +29,42 @@ class TransitionManager:
         self.overlay._fg_color = (0, 0, 0, 0)
         
         # Start fade out animation
-        self._fade_out_step(0)
+        self._start_fade(0.0, 1.0, self._on_faded_out)
     
     def fade_in(self):
         """Start fade in transition"""
         if self.overlay:
             # Start fade in animation
-            self._fade_in_step(1)
+            self._start_fade(1.0, 0.0, self._on_faded_in)
     
-    def _fade_out_step(self, alpha):
-        """Perform one step of fade out animation"""
-        if alpha < 1:
+    def _start_fade(self, start, end, callback):
+        """Animate the overlay alpha from start to end on the shared clock"""
+        if self._fade:
+            self._fade.cancel()
+        
+        overlay = self.overlay
+        def _set_alpha(progress):
             # Update overlay opacity
-            self.overlay._fg_color = (0, 0, 0, alpha)
-            self.overlay.configure(fg_color=f"#000000")
-            
-            # Schedule next step
-            self.master.after(
-                self.fade_delay,
-                lambda: self._fade_out_step(alpha + self.fade_step)
-            )
-        else:
-            # Fade out complete, call callback
-            if self.callback:
-                self.callback()
+            overlay._fg_color = (0, 0, 0, start + (end - start) * progress)
+            overlay.configure(fg_color=f"#000000")
+        
+        self._fade = animation_clock.animate(
+            self.master,
+            int(self.fade_delay / self.fade_step),
+            _set_alpha,
+            callback,
+            ease=linear
+        )
     
-    def _fade_in_step(self, alpha):
-        """Perform one step of fade in animation"""
-        if alpha > 0:
-            # Update overlay opacity
-            self.overlay._fg_color = (0, 0, 0, alpha)
-            self.overlay.configure(fg_color=f"#000000")
-            
-            # Schedule next step
-            self.master.after(
-                self.fade_delay,
-                lambda: self._fade_in_step(alpha - self.fade_step)
-            )
-        else:
-            # Fade in complete, remove overlay
-            self.overlay.destroy()
-            self.overlay = None
+    def _on_faded_out(self):
+        # Fade out complete, call callback
+        if self.callback:
+            self.callback()
+    
+    def _on_faded_in(self):
+        # Fade in complete, remove overlay
+        self.overlay.destroy()
+        self.overlay = None
 
 class TouchScrollableFrame(ctk.CTkScrollableFrame):
     def __init__(self, master, **kwargs):
@@ -0,0 +1,114 @@
+import threading
+import time
+
+from src.utils.async_db import AsyncDatabase, deliver
+
+class FakeWidget:
+    """Stand-in for a Tk widget: after() queues callbacks run by pump()"""
+
+    def __init__(self):
+        self.queue = []
+        self.alive = True
+
+    def after(self, ms, func):
+        self.queue.append((time.perf_counter() + ms / 1000, func))
+        return f"after#{len(self.queue)}"
+
+    def winfo_exists(self):
+        return self.alive
+
+    def pump(self, until, timeout=5.0):
+        """Run due callbacks on this thread until until() is true"""
+        deadline = time.perf_counter() + timeout
+        while not until():
+            assert time.perf_counter() < deadline, "event loop timed out"
+            now = time.perf_counter()
+            due = [entry for entry in self.queue if entry[0] <= now]
+            self.queue = [entry for entry in self.queue if entry[0] > now]
+            for _, func in due:
+                func()
+            time.sleep(0.001)
+
+class SlowDatabase:
+    """Database stub whose lookups take a while on the worker thread"""
+
+    def __init__(self, delay=0.2):
+        self.delay = delay
+        self.threads = []
+
+    def load_email_filter(self):
+        pass
+
+    def user_exists(self, email):
+        self.threads.append(threading.get_ident())
+        time.sleep(self.delay)
+        return email == "ada@example.com"
+
+    def close(self):
+        pass
+
+def test_deliver_keeps_event_loop_running():
+    widget = FakeWidget()
+    database = SlowDatabase()
+    db = AsyncDatabase(database)
+    results = []
+    ticks = []
+
+    def tick():
+        ticks.append(time.perf_counter())
+        if not results:
+            widget.after(10, tick)
+
+    try:
+        deliver(widget, db.user_exists("ada@example.com"),
+                lambda exists: results.append((exists, threading.get_ident())),
+                poll_ms=5)
+        widget.after(10, tick)
+        widget.pump(lambda: results)
+    finally:
+        db.shutdown()
+
+    exists, thread = results[0]
+    assert exists is True
+    # The result is handed over on the polling thread, not the worker
+    assert thread == threading.get_ident()
+    assert database.threads and database.threads[0] != thread
+    # Other callbacks kept running while the query was in flight
+    assert len(ticks) >= 5
+
+def test_deliver_polls_until_done():
+    widget = FakeWidget()
+    db = AsyncDatabase(SlowDatabase(delay=0.1))
+    polls = []
+    results = []
+
+    after = widget.after
+    def counting_after(ms, func):
+        polls.append(ms)
+        return after(ms, func)
+    widget.after = counting_after
+
+    try:
+        deliver(widget, db.user_exists("nobody@example.com"), results.append, poll_ms=5)
+        widget.pump(lambda: results)
+    finally:
+        db.shutdown()
+
+    assert results == [False]
+    assert len(polls) > 1
+
+def test_deliver_drops_result_for_destroyed_widget():
+    widget = FakeWidget()
+    db = AsyncDatabase(SlowDatabase(delay=0.05))
+    results = []
+
+    try:
+        future = db.user_exists("ada@example.com")
+        deliver(widget, future, results.append, poll_ms=5)
+        widget.alive = False
+        future.result()
+        widget.pump(lambda: not widget.queue)
+    finally:
+        db.shutdown()
+
+    assert results == []
@@ -0,0 +1,62 @@
+from src.utils.layout import LayoutScheduler
+
+class FakeWidget:
+    """Stand-in for a Tk widget whose after() callbacks run on demand"""
+
+    def __init__(self):
+        self.pending = {}
+        self.next_id = 0
+
+    def after(self, ms, func):
+        self.next_id += 1
+        after_id = f"after#{self.next_id}"
+        self.pending[after_id] = func
+        return after_id
+
+    def after_cancel(self, after_id):
+        self.pending.pop(after_id, None)
+
+    def run_pending(self):
+        pending, self.pending = self.pending, {}
+        for func in pending.values():
+            func()
+
+def test_burst_of_requests_runs_once():
+    widget = FakeWidget()
+    calls = []
+    scheduler = LayoutScheduler(widget, lambda: calls.append(1))
+
+    for _ in range(100):
+        scheduler.request()
+    assert len(widget.pending) == 1
+
+    widget.run_pending()
+    assert scheduler.stats == {"requests": 100, "runs": 1}
+    assert calls == [1]
+    assert not scheduler.pending
+
+def test_request_after_run_schedules_again():
+    widget = FakeWidget()
+    scheduler = LayoutScheduler(widget, lambda: None)
+
+    scheduler.request()
+    widget.run_pending()
+    scheduler.request()
+    widget.run_pending()
+    assert scheduler.stats == {"requests": 2, "runs": 2}
+
+def test_cancel_and_flush():
+    widget = FakeWidget()
+    calls = []
+    scheduler = LayoutScheduler(widget, lambda: calls.append(1))
+
+    scheduler.request()
+    scheduler.cancel()
+    widget.run_pending()
+    assert calls == []
+
+    scheduler.request()
+    scheduler.flush()
+    assert calls == [1]
+    assert widget.pending == {}
+    assert scheduler.stats == {"requests": 2, "runs": 1}
@@ -0,0 +1,69 @@
+import sqlite3
+
+import pytest
+
+from src.utils.migrations import (
+    MIGRATIONS,
+    assert_no_full_scans,
+    check_hot_queries,
+    migrate,
+    schema_version,
+)
+
+LATEST = MIGRATIONS[-1][0]
+
+# users as the first release created it, before user_version was set
+BASELINE_SCHEMA = """
+    CREATE TABLE IF NOT EXISTS users (
+        id INTEGER PRIMARY KEY AUTOINCREMENT,
+        email TEXT UNIQUE NOT NULL,
+        password_hash TEXT NOT NULL,
+        name TEXT,
+        created_at TIMESTAMP DEFAULT CURRENT_TIMESTAMP
+    )
+"""
+
+def tables(conn):
+    return {name for (name,) in conn.execute("SELECT name FROM sqlite_master WHERE type = 'table'")}
+
+def test_fresh_database_migrates_to_latest(tmp_path):
+    conn = sqlite3.connect(tmp_path / "users.db")
+    assert schema_version(conn) == 0
+
+    assert migrate(conn) == LATEST
+    assert schema_version(conn) == LATEST
+    assert {"users", "user_progress", "league_members", "learning_events", "daily_rollups"} <= tables(conn)
+
+    # Running again is a no-op
+    assert migrate(conn) == LATEST
+    conn.close()
+
+def test_baseline_users_table_is_upgraded(tmp_path):
+    path = tmp_path / "users.db"
+    conn = sqlite3.connect(path)
+    conn.execute(BASELINE_SCHEMA)
+    conn.execute(
+        "INSERT INTO users (email, password_hash, name) VALUES (?, ?, ?)",
+        ("ada@example.com", "5e884898da28047151d0e56f8dc6292773603d0d6aabbdd62a11ef721d1542d8", "Ada")
+    )
+    conn.commit()
+    conn.close()
+
+    conn = sqlite3.connect(path)
+    assert migrate(conn) == LATEST
+    assert conn.execute("SELECT email, name FROM users").fetchall() == [("ada@example.com", "Ada")]
+    assert "user_progress" in tables(conn)
+    conn.close()
+
+def test_hot_queries_use_indexes(tmp_path):
+    conn = sqlite3.connect(tmp_path / "users.db")
+    migrate(conn)
+    check_hot_queries(conn)
+    conn.close()
+
+def test_full_scan_is_reported(tmp_path):
+    conn = sqlite3.connect(tmp_path / "users.db")
+    migrate(conn)
+    with pytest.raises(AssertionError, match="Full scan"):
+        assert_no_full_scans(conn, "SELECT id FROM users WHERE name = ?", ("Ada",))
+    conn.close()
@@ -0,0 +1,25 @@
+import os
+from src.utils.render_cache import RenderCache
+
+def test_overwrite_counts_only_the_new_size(tmp_path):
+    cache = RenderCache(str(tmp_path), max_bytes=1000)
+
+    cache.put("a", b"x" * 40)
+    for _ in range(10):
+        cache.put("b", b"y" * 40)
+    cache.put("b", b"y" * 10)
+
+    assert cache._disk_bytes == 50
+    assert cache.stats["evictions"] == 0
+
+def test_over_cap_evicts_least_recently_used(tmp_path):
+    cache = RenderCache(str(tmp_path), max_bytes=100)
+
+    cache.put("a", b"x" * 40)
+    os.utime(os.path.join(str(tmp_path), "a"), (0, 0))
+    cache.put("b", b"y" * 40)
+    cache.put("c", b"z" * 40)
+
+    assert not os.path.exists(os.path.join(str(tmp_path), "a"))
+    assert cache._disk_bytes == 80
+    assert cache.stats["evictions"] == 1
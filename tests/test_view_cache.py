@@ -0,0 +1,80 @@
+from src.views.view_cache import ViewCache
+
+class FakeFrame:
+    """Stand-in for a Tk frame that records packing and destruction"""
+
+    def __init__(self, parent=None):
+        self.children = []
+        self.packed = False
+        self.destroyed = False
+
+    def winfo_children(self):
+        return self.children
+
+    def pack(self, **options):
+        self.packed = True
+
+    def pack_forget(self):
+        self.packed = False
+
+    def destroy(self):
+        self.destroyed = True
+
+def build_with(widgets):
+    """Builder adding widgets children to the view's frame"""
+    def build(frame):
+        frame.children.extend(FakeFrame() for _ in range(widgets))
+    return build
+
+def test_hidden_view_is_reshown_without_rebuilding():
+    views = ViewCache(None, make_frame=FakeFrame)
+    first = views.show("a", 1, build_with(2))
+    second = views.show("b", 1, build_with(2))
+    assert not first.packed and second.packed
+
+    assert views.show("a", 1, build_with(2)) is first
+    assert first.packed and not second.packed
+    assert views.stats == {"hits": 1, "builds": 2, "invalidated": 0, "evicted": 0}
+
+def test_version_change_rebuilds_view():
+    views = ViewCache(None, make_frame=FakeFrame)
+    old = views.show("a", 1, build_with(2))
+    views.show("b", 1, build_with(2))
+
+    new = views.show("a", 2, build_with(2))
+    assert new is not old
+    assert old.destroyed
+    assert views.stats["invalidated"] == 1
+    assert views.stats["builds"] == 3
+
+def test_least_recently_used_views_are_evicted_over_budget():
+    # Each view is its frame plus four children
+    views = ViewCache(None, widget_budget=12, make_frame=FakeFrame)
+    a = views.show("a", 1, build_with(4))
+    b = views.show("b", 1, build_with(4))
+    views.show("a", 1, build_with(4))  # b is now least recently used
+
+    views.show("c", 1, build_with(4))
+    assert b.destroyed and not a.destroyed
+    assert views.widget_count == 10
+    assert views.stats["evicted"] == 1
+
+def test_shown_view_is_kept_over_budget():
+    views = ViewCache(None, widget_budget=3, make_frame=FakeFrame)
+    views.show("a", 1, build_with(4))
+    shown = views.show("b", 1, build_with(4))
+    assert not shown.destroyed
+    assert views.current == "b"
+    assert views.widget_count == 5
+
+def test_invalidate_marks_shown_view_stale():
+    views = ViewCache(None, make_frame=FakeFrame)
+    hidden = views.show("a", 1, build_with(1))
+    shown = views.show("b", 1, build_with(1))
+
+    views.invalidate()
+    assert hidden.destroyed and not shown.destroyed
+
+    # Same version, but the stale mark forces a rebuild
+    assert views.show("b", 1, build_with(1)) is not shown
+    assert shown.destroyed
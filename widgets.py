@@ -3,18 +3,24 @@ import matplotlib.pyplot as plt
 from matplotlib.backends.backend_tkagg import FigureCanvasTkAgg
 import matplotlib
 matplotlib.use('TkAgg')
+# Built-in mathtext with Computer Modern glyphs; usetex would spawn a
+# LaTeX toolchain for every formula
 plt.rcParams.update({
-    "text.usetex": True,
+    "mathtext.fontset": "cm",
     "font.family": "serif",
-    "font.serif": ["Computer Modern Roman"],
 })
-from sympy import preview
 import io
 from PIL import Image, ImageTk
 import os
-import tempfile
+import time
 from pathlib import Path
 from tkhtmlview import HTMLScrolledText
+from src.utils.latex_unicode import latex_to_unicode
+from src.utils.lesson_pages import page_file
+from src.utils.lesson_store import lesson_store
+from src.utils.animation import animation_clock, linear
+from src.utils.layout import LayoutScheduler
+from src.views.widgets.virtual_scroll import VirtualScroller
 import tkinter as tk
 import sys
 sys.path.append("C:\\PyQt6")
@@ -31,6 +37,12 @@ class TransitionManager:
         self.fade_steps = 20  # Increased steps for smoother transition
         self.fade_delay = 10  # Decreased delay for faster overall transition
         self.fade_color = "#1a1a1a"  # Darker gray instead of pure black for softer transition
+        self._fade = None
+        
+        # Keep the overlay aligned with the parent; bound once, since the
+        # parent also sees the <Configure> events of all its children
+        self._overlay_layout = LayoutScheduler(parent, self._update_overlay_position)
+        self.parent.bind('<Configure>', self._overlay_layout.request, add="+")
 
     def _ease_in_out(self, t):
         # Cubic easing function for smoother acceleration and deceleration
@@ -62,9 +74,6 @@ class TransitionManager:
         self.overlay.lift()
         self.overlay.attributes('-topmost', True)
         
-        # Bind to parent's Configure event to keep overlay aligned
-        self.parent.bind('<Configure>', self._update_overlay_position)
-        
         return self.overlay
 
     def _update_overlay_position(self, event=None):
@@ -76,39 +85,44 @@ class TransitionManager:
             self.overlay.geometry(f"{w}x{h}+{x}+{y}")
 
     def fade_out(self, callback=None):
-        def _fade_out(step=0):
-            if step <= self.fade_steps:
-                progress = step / self.fade_steps
-                opacity = self._ease_in_out(progress)
-                if self.overlay:
-                    self.overlay.attributes('-alpha', opacity)
-                    self._update_overlay_position()
-                self.parent.after(self.fade_delay, lambda: _fade_out(step + 1))
-            else:
-                if callback:
-                    self.parent.after(50, callback)  # Small pause at full opacity
+        def _set_opacity(progress):
+            if self.overlay:
+                self.overlay.attributes('-alpha', progress)
+
+        def _done():
+            if callback:
+                self.parent.after(50, callback)  # Small pause at full opacity
 
         if not self.overlay:
             self.create_overlay()
-        _fade_out()
+        self._start_fade(_set_opacity, _done)
 
     def fade_in(self, callback=None):
-        def _fade_in(step=0):
-            if step <= self.fade_steps:
-                progress = step / self.fade_steps
-                opacity = 1.0 - self._ease_in_out(progress)
-                if self.overlay:
-                    self.overlay.attributes('-alpha', opacity)
-                    self._update_overlay_position()
-                self.parent.after(self.fade_delay, lambda: _fade_in(step + 1))
-            else:
-                if self.overlay:
-                    self.overlay.destroy()
-                    self.overlay = None
-                if callback:
-                    callback()
-
-        _fade_in()
+        def _set_opacity(progress):
+            if self.overlay:
+                self.overlay.attributes('-alpha', 1.0 - progress)
+
+        def _done():
+            if self.overlay:
+                self.overlay.destroy()
+                self.overlay = None
+            if callback:
+                callback()
+
+        self._start_fade(_set_opacity, _done)
+
+    def _start_fade(self, update, callback):
+        # A new fade replaces one still running, so a late fade-in can't
+        # destroy the overlay of the next fade-out
+        if self._fade:
+            self._fade.cancel()
+        self._fade = animation_clock.animate(
+            self.parent,
+            self.fade_steps * self.fade_delay,
+            update,
+            callback,
+            ease=self._ease_in_out
+        )
 
 class HeaderBar(ctk.CTkFrame):
     def __init__(self, parent, xp, points, streak):
@@ -130,19 +144,23 @@ class HeaderBar(ctk.CTkFrame):
         stats_frame.grid(row=0, column=2, padx=10)
 
         # Stats in horizontal layout
-        stats = [
-            (f"🏆 {xp} XP", "xp"),
-            (f"💎 {points}", "points"),
-            (f"🔥 {streak}", "streak")
-        ]
-
-        for i, (text, _) in enumerate(stats):
+        self.stat_labels = {}
+        for i, name in enumerate(("xp", "points", "streak")):
             label = ctk.CTkLabel(
                 stats_frame,
-                text=text,
+                text="",
                 font=("Helvetica", 12)  # Smaller font
             )
             label.grid(row=0, column=i, padx=5)
+            self.stat_labels[name] = label
+        
+        self.update_stats(xp, points, streak)
+
+    def update_stats(self, xp, points, streak):
+        """Show new stats in place"""
+        self.stat_labels["xp"].configure(text=f"🏆 {xp} XP")
+        self.stat_labels["points"].configure(text=f"💎 {points}")
+        self.stat_labels["streak"].configure(text=f"🔥 {streak}")
 
 class TouchScrollableFrame(ctk.CTkScrollableFrame):
     def __init__(self, *args, **kwargs):
@@ -239,20 +257,17 @@ class DraggableCard(ctk.CTkFrame):
         target_x = self._original_pos[0]
         target_y = self._original_pos[1]
         
-        dx = (target_x - current_x) / steps
-        dy = (target_y - current_y) / steps
+        def _move(progress):
+            self.place(x=current_x + (target_x - current_x) * progress,
+                       y=current_y + (target_y - current_y) * progress)
         
-        def _step(step):
-            if step < steps:
-                self.place(x=current_x + dx * (step + 1),
-                         y=current_y + dy * (step + 1))
-                self.after(20, lambda: _step(step + 1))
-            else:
+        def _done():
+            if self._original_grid_info:
                 # Restore original grid position
                 self.place_forget()
                 self.grid(**self._original_grid_info)
         
-        _step(0)
+        animation_clock.animate(self, steps * 20, _move, _done, ease=linear)
 
 class SubjectCard(DraggableCard):
     def __init__(self, parent, subject, data, command):
@@ -276,51 +291,59 @@ class SubjectCard(DraggableCard):
         content_frame.grid_rowconfigure((0, 5), weight=1)  # Add weight to top and bottom rows
         
         # Icon with increased size
-        icon_label = ctk.CTkLabel(
+        self.icon_label = ctk.CTkLabel(
             content_frame,
-            text=data["icon"],
-            font=("Helvetica", 84),  # Increased font size
-            text_color=data["color"]  # Use subject color for icon
+            text="",
+            font=("Helvetica", 84)  # Increased font size
         )
-        icon_label.pack(pady=(0, 15))
+        self.icon_label.pack(pady=(0, 15))
         
         # Subject name with larger font
-        subject_label = ctk.CTkLabel(
+        self.subject_label = ctk.CTkLabel(
             content_frame,
-            text=subject,
-            font=("Helvetica", 28, "bold"),  # Increased font size
-            text_color=data["color"]
+            text="",
+            font=("Helvetica", 28, "bold")  # Increased font size
         )
-        subject_label.pack(pady=(0, 20))
+        self.subject_label.pack(pady=(0, 20))
         
         # Unit count with medium font
-        unit_count = len(data["units"])
-        units_label = ctk.CTkLabel(
+        self.units_label = ctk.CTkLabel(
             content_frame,
-            text=f"{unit_count} Units",
+            text="",
             font=("Helvetica", 18),  # Increased font size
             text_color="#ffffff"
         )
-        units_label.pack(pady=(0, 25))
+        self.units_label.pack(pady=(0, 25))
         
         # Larger start button with hover effect
         self.start_button = ctk.CTkButton(
             content_frame,
             text="Start Learning",
             font=("Helvetica", 20),
-            fg_color=data["color"],
-            hover_color=self._adjust_color_brightness(data["color"], 0.8),  # Darker on hover
-            command=command,
             width=240,  # Increased width
             height=50,  # Increased height
             corner_radius=25  # Rounded corners
         )
         self.start_button.pack(pady=(0, 0))
         
+        self.set_data(subject, data, command)
+        
         # Store color for hover effect
         self._normal_color = "#2b2b2b"
         self._hover_color = "#323232"
     
+    def set_data(self, subject, data, command):
+        """Show a subject on this card; lets a grid reuse cards"""
+        self.subject = subject
+        self.icon_label.configure(text=data["icon"], text_color=data["color"])
+        self.subject_label.configure(text=subject, text_color=data["color"])
+        self.units_label.configure(text=f"{len(data['units'])} Units")
+        self.start_button.configure(
+            fg_color=data["color"],
+            hover_color=self._adjust_color_brightness(data["color"], 0.8),  # Darker on hover
+            command=command
+        )
+    
     def _adjust_color_brightness(self, hex_color, factor):
         """Adjust the brightness of a hex color"""
         # Convert hex to RGB
@@ -343,7 +366,9 @@ class SubjectCard(DraggableCard):
     
     def _store_grid_info(self, event):
         """Store grid information when the widget is mapped"""
-        self._original_grid_info = self.grid_info()
+        # Cards placed by a VirtualGrid have no grid info to restore
+        if self.winfo_manager() == "grid":
+            self._original_grid_info = self.grid_info()
 
 class NavigationBar(ctk.CTkFrame):
     def __init__(self, parent, back_text, back_command, title_text, title_color=None):
@@ -381,9 +406,13 @@ class NavigationBar(ctk.CTkFrame):
         header_label.grid(row=0, column=1, sticky="w")
 
 class UnitSection(ctk.CTkFrame):
+    # Layout metrics used to estimate a section's height before it is built
+    HEADER_HEIGHT = 74
+    TOPIC_ROW_HEIGHT = 54
+    TOPICS_PADDING = 20
+
     def __init__(self, parent, unit, index, color, topic_callback):
         super().__init__(parent, fg_color="#2b2b2b", corner_radius=10)
-        self.pack(fill='x', padx=20, pady=10)
         
         # Make the entire section draggable
         self.bind("<Button-1>", self._on_press)
@@ -410,44 +439,71 @@ class UnitSection(ctk.CTkFrame):
         )
         unit_icon.pack(side='left', padx=(0, 10))
 
-        unit_label = ctk.CTkLabel(
+        self.unit_label = ctk.CTkLabel(
             title_frame,
-            text=f"Unit {index + 1}: {unit['name']}",
-            font=("Helvetica", 20, "bold"),
-            text_color=color
+            text="",
+            font=("Helvetica", 20, "bold")
         )
-        unit_label.pack(side='left')
+        self.unit_label.pack(side='left')
 
         # Progress section
         progress_frame = ctk.CTkFrame(header_frame, fg_color="transparent")
         progress_frame.grid(row=0, column=2, sticky="e", padx=(10, 0))
 
-        progress = ctk.CTkProgressBar(progress_frame, width=120)
-        progress.pack(side='left', padx=10)
-        progress.set(0)  # Set initial progress
+        self.progress = ctk.CTkProgressBar(progress_frame, width=120)
+        self.progress.pack(side='left', padx=10)
 
-        progress_text = ctk.CTkLabel(
+        self.progress_text = ctk.CTkLabel(
             progress_frame,
             text="0%",
             font=("Helvetica", 14)
         )
-        progress_text.pack(side='left')
+        self.progress_text.pack(side='left')
 
         # Topics container with grid layout
-        topics_frame = ctk.CTkFrame(self, fg_color="transparent")
-        topics_frame.pack(fill='x', padx=15, pady=10)
+        self.topics_frame = ctk.CTkFrame(self, fg_color="transparent")
+        self.topics_frame.pack(fill='x', padx=15, pady=10)
         
         # Configure grid for topics (2 columns)
-        topics_frame.grid_columnconfigure((0, 1), weight=1)
+        self.topics_frame.grid_columnconfigure((0, 1), weight=1)
+        
+        # Topic buttons, kept and reused when the section shows another unit
+        self._topic_buttons = []
+        
+        self.set_unit(unit, index, color, topic_callback)
 
-        # Create topic buttons in a grid
-        for i, topic in enumerate(unit["topics"]):
-            is_locked = index > 0 or i > 0  # Lock all topics except the first one in first unit
+    @classmethod
+    def estimate_height(cls, topic_count):
+        """Approximate height of a section, before it is built"""
+        rows = (topic_count + 1) // 2
+        return cls.HEADER_HEIGHT + cls.TOPICS_PADDING + rows * cls.TOPIC_ROW_HEIGHT
+
+    def set_unit(self, unit, index, color, topic_callback):
+        """Show a unit on this section; lets a list reuse sections"""
+        topics = unit["topics"]
+        # Lock all topics except the first one in first unit unless told otherwise
+        locked = unit.get("locked") or [index > 0 or i > 0 for i in range(len(topics))]
+        progress = unit.get("progress", 0.0)
+        
+        self.unit_label.configure(text=f"Unit {index + 1}: {unit['name']}", text_color=color)
+        self.progress.set(progress / 100)
+        self.progress_text.configure(text=f"{progress:.0f}%")
+        
+        # Create topic buttons in a grid, only adding the ones missing
+        while len(self._topic_buttons) < len(topics):
+            i = len(self._topic_buttons)
             row = i // 2  # Integer division for row number
             col = i % 2   # Remainder for column number
-            self._create_topic_button(topics_frame, topic, row, col, is_locked, color, topic_callback)
+            self._topic_buttons.append(self._create_topic_button(self.topics_frame, row, col))
+        
+        for i, (button_frame, button) in enumerate(self._topic_buttons):
+            if i < len(topics):
+                self._set_topic_button(button, topics[i], locked[i], color, topic_callback)
+                button_frame.grid()
+            else:
+                button_frame.grid_remove()
 
-    def _create_topic_button(self, parent, topic, row, col, locked, color, callback):
+    def _create_topic_button(self, parent, row, col):
         # Create frame to hold icon and text
         button_frame = ctk.CTkFrame(parent, fg_color="transparent")
         button_frame.grid(row=row, column=col, padx=5, pady=5, sticky="ew")
@@ -455,16 +511,22 @@ class UnitSection(ctk.CTkFrame):
 
         button = ctk.CTkButton(
             button_frame,
-            text=f"{'🔒' if locked else '📖'} {topic}",
+            text="",
             font=("Helvetica", 16),
-            fg_color="#3b3b3b" if locked else color,
-            hover_color="#4b4b4b" if locked else self._adjust_color_brightness(color, 0.8),
-            state="disabled" if locked else "normal",
-            command=lambda: callback(topic) if not locked else None,
             height=40,  # Fixed height
             corner_radius=8
         )
         button.pack(fill='x', padx=5, pady=2)
+        return button_frame, button
+
+    def _set_topic_button(self, button, topic, locked, color, callback):
+        button.configure(
+            text=f"{'🔒' if locked else '📖'} {topic}",
+            fg_color="#3b3b3b" if locked else color,
+            hover_color="#4b4b4b" if locked else self._adjust_color_brightness(color, 0.8),
+            state="disabled" if locked else "normal",
+            command=lambda: callback(topic) if not locked else None
+        )
     
     def _adjust_color_brightness(self, hex_color, factor):
         """Adjust the brightness of a hex color"""
@@ -491,6 +553,8 @@ class UnitSection(ctk.CTkFrame):
                 parent = self.nametowidget(self.winfo_parent())
                 if isinstance(parent, (ctk.CTkScrollableFrame, TouchScrollableFrame)):
                     parent._parent_canvas.yview_scroll(-dy, "units")
+                elif isinstance(parent.master, VirtualScroller):
+                    parent.master.scroll_to(parent.master.offset - dy)
     
     def _on_release(self, event):
         # Reset drag state
@@ -522,26 +586,26 @@ class SidebarWidget(ctk.CTkFrame):
         league_frame.grid_columnconfigure(0, weight=1)
 
         # League info in horizontal layout
-        league_label = ctk.CTkLabel(
+        self.league_label = ctk.CTkLabel(
             league_frame,
-            text=f"{league_data['league']} League",
+            text="",
             font=("Helvetica", 14, "bold")  # Smaller font
         )
-        league_label.grid(row=0, column=0, sticky="w", padx=5)
+        self.league_label.grid(row=0, column=0, sticky="w", padx=5)
 
-        rank_label = ctk.CTkLabel(
+        self.rank_label = ctk.CTkLabel(
             league_frame,
-            text=f"#{league_data['rank']}",
+            text="",
             font=("Helvetica", 12)  # Smaller font
         )
-        rank_label.grid(row=0, column=1, sticky="e", padx=5)
+        self.rank_label.grid(row=0, column=1, sticky="e", padx=5)
 
-        xp_label = ctk.CTkLabel(
+        self.xp_label = ctk.CTkLabel(
             league_frame,
-            text=f"{league_data['xp']} XP this week",
+            text="",
             font=("Helvetica", 11)  # Smaller font
         )
-        xp_label.grid(row=1, column=0, columnspan=2, sticky="w", padx=5, pady=(0, 2))
+        self.xp_label.grid(row=1, column=0, columnspan=2, sticky="w", padx=5, pady=(0, 2))
 
         # Progress section - Row 2
         progress_frame = ctk.CTkFrame(self)
@@ -555,16 +619,15 @@ class SidebarWidget(ctk.CTkFrame):
         )
         progress_label.grid(row=0, column=0, sticky="w", padx=5, pady=(2, 0))
 
-        progress = ctk.CTkProgressBar(progress_frame, width=150)  # Slightly narrower
-        progress.grid(row=1, column=0, sticky="ew", padx=5, pady=2)
-        progress.set(progress_data['progress'] / progress_data['goal'])
+        self.progress = ctk.CTkProgressBar(progress_frame, width=150)  # Slightly narrower
+        self.progress.grid(row=1, column=0, sticky="ew", padx=5, pady=2)
 
-        quest_label = ctk.CTkLabel(
+        self.quest_label = ctk.CTkLabel(
             progress_frame,
-            text=f"{progress_data['progress']}/{progress_data['goal']} lessons",
+            text="",
             font=("Helvetica", 11)  # Smaller font
         )
-        quest_label.grid(row=2, column=0, sticky="w", padx=5, pady=(0, 2))
+        self.quest_label.grid(row=2, column=0, sticky="w", padx=5, pady=(0, 2))
 
         # Achievements section - Row 3
         achievements_frame = ctk.CTkFrame(self)
@@ -592,6 +655,22 @@ class SidebarWidget(ctk.CTkFrame):
             )
             achievement_item.grid(row=i+1, column=0, sticky="w", padx=5, pady=1)
 
+        self.update_progress(league_data, progress_data)
+
+    def update_progress(self, league_data, progress_data):
+        """Show new league standing and daily progress in place"""
+        self.league_label.configure(text=f"{league_data['league']} League")
+        # Rank is only known once a user is set
+        if league_data.get('rank') is not None:
+            self.rank_label.configure(text=f"#{league_data['rank']}")
+            self.rank_label.grid()
+        else:
+            self.rank_label.grid_remove()
+        self.xp_label.configure(text=f"{league_data['xp']} XP this week")
+
+        self.progress.set(min(1.0, progress_data['progress'] / progress_data['goal']))
+        self.quest_label.configure(text=f"{progress_data['progress']}/{progress_data['goal']} lessons")
+
 class LatexLabel(ctk.CTkLabel):
     def __init__(self, parent, latex_text, **kwargs):
         # Convert LaTeX to unicode math symbols where possible
@@ -599,49 +678,8 @@ class LatexLabel(ctk.CTkLabel):
         super().__init__(parent, text=text, font=("Helvetica", 14), **kwargs)
     
     def _convert_to_unicode(self, latex):
-        # Basic LaTeX to Unicode conversions
-        replacements = {
-            "\\alpha": "α", "\\beta": "β", "\\gamma": "γ",
-            "\\pm": "±", "\\times": "×", "\\div": "÷",
-            "\\leq": "≤", "\\geq": "≥", "\\neq": "≠",
-            "\\approx": "≈", "\\sqrt": "√", "\\infty": "∞",
-            "^2": "²", "^3": "³", "^n": "ⁿ",
-            "_1": "₁", "_2": "₂", "_3": "₃",
-            "\\rightarrow": "→", "\\leftarrow": "←",
-            "\\sum": "Σ", "\\prod": "∏",
-            "\\frac": "/",  # Simplified fraction representation
-        }
-        
-        result = latex
-        
-        # Remove $ signs
-        result = result.replace("$", "")
-        
-        # Handle fractions specially
-        if "\\frac" in result:
-            # Extract numerator and denominator
-            parts = result.split("\\frac{")
-            for i in range(1, len(parts)):
-                try:
-                    num_end = parts[i].find("}")
-                    numerator = parts[i][:num_end]
-                    denom_start = parts[i].find("{", num_end)
-                    denom_end = parts[i].find("}", denom_start)
-                    denominator = parts[i][denom_start+1:denom_end]
-                    rest = parts[i][denom_end+1:]
-                    parts[i] = f"({numerator}/{denominator}){rest}"
-                except:
-                    continue
-            result = "".join(parts)
-        
-        # Apply other replacements
-        for tex, unicode in replacements.items():
-            result = result.replace(tex, unicode)
-        
-        # Remove remaining curly braces
-        result = result.replace("{", "").replace("}", "")
-        
-        return result
+        # Tokenizing converter, memoized across labels
+        return latex_to_unicode(latex)
 
 class MathText(ctk.CTkTextbox):
     def __init__(self, parent, height=30, **kwargs):
@@ -655,237 +693,51 @@ class MathText(ctk.CTkTextbox):
         self.configure(state="disabled")
 
 class LessonContent(ctk.CTkFrame):
-    def __init__(self, master, topic, **kwargs):
+    def __init__(self, master, topic, content=None, **kwargs):
         super().__init__(master, **kwargs)
         self.topic = topic
-        self.temp_files = []  # Initialize temp_files list
+        self.content = content or lesson_store.default()
+        self.page_files = {}  # Tab name -> cached HTML page
+        self.build_times = {}  # Tab name -> build time in ms
         
         # Create tabs
-        self.tabview = ctk.CTkTabview(self)
+        self.tabview = ctk.CTkTabview(self, command=self._on_tab_changed)
         self.tabview.pack(fill="both", expand=True, padx=10, pady=10)
         
         # Add tabs
         self.learn_tab = self.tabview.add("Learn")
         self.practice_tab = self.tabview.add("Practice")
         self.quiz_tab = self.tabview.add("Quiz")
+        self._tabs = {"Learn": self.learn_tab, "Practice": self.practice_tab, "Quiz": self.quiz_tab}
         
-        # Create content for each tab
-        self._create_learn_tab()
-        self._create_practice_tab()
-        self._create_quiz_tab()
-        
-    def _create_learn_tab(self):
-        # Create a container frame
-        container = ctk.CTkFrame(self.learn_tab)
-        container.pack(fill="both", expand=True, padx=10, pady=10)
+        # Only the visible tab is built; the others on first activation
+        self._ensure_tab(self.tabview.get())
         
-        # Create a button to open content in browser
-        open_button = ctk.CTkButton(
-            container,
-            text="Open Content in Browser",
-            command=lambda: self._open_content_in_browser("learn")
-        )
-        open_button.pack(pady=10)
-        
-        # Create HTML content with MathJax
-        html_content = r"""
-        <!DOCTYPE html>
-        <html>
-        <head>
-            <script type="text/javascript" async
-                src="https://cdnjs.cloudflare.com/ajax/libs/mathjax/2.7.7/MathJax.js?config=TeX-MML-AM_CHTML">
-            </script>
-            <style>
-                body {
-                    background-color: #2b2b2b;
-                    color: #ffffff;
-                    font-family: Arial, sans-serif;
-                    padding: 20px;
-                }
-                .content {
-                    max-width: 800px;
-                    margin: 0 auto;
-                }
-                h1 { color: #58cc02; }
-                .equation { margin: 20px 0; }
-            </style>
-        </head>
-        <body>
-            <div class="content">
-                <h1>Quadratic Equations</h1>
-                
-                <p>The standard form of a quadratic equation is:</p>
-                <div class="equation">\[ax^2 + bx + c = 0\] where \(a \neq 0\)</div>
-                
-                <p>The quadratic formula for finding roots is:</p>
-                <div class="equation">\[x = \frac{-b \pm \sqrt{b^2 - 4ac}}{2a}\]</div>
-                
-                <h2>Properties:</h2>
-                <ul>
-                    <li>If \(b^2 - 4ac > 0\), there are two distinct real roots</li>
-                    <li>If \(b^2 - 4ac = 0\), there is one repeated real root</li>
-                    <li>If \(b^2 - 4ac < 0\), there are two complex conjugate roots</li>
-                </ul>
-                
-                <h2>Example:</h2>
-                <p>Solve: \(x^2 - 5x + 6 = 0\)</p>
-                <p>Using the quadratic formula with \(a=1\), \(b=-5\), and \(c=6\):</p>
-                <div class="equation">\[x = \frac{5 \pm \sqrt{25 - 24}}{2} = \frac{5 \pm 1}{2}\]</div>
-                <p>Therefore, \(x = 3\) or \(x = 2\)</p>
-            </div>
-        </body>
-        </html>
-        """
-        
-        # Create temporary file for HTML content
-        with tempfile.NamedTemporaryFile(mode='w', suffix='.html', delete=False) as f:
-            f.write(html_content)
-            self.temp_files.append(f.name)
-        
-        # Create a preview textbox
-        preview = ctk.CTkTextbox(container, wrap="word")
-        preview.pack(fill="both", expand=True, padx=10, pady=10)
-        preview.insert("1.0", "Click the button above to view the full content with properly rendered equations.")
-        preview.configure(state="disabled")
+    def _on_tab_changed(self):
+        self._ensure_tab(self.tabview.get())
         
-    def _create_practice_tab(self):
-        # Create a container frame
-        container = ctk.CTkFrame(self.practice_tab)
-        container.pack(fill="both", expand=True, padx=10, pady=10)
-        
-        # Create a button to open content in browser
-        open_button = ctk.CTkButton(
-            container,
-            text="Open Content in Browser",
-            command=lambda: self._open_content_in_browser("practice")
-        )
-        open_button.pack(pady=10)
-        
-        # Create HTML content with MathJax
-        html_content = r"""
-        <!DOCTYPE html>
-        <html>
-        <head>
-            <script type="text/javascript" async
-                src="https://cdnjs.cloudflare.com/ajax/libs/mathjax/2.7.7/MathJax.js?config=TeX-MML-AM_CHTML">
-            </script>
-            <style>
-                body {
-                    background-color: #2b2b2b;
-                    color: #ffffff;
-                    font-family: Arial, sans-serif;
-                    padding: 20px;
-                }
-                .content {
-                    max-width: 800px;
-                    margin: 0 auto;
-                }
-                h1 { color: #58cc02; }
-                .equation { margin: 20px 0; }
-                .options {
-                    margin: 20px 0;
-                    padding: 20px;
-                    background-color: #3b3b3b;
-                    border-radius: 10px;
-                }
-            </style>
-        </head>
-        <body>
-            <div class="content">
-                <h1>Practice Problems</h1>
-                
-                <p>Solve the quadratic equation:</p>
-                <div class="equation">\[2x^2 - 7x + 3 = 0\]</div>
-                
-                <div class="options">
-                    <h3>Choose the correct answer:</h3>
-                    <ol>
-                        <li>\[x = \frac{7 \pm \sqrt{49 - 24}}{4}\]</li>
-                        <li>\[x = \frac{7 \pm \sqrt{49 - 12}}{4}\]</li>
-                        <li>\[x = \frac{7 \pm \sqrt{49 - 48}}{4}\]</li>
-                    </ol>
-                </div>
-            </div>
-        </body>
-        </html>
-        """
-        
-        # Create temporary file for HTML content
-        with tempfile.NamedTemporaryFile(mode='w', suffix='.html', delete=False) as f:
-            f.write(html_content)
-            self.temp_files.append(f.name)
-        
-        # Create a preview textbox
-        preview = ctk.CTkTextbox(container, wrap="word")
-        preview.pack(fill="both", expand=True, padx=10, pady=10)
-        preview.insert("1.0", "Click the button above to view the full content with properly rendered equations.")
-        preview.configure(state="disabled")
+    def _ensure_tab(self, tab_label):
+        if tab_label in self.build_times:
+            return
+        start = time.perf_counter()
+        self._create_tab(self._tabs[tab_label], tab_label.lower())
+        self.build_times[tab_label] = (time.perf_counter() - start) * 1000
         
-    def _create_quiz_tab(self):
+    def _create_tab(self, tab, tab_name):
         # Create a container frame
-        container = ctk.CTkFrame(self.quiz_tab)
+        container = ctk.CTkFrame(tab)
         container.pack(fill="both", expand=True, padx=10, pady=10)
         
         # Create a button to open content in browser
         open_button = ctk.CTkButton(
             container,
             text="Open Content in Browser",
-            command=lambda: self._open_content_in_browser("quiz")
+            command=lambda: self._open_content_in_browser(tab_name)
         )
         open_button.pack(pady=10)
         
-        # Create HTML content with MathJax
-        html_content = r"""
-        <!DOCTYPE html>
-        <html>
-        <head>
-            <script type="text/javascript" async
-                src="https://cdnjs.cloudflare.com/ajax/libs/mathjax/2.7.7/MathJax.js?config=TeX-MML-AM_CHTML">
-            </script>
-            <style>
-                body {
-                    background-color: #2b2b2b;
-                    color: #ffffff;
-                    font-family: Arial, sans-serif;
-                    padding: 20px;
-                }
-                .content {
-                    max-width: 800px;
-                    margin: 0 auto;
-                }
-                h1 { color: #58cc02; }
-                .equation { margin: 20px 0; }
-                .options {
-                    margin: 20px 0;
-                    padding: 20px;
-                    background-color: #3b3b3b;
-                    border-radius: 10px;
-                }
-            </style>
-        </head>
-        <body>
-            <div class="content">
-                <h1>Quiz</h1>
-                
-                <h2>1. What is the discriminant of a quadratic equation?</h2>
-                
-                <div class="options">
-                    <h3>Select the correct formula:</h3>
-                    <ol>
-                        <li>\[b^2 - 4ac\]</li>
-                        <li>\[b^2 + 4ac\]</li>
-                        <li>\[-b \pm \sqrt{b^2 - 4ac}\]</li>
-                    </ol>
-                </div>
-            </div>
-        </body>
-        </html>
-        """
-        
-        # Create temporary file for HTML content
-        with tempfile.NamedTemporaryFile(mode='w', suffix='.html', delete=False) as f:
-            f.write(html_content)
-            self.temp_files.append(f.name)
+        # Build the page once; identical pages share one cached file
+        self.page_files[tab_name] = page_file(self.content, tab_name, self.topic)
         
         # Create a preview textbox
         preview = ctk.CTkTextbox(container, wrap="word")
@@ -895,14 +747,9 @@ class LessonContent(ctk.CTkFrame):
     
     def _open_content_in_browser(self, tab_name):
         import webbrowser
+        path = self.page_files[tab_name]
+        if not os.path.exists(path):
+            # Evicted from the size-capped page cache since the tab was built
+            path = self.page_files[tab_name] = page_file(self.content, tab_name, self.topic)
         # Open the corresponding HTML file in the default web browser
-        index = {"learn": 0, "practice": 1, "quiz": 2}[tab_name]
-        webbrowser.open(self.temp_files[index])
-    
-    def __del__(self):
-        # Clean up temporary files
-        for temp_file in self.temp_files:
-            try:
-                os.unlink(temp_file)
-            except:
-                pass 
\ No newline at end of file
+        webbrowser.open(path) 
\ No newline at end of file